@@ -17,7 +17,71 @@ def is_similar(a, b, threshold=0.85):
     return difflib.SequenceMatcher(None, a, b).ratio() >= threshold
 
 
-def group_components(items):
+def bigrams(text):
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+def length_ratio(la, lb):
+    # Upper bound on ratio() from lengths alone (same as real_quick_ratio)
+    return 2.0 * min(la, lb) / (la + lb) if la + lb else 1.0
+
+
+def shares_bigram_when_similar(la, lb, threshold):
+    # ratio() >= threshold means at most k = (1 - threshold) * (la + lb)
+    # insertions/deletions turn one string into the other; each destroys at
+    # most 2 bigrams, so max(la, lb) - 1 - 2k bigrams survive. If that is
+    # positive, a similar pair always shares a bigram and the index finds it.
+    k = int((1 - threshold) * (la + lb) + 1e-9)
+    return max(la, lb) - 1 - 2 * k >= 1
+
+
+class ClusterIndex:
+    # Finds the first cluster (in creation order) whose canonical is similar
+    # to a text, without comparing against every cluster: candidates must
+    # pass the length bound and share a bigram, then the cheap
+    # quick_ratio() bound, before the full ratio() is computed.
+
+    def __init__(self, threshold=0.85):
+        self.threshold = threshold
+        self.matchers = []  # One per cluster, canonical as seq2 (analysis cached)
+        self.by_bigram = {}  # bigram -> cluster ids, ascending
+        self.by_length = {}  # canonical length -> cluster ids, ascending
+
+    def add(self, canonical):
+        cluster_id = len(self.matchers)
+        self.matchers.append(difflib.SequenceMatcher(None, "", canonical))
+        for gram in bigrams(canonical):
+            self.by_bigram.setdefault(gram, []).append(cluster_id)
+        self.by_length.setdefault(len(canonical), []).append(cluster_id)
+        return cluster_id
+
+    def candidates(self, text):
+        la = len(text)
+        lengths = set()
+        candidates = set()
+        for lb, cluster_ids in self.by_length.items():
+            if length_ratio(la, lb) < self.threshold:
+                continue
+            if shares_bigram_when_similar(la, lb, self.threshold):
+                lengths.add(lb)
+            else:
+                candidates.update(cluster_ids)
+        for gram in bigrams(text):
+            for cluster_id in self.by_bigram.get(gram, ()):
+                if len(self.matchers[cluster_id].b) in lengths:
+                    candidates.add(cluster_id)
+        return sorted(candidates)
+
+    def find(self, text):
+        for cluster_id in self.candidates(text):
+            matcher = self.matchers[cluster_id]
+            matcher.set_seq1(text)
+            if matcher.quick_ratio() >= self.threshold and matcher.ratio() >= self.threshold:
+                return cluster_id
+        return None
+
+
+def group_components(items, threshold=0.85):
     # items is a list of {"text": "...", "source": "..."}
 
     # First count frequencies of exact matches
@@ -32,29 +96,26 @@ def group_components(items):
 
     clusters = []
     # List of dicts: {'canonical': str, 'variants': set(), 'sources': [], 'count': 0}
+    index = ClusterIndex(threshold)
+    cluster_of = {}  # variant -> cluster
 
     for text in unique_texts:
-        matched = False
-        for cluster in clusters:
-            # Check similarity against the canonical representative of the cluster
-            if is_similar(text, cluster["canonical"]):
-                cluster["variants"].add(text)
-                matched = True
-                break
-
-        if not matched:
+        # Check similarity against the canonical representative of each cluster
+        cluster_id = index.find(text)
+
+        if cluster_id is None:
+            cluster_id = index.add(text)
             clusters.append(
-                {"canonical": text, "variants": {text}, "sources": [], "count": 0}
+                {"canonical": text, "variants": set(), "sources": [], "count": 0}
             )
+        clusters[cluster_id]["variants"].add(text)
+        cluster_of[text] = clusters[cluster_id]
 
     # Now populate sources and counts based on the clusters we built
     for item in items:
-        text = normalize(item["text"])
-        for cluster in clusters:
-            if text in cluster["variants"]:
-                cluster["sources"].append(item["source"])
-                cluster["count"] += 1
-                break
+        cluster = cluster_of[normalize(item["text"])]
+        cluster["sources"].append(item["source"])
+        cluster["count"] += 1
 
     # Format output
     result = []
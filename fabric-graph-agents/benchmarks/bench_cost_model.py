@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmark: replay recorded graph runs through the planner's cost model.
+
+Runs are replayed in order. Each run's wall time is predicted from the
+history of the runs before it only (as the planner would have seen it), then
+the run's own node timings are added to the history. Prediction error is
+compared with the old fixed estimate (15 s per node, halved for parallel
+strategies).
+
+Recorded runs are graph_executor.py output directories (graph.json plus
+logs/timings.json). Without run directories, --synthetic N generates runs
+from a made-up latency profile (per-pattern latency, input-size cost and
+noise) and replays those; the "oracle" row there predicts from the true
+profile and shows the error floor the noise leaves.
+
+Usage:
+    python benchmarks/bench_cost_model.py output/run-*/
+    python benchmarks/bench_cost_model.py --synthetic 200
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib" / "utils"))
+
+from cost_model import CostModel, estimate_tokens, predict_graph  # noqa: E402
+from graph_planner import build_execution_graph  # noqa: E402
+
+PATTERN_PROFILE_SEED = 7
+
+
+def fixed_estimate(plan):
+    """The planner's previous estimate."""
+    estimate = len(plan.get("graph", plan)["nodes"]) * 15
+    if plan.get("strategy") in ("parallel_diverge_merge", "conditional_branching"):
+        estimate //= 2
+    return estimate
+
+
+def load_runs(paths):
+    """(plan, timings) of recorded executor runs, in path order."""
+    runs = []
+    for path in sorted(Path(p) for p in paths):
+        graph_path, timings_path = path / "graph.json", path / "logs" / "timings.json"
+        if graph_path.is_file() and timings_path.is_file():
+            runs.append((json.loads(graph_path.read_text()), json.loads(timings_path.read_text())))
+    return runs
+
+
+def _profile(pattern):
+    """Made-up (latency, seconds per input token, output tokens) of a pattern."""
+    rng = random.Random(f"{PATTERN_PROFILE_SEED}:{pattern}")
+    return rng.uniform(2, 20), rng.uniform(0.5, 4) / 1000, rng.randint(200, 1500)
+
+
+class _SimulatedFabric:
+    """Latency profile standing in for real pattern calls (duck-types CostModel)."""
+
+    def __init__(self, rng=None):
+        self.rng = rng  # None: expected values, no noise
+        self.calls = []
+
+    def _noise(self, sigma):
+        return self.rng.lognormvariate(0, sigma) if self.rng else 1.0
+
+    def node_seconds(self, pattern, model, input_tokens):
+        latency, per_token, _ = _profile(pattern)
+        seconds = (latency + per_token * input_tokens) * self._noise(0.2)
+        self.calls.append([pattern, seconds, input_tokens])
+        return seconds
+
+    def output_tokens(self, pattern, model):
+        tokens = round(_profile(pattern)[2] * self._noise(0.3))
+        self.calls[-1].append(tokens)
+        return tokens
+
+    def has_history(self, pattern, model=None):
+        return True
+
+
+def synthetic_runs(count, seed=1):
+    """Generate (plan, timings) pairs by simulating plans against a latency profile."""
+    rng = random.Random(seed)
+    goals = ["threat analysis", "secure my router", "research exploits", "validate config", "learn vlans"]
+    runs = []
+    for _ in range(count):
+        dim_type = rng.choice(["technical", "cognitive", "affective"])
+        dimensions = [
+            {"id": f"dim-{i}", "filename": f"d{i}.md",
+             "type": dim_type if rng.random() < 0.8 else rng.choice(["technical", "cognitive"]),
+             "content": "x" * rng.randint(400, 40000)}
+            for i in range(1, rng.randint(1, 7) + 1)
+        ]
+        plan = build_execution_graph(dimensions, rng.choice(goals), jobs=4)
+        fabric = _SimulatedFabric(rng)
+        dimension_tokens = {d["id"]: estimate_tokens(len(d["content"])) for d in dimensions}
+        actual = predict_graph(plan, fabric, dimension_tokens, jobs=4)
+        timings = {
+            "wall_seconds": actual["wall_seconds"],
+            # Noise-free prediction from the true profile: the best any model can do
+            "oracle_seconds": predict_graph(plan, _SimulatedFabric(), dimension_tokens, jobs=4)["wall_seconds"],
+            "jobs": 4,
+            "dimension_chars": {d["id"]: len(d["content"]) for d in dimensions},
+            "nodes": {
+                f"sim-{i}": {"pattern": pattern, "model": None, "status": "ok", "seconds": seconds,
+                             "input_chars": tokens_in * 4, "output_chars": tokens_out * 4}
+                for i, (pattern, seconds, tokens_in, tokens_out) in enumerate(fabric.calls)
+            }
+        }
+        runs.append((plan, timings))
+    return runs
+
+
+def replay(runs):
+    history = CostModel()
+    rows = []
+    for plan, timings in runs:
+        dimension_tokens = {k: estimate_tokens(v) for k, v in timings.get("dimension_chars", {}).items()}
+        model = next((t.get("model") for t in timings["nodes"].values()), None)
+        predicted = predict_graph(plan, history, dimension_tokens, model, timings.get("jobs", 4))
+        rows.append((timings["wall_seconds"], predicted["wall_seconds"], fixed_estimate(plan), predicted["measured"],
+                     timings.get("oracle_seconds")))
+
+        for t in timings["nodes"].values():
+            if t.get("status") == "ok":
+                history.record(t["pattern"], t.get("model"), t["seconds"],
+                               estimate_tokens(t["input_chars"]), estimate_tokens(t["output_chars"]))
+    return rows
+
+
+def report(label, rows):
+    if not rows:
+        print(f"{label}: no runs")
+        return
+    actual = [r[0] for r in rows]
+    columns = [("cost model", 1), ("fixed 15s", 2)]
+    if all(r[4] is not None for r in rows):
+        columns.append(("oracle", 4))
+    for name, column in columns:
+        errors = [abs(r[column] - r[0]) for r in rows]
+        pct = [abs(r[column] - r[0]) / r[0] * 100 for r in rows if r[0] > 0]
+        print(f"  {name:10}  MAE {statistics.mean(errors):7.1f} s   "
+              f"median error {statistics.median(pct):5.1f}%   (mean actual {statistics.mean(actual):.1f} s)")
+    print(f"  {label}: {len(rows)} runs")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("runs", nargs="*", help="graph_executor.py output directories")
+    parser.add_argument("--synthetic", type=int, default=0, help="Replay N generated runs instead")
+    parser.add_argument("--warmup", type=int, default=10,
+                        help="Leading runs excluded from the error summary (history still empty)")
+    args = parser.parse_args()
+
+    runs = synthetic_runs(args.synthetic) if args.synthetic else load_runs(args.runs)
+    if not runs:
+        parser.error("no recorded runs found (pass executor output directories or --synthetic N)")
+
+    rows = replay(runs)
+    print("All runs:")
+    report("all", rows)
+    print(f"After {args.warmup} warm-up runs, fully measured plans only:")
+    report("measured", [r for r in rows[args.warmup:] if r[3]])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: diagram size and render time of graph_to_mermaid.py on large graphs.
+
+Generates diverge/merge graphs (wide parallel groups separated by merge
+nodes) with and without input_dimensions links, renders them as Mermaid and
+DOT, and compares the edge count with the previous renderer's, which
+connected every node of an execution group to every node of the next.
+
+Usage:
+    python benchmarks/bench_graph_render.py
+    python benchmarks/bench_graph_render.py --width 2000 --max-group 12
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
+
+from graph_to_mermaid import DEFAULT_MAX_GROUP, iter_graphviz, iter_mermaid  # noqa: E402
+
+
+def make_graph(width, stages, links=True, wide_merges=False):
+    """Alternating parallel groups of `width` nodes and merge groups (1 node, or `width` with wide_merges)."""
+    nodes, order, previous = [], [], ["dim-1"]
+    for stage in range(stages):
+        size = width if stage % 2 == 0 or wide_merges else 1
+        group = list(range(len(nodes) + 1, len(nodes) + size + 1))
+        for n in group:
+            node = {"id": f"node-{n}", "pattern": f"pattern_{n % 7}", "description": f"step {stage}"}
+            if links:
+                node["input_dimensions"] = previous
+            nodes.append(node)
+        order.append(group)
+        previous = [f"node-{n}" for n in group]
+    return {"strategy": "synthetic", "graph": {"nodes": nodes, "execution_order": order}}
+
+
+def render(lines, graph, max_group):
+    start = time.perf_counter()
+    size = edges = 0
+    for line in lines(graph, max_group):
+        size += len(line) + 1
+        edges += "-->" in line or " -> " in line
+    return edges, size, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--width", type=int, action="append", help="Parallel group width (repeatable)")
+    parser.add_argument("--stages", type=int, default=6)
+    parser.add_argument("--max-group", type=int, default=DEFAULT_MAX_GROUP)
+    args = parser.parse_args()
+
+    for width in args.width or [10, 100, 1000]:
+        for links, wide_merges in ((True, False), (False, False), (False, True)):
+            graph = make_graph(width, args.stages, links, wide_merges)
+            order = graph["graph"]["execution_order"]
+            previous_edges = sum(len(a) * len(b) for a, b in zip(order, order[1:]))
+            kind = "links" if links else ("order, wide x wide" if wide_merges else "order only")
+            print(f"width {width:5}  {kind:18}  {len(graph['graph']['nodes']):6} nodes  "
+                  f"previous renderer {previous_edges:9} edges")
+            for name, lines in (("mermaid", iter_mermaid), ("dot", iter_graphviz)):
+                for max_group in (args.max_group, len(graph["graph"]["nodes"])):
+                    edges, size, seconds = render(lines, graph, max_group)
+                    label = "collapsed" if max_group == args.max_group else "expanded"
+                    print(f"    {name:7} {label:9}  {edges:7} edges  {size / 1024:8.1f} KB  {seconds * 1e3:7.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
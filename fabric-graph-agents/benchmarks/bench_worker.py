@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-call latency of the utilities, fresh process vs worker.
+
+Compares three ways an agent can ask semantic.py / graph_planner.py a
+question:
+
+    process  - python3 semantic.py <command> <text> per call (the old way)
+    stdio    - one `semantic.py serve` process, JSON lines over stdin/stdout
+    socket   - one `semantic.py serve --socket` process, one connection per call
+
+and reports median and p95 latency per call for a small and a large input.
+Every call gets a distinct text, so the worker's memoized analysis never
+answers from cache. Inputs too large for argv (the large one, on Linux)
+are piped on stdin in process mode.
+
+Usage:
+    python benchmarks/bench_worker.py
+    python benchmarks/bench_worker.py --calls 50
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SEMANTIC = ROOT / "lib" / "utils" / "semantic.py"
+
+SMALL = "How do I configure WPA3 and SSH on my OpenWRT router at 192.168.1.1?"
+LARGE = "\n".join(
+    f"config interface 'lan{i}'\n\toption proto 'static'\n\toption ipaddr '10.0.{i % 256}.1'\n"
+    f"\t# `uci set firewall.@zone[{i}].input=ACCEPT` on the tp-link switch via ssh"
+    for i in range(2000)
+)
+
+CALLS = [("entities", "text"), ("type", "text"), ("structure", "text")]
+
+
+def summarize(label, samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"  {label:8} median {statistics.median(samples) * 1000:8.2f} ms   p95 {p95 * 1000:8.2f} ms")
+
+
+def bench_process(text, calls):
+    use_argv = len(text) < 100_000  # Linux limits a single argument to 128 KB
+    samples = []
+    for i in range(calls):
+        command = CALLS[i % len(CALLS)][0]
+        call_text = f"{text} {i}"
+        start = time.perf_counter()
+        if use_argv:
+            subprocess.run([sys.executable, str(SEMANTIC), command, call_text], capture_output=True, check=True)
+        else:
+            subprocess.run([sys.executable, str(SEMANTIC), command], input=call_text.encode(),
+                           capture_output=True, check=True)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_stdio(text, calls):
+    proc = subprocess.Popen(
+        [sys.executable, str(SEMANTIC), "serve"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+    )
+    samples = []
+    try:
+        for i in range(calls):
+            command, param = CALLS[i % len(CALLS)]
+            start = time.perf_counter()
+            proc.stdin.write(json.dumps({"id": i, "command": command, param: f"{text} {i}"}) + "\n")
+            proc.stdin.flush()
+            response = json.loads(proc.stdout.readline())
+            samples.append(time.perf_counter() - start)
+            assert response["ok"], response
+    finally:
+        proc.stdin.close()
+        proc.wait()
+    return samples
+
+
+def bench_socket(text, calls):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "worker.sock")
+        proc = subprocess.Popen([sys.executable, str(SEMANTIC), "serve", "--socket", path])
+        try:
+            while not os.path.exists(path):
+                time.sleep(0.01)
+            samples = []
+            for i in range(calls):
+                command, param = CALLS[i % len(CALLS)]
+                start = time.perf_counter()
+                with socket.socket(socket.AF_UNIX) as conn:
+                    conn.connect(path)
+                    conn.sendall((json.dumps({"id": i, "command": command, param: f"{text} {i}"}) + "\n").encode())
+                    response = json.loads(conn.makefile().readline())
+                samples.append(time.perf_counter() - start)
+                assert response["ok"], response
+        finally:
+            proc.terminate()
+            proc.wait()
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=30, help="Calls per mode and input")
+    args = parser.parse_args()
+
+    for label, text in (("small input", SMALL), (f"large input ({len(LARGE) // 1024} KB)", LARGE)):
+        print(f"{label}, {args.calls} calls:")
+        summarize("process", bench_process(text, args.calls))
+        summarize("stdio", bench_stdio(text, args.calls))
+        summarize("socket", bench_socket(text, args.calls))
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,6 +23,16 @@ fabric_call() {
     fi
 }
 
+# Function to call a pattern through the output cache: stdin -> stdout, the
+# stored output is reused when pattern, model and input are unchanged
+# (see utils/output_store.py; FABRIC_CACHE_EXPLAIN=1 reports hits on stderr,
+# FABRIC_CACHE_LOG=<file> appends them to a file)
+fabric_cached() {
+    local pattern="$1"
+    shift
+    python3 "$(dirname "${BASH_SOURCE[0]}")/utils/output_store.py" run "$pattern" "$@"
+}
+
 # If called directly (not sourced), execute
 if [ "${BASH_SOURCE[0]}" = "${0}" ]; then
     fabric_call "$@"
@@ -8,6 +8,8 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$SCRIPT_DIR/dimensional.sh"
 
 # Execute complete pattern graph
+# Nodes run concurrently as soon as their inputs are ready (GRAPH_JOBS
+# pattern calls at a time, default 4); see utils/graph_executor.py
 execute_graph() {
     local graph_json="$1"
     local input_dir="$2"
@@ -15,45 +17,8 @@ execute_graph() {
     
     mkdir -p "$output_dir/temp" "$output_dir/logs"
     
-    local start_time=$(date +%s)
-    
-    # Log graph execution start
-    echo "[$(date +%H:%M:%S)] Starting graph execution" | tee -a "$output_dir/logs/graph.log"
-    echo "$graph_json" | jq '.' > "$output_dir/graph.json" 2>/dev/null || \
-        echo "$graph_json" > "$output_dir/graph.json"
-    
-    # Get execution order
-    local group_num=0
-    echo "$graph_json" | jq -c '.graph.execution_order[]' 2>/dev/null | while read -r group; do
-        group_num=$((group_num + 1))
-        
-        echo "[$(date +%H:%M:%S)] Executing parallel group $group_num" | tee -a "$output_dir/logs/graph.log"
-        
-        # Execute nodes in parallel
-        local pids=()
-        echo "$group" | jq -r '.[]' 2>/dev/null | while read -r node_id; do
-            execute_node "$graph_json" "$node_id" "$input_dir" "$output_dir" &
-            pids+=($!)
-        done
-        
-        # Wait for parallel group to complete
-        for pid in "${pids[@]}"; do
-            wait "$pid" 2>/dev/null || true
-        done
-        
-        echo "[$(date +%H:%M:%S)] Group $group_num complete" | tee -a "$output_dir/logs/graph.log"
-    done
-    
-    local end_time=$(date +%s)
-    local duration=$((end_time - start_time))
-    
-    echo "[$(date +%H:%M:%S)] Graph execution complete in ${duration}s" | tee -a "$output_dir/logs/graph.log"
-    
-    # Find final output (last node)
-    local final_node=$(echo "$graph_json" | jq -r '.graph.execution_order[-1][-1]' 2>/dev/null || echo "")
-    if [ -n "$final_node" ] && [ -f "$output_dir/temp/${final_node}.md" ]; then
-        cp "$output_dir/temp/${final_node}.md" "$output_dir/final.md"
-    fi
+    echo "$graph_json" | python3 "$SCRIPT_DIR/utils/graph_executor.py" - "$input_dir" "$output_dir" \
+        --jobs "${GRAPH_JOBS:-4}" > "$output_dir/logs/timings-summary.json"
 }
 
 # Execute single node
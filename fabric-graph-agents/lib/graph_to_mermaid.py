@@ -2,167 +2,303 @@
 """
 Convert execution graph JSON to Mermaid diagram format.
 Mermaid can be rendered in GitHub, VSCode, and many other tools.
+
+Edges follow the nodes' actual inputs (input_dimensions), so the edge count
+is linear in the graph size. Parallel execution groups are drawn as subgraph
+clusters; groups larger than max_group nodes are collapsed into a single
+summary node. Diagrams are generated line by line (iter_mermaid /
+iter_graphviz) and streamed by the CLI.
 """
 
 import json
 import sys
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Parallel groups with more nodes than this are drawn as one summary node
+DEFAULT_MAX_GROUP = 12
+
+INPUT_ID = 'input'
+
+
+def _load(graph_json) -> Dict:
+    """Parse graph JSON (str) or pass a dict through; raises ValueError."""
+    graph = json.loads(graph_json) if isinstance(graph_json, str) else graph_json
+    if not isinstance(graph, dict):
+        raise ValueError('graph must be a JSON object')
+    return graph
+
+
+def _node_id(n) -> str:
+    """execution_order entry (1 or 'node-1') -> node ID."""
+    return f"node-{n}" if isinstance(n, int) else str(n)
+
+
+class _Layout:
+    """
+    Rendered structure of a graph: groups, collapsed groups and edges.
+
+    Args:
+        graph: Planner output (with 'graph') or its 'graph' object
+        max_group: Largest parallel group drawn node by node
+    """
+
+    def __init__(self, graph: Dict, max_group: int = DEFAULT_MAX_GROUP):
+        self.strategy = graph.get('strategy', 'unknown')
+        inner = graph.get('graph', graph)
+        self.nodes: Dict[str, Dict] = {node['id']: node for node in inner.get('nodes', [])}
+
+        # Groups as listed in execution_order, then any node it leaves out
+        self.groups: List[List[str]] = []
+        placed = set()
+        for group in inner.get('execution_order', []):
+            ids = [i for i in map(_node_id, group) if i in self.nodes and i not in placed]
+            placed.update(ids)
+            if ids:
+                self.groups.append(ids)
+        self.groups.extend([node_id] for node_id in self.nodes if node_id not in placed)
+
+        # Node ID -> rendered ID (itself, or its collapsed group)
+        self.rendered: Dict[str, str] = {}
+        self.collapsed = set()
+        for index, group in enumerate(self.groups):
+            if len(group) > max(1, max_group):
+                self.collapsed.add(index)
+            for node_id in group:
+                self.rendered[node_id] = f"group-{index + 1}" if index in self.collapsed else node_id
+
+        self.has_dependencies = any(
+            i in self.nodes for node in self.nodes.values() for i in node.get('input_dimensions', [])
+        )
+        self.has_input = any(
+            i not in self.nodes for node in self.nodes.values() for i in node.get('input_dimensions', [])
+        )
+
+    def summary(self, index: int) -> Tuple[str, str]:
+        """(title, pattern breakdown) of a collapsed group."""
+        group = self.groups[index]
+        counts = Counter(self.nodes[n].get('pattern', '') for n in group)
+        breakdown = ', '.join(f"{count}× {pattern}" for pattern, count in counts.most_common(3))
+        if len(counts) > 3:
+            breakdown += f", +{len(counts) - 3} more"
+        return f"{len(group)} parallel nodes ({group[0]} … {group[-1]})", breakdown
+
+    def edges(self) -> Iterator[Tuple[str, str]]:
+        """
+        Distinct (source, target) pairs between rendered IDs.
+
+        Without input_dimensions links between nodes (older graphs), groups
+        are chained in execution order through a junction point, so a wide
+        group followed by another wide group costs len(a) + len(b) edges
+        instead of len(a) × len(b).
+        """
+        seen = set()
+
+        def pairs() -> Iterator[Tuple[str, str]]:
+            nodes, rendered = self.nodes, self.rendered
+            for node_id, node in nodes.items():
+                inputs = node.get('input_dimensions', [])
+                if any(i not in nodes for i in inputs):
+                    yield INPUT_ID, rendered[node_id]
+                if self.has_dependencies:
+                    for dep in inputs:
+                        if dep in nodes:
+                            yield rendered[dep], rendered[node_id]
+
+            if self.has_dependencies:
+                return
+            for index in range(1, len(self.groups)):
+                sources = list(dict.fromkeys(rendered[n] for n in self.groups[index - 1]))
+                targets = list(dict.fromkeys(rendered[n] for n in self.groups[index]))
+                if len(sources) > 1 and len(targets) > 1:
+                    junction = f"join-{index}"
+                    yield from ((source, junction) for source in sources)
+                    yield from ((junction, target) for target in targets)
+                else:
+                    yield from ((source, target) for source in sources for target in targets)
+
+        for pair in pairs():
+            if pair[0] != pair[1] and pair not in seen:
+                seen.add(pair)
+                yield pair
+
+
+def _mermaid_text(text: str) -> str:
+    return str(text).replace('"', '#quot;')
+
+
+def iter_mermaid(graph: Dict, max_group: int = DEFAULT_MAX_GROUP) -> Iterator[str]:
+    """
+    Mermaid flowchart lines of a graph.
+
+    Args:
+        graph: Parsed graph JSON
+        max_group: Largest parallel group drawn node by node
+
+    Yields:
+        Diagram lines (without newlines)
+    """
+    layout = _Layout(graph, max_group)
+
+    yield "```mermaid"
+    yield "graph TD"
+    yield f"    title[\"Strategy: {_mermaid_text(layout.strategy)}\"]"
+    yield "    style title fill:#f9f,stroke:#333,stroke-width:2px"
+    yield "    classDef parallel fill:#bfb,stroke:#333,stroke-width:2px"
+    yield "    classDef junction fill:#333,stroke:#333"
+    if layout.has_input:
+        yield "    input[Input Dimensions]"
+        yield "    style input fill:#bbf,stroke:#333,stroke-width:2px"
+    yield ""
+
+    # Nodes, parallel groups as clusters
+    for index, group in enumerate(layout.groups):
+        if index in layout.collapsed:
+            title, breakdown = layout.summary(index)
+            yield f"    group-{index + 1}[[\"{_mermaid_text(title)}<br/>{_mermaid_text(breakdown)}\"]]"
+            yield f"    class group-{index + 1} parallel"
+            continue
+        indent = "    "
+        if len(group) > 1:
+            yield f"    subgraph cluster-{index + 1}[\"Parallel group {index + 1}\"]"
+            indent = "        "
+        for node_id in group:
+            node = layout.nodes[node_id]
+            label = f"{node.get('pattern', '')}<br/>{node.get('description', '')}"
+            yield f"{indent}{node_id}[\"{_mermaid_text(label)}\"]"
+        if len(group) > 1:
+            yield "    end"
+            yield f"    class {','.join(group)} parallel"
+
+    yield ""
+
+    junctions = set()
+    for source, target in layout.edges():
+        if target.startswith('join-') and target not in junctions:
+            junctions.add(target)
+            yield f"    {target}(( ))"
+            yield f"    class {target} junction"
+        yield f"    {source} --> {target}"
+
+    yield "```"
+
+
+def _dot_id(node_id: str) -> str:
+    return node_id.replace('-', '_')
+
+
+def _dot_text(text: str) -> str:
+    return str(text).replace('\\', '\\\\').replace('"', '\\"')
+
+
+def iter_graphviz(graph: Dict, max_group: int = DEFAULT_MAX_GROUP) -> Iterator[str]:
+    """
+    Graphviz DOT lines of a graph.
+
+    Args:
+        graph: Parsed graph JSON
+        max_group: Largest parallel group drawn node by node
+
+    Yields:
+        DOT lines (without newlines)
+    """
+    layout = _Layout(graph, max_group)
+
+    yield "digraph ExecutionGraph {"
+    yield "    rankdir=TB;"
+    yield "    node [shape=box, style=rounded];"
+    yield ""
+    yield f'    label="Strategy: {_dot_text(layout.strategy)}";'
+    yield '    labelloc="t";'
+    yield ""
+    if layout.has_input:
+        yield '    input [label="Input Dimensions", style="rounded,filled", fillcolor="#bbbbff"];'
 
+    for index, group in enumerate(layout.groups):
+        if index in layout.collapsed:
+            title, breakdown = layout.summary(index)
+            yield (f'    group_{index + 1} [label="{_dot_text(title)}\\n{_dot_text(breakdown)}", '
+                   f'shape=box3d, style=filled, fillcolor="#bbffbb"];')
+            continue
+        indent = "    "
+        if len(group) > 1:
+            yield f"    subgraph cluster_{index + 1} {{"
+            yield f'        label="Parallel group {index + 1}";'
+            yield '        style="rounded,filled"; fillcolor="#eeffee";'
+            indent = "        "
+        for node_id in group:
+            node = layout.nodes[node_id]
+            label = f"{_dot_text(node.get('pattern', ''))}\\n{_dot_text(node.get('description', ''))}"
+            yield f'{indent}{_dot_id(node_id)} [label="{label}"];'
+        if len(group) > 1:
+            yield "    }"
+
+    yield ""
+
+    junctions = set()
+    for source, target in layout.edges():
+        if target.startswith('join-') and target not in junctions:
+            junctions.add(target)
+            yield f"    {_dot_id(target)} [shape=point, label=\"\"];"
+        yield f"    {_dot_id(source)} -> {_dot_id(target)};"
 
-def graph_to_mermaid(graph_json):
+    yield "}"
+
+
+def graph_to_mermaid(graph_json, max_group: int = DEFAULT_MAX_GROUP) -> str:
     """Convert graph JSON to Mermaid flowchart."""
-    
     try:
-        graph = json.loads(graph_json) if isinstance(graph_json, str) else graph_json
-    except json.JSONDecodeError as e:
+        graph = _load(graph_json)
+    except ValueError as e:
         return f"Error parsing JSON: {e}"
-    
-    mermaid = ["```mermaid", "graph TD"]
-    
-    # Add title
-    strategy = graph.get('strategy', 'unknown')
-    mermaid.append(f"    title[Strategy: {strategy}]")
-    mermaid.append("    style title fill:#f9f,stroke:#333,stroke-width:2px")
-    mermaid.append("")
-    
-    # Add nodes
-    nodes = graph.get('graph', {}).get('nodes', [])
-    for node in nodes:
-        node_id = node['id']
-        pattern = node['pattern']
-        desc = node.get('description', '')
-        
-        # Create node with pattern name
-        mermaid.append(f"    {node_id}[\"{pattern}<br/>{desc}\"]")
-    
-    mermaid.append("")
-    
-    # Add connections based on execution order
-    execution_order = graph.get('graph', {}).get('execution_order', [])
-    
-    # Track previous group for connections
-    prev_group = []
-    
-    for group_idx, group in enumerate(execution_order):
-        current_group = [f"node-{n}" for n in group]
-        
-        if prev_group:
-            # Connect previous group to current group
-            for prev_node in prev_group:
-                for curr_node in current_group:
-                    mermaid.append(f"    {prev_node} --> {curr_node}")
-        
-        prev_group = current_group
-    
-    # Add input dimensions if available
-    if nodes:
-        first_node = nodes[0]
-        input_dims = first_node.get('input_dimensions', [])
-        if input_dims and not any('node-' in d for d in input_dims):
-            mermaid.insert(3, "    input[Input Dimensions]")
-            mermaid.insert(4, "    style input fill:#bbf,stroke:#333,stroke-width:2px")
-            mermaid.insert(5, f"    input --> {first_node['id']}")
-            mermaid.insert(6, "")
-    
-    # Add styling for parallel groups
-    for group_idx, group in enumerate(execution_order):
-        if len(group) > 1:
-            # Highlight parallel nodes
-            for node_num in group:
-                node_id = f"node-{node_num}"
-                mermaid.append(f"    style {node_id} fill:#bfb,stroke:#333,stroke-width:2px")
-    
-    mermaid.append("```")
-    
-    return "\n".join(mermaid)
+    return "\n".join(iter_mermaid(graph, max_group))
 
 
-def graph_to_graphviz(graph_json):
+def graph_to_graphviz(graph_json, max_group: int = DEFAULT_MAX_GROUP) -> str:
     """Convert graph JSON to Graphviz DOT format."""
-    
     try:
-        graph = json.loads(graph_json) if isinstance(graph_json, str) else graph_json
-    except json.JSONDecodeError as e:
+        graph = _load(graph_json)
+    except ValueError as e:
         return f"Error parsing JSON: {e}"
-    
-    dot = ["digraph ExecutionGraph {"]
-    dot.append("    rankdir=TB;")
-    dot.append("    node [shape=box, style=rounded];")
-    dot.append("")
-    
-    # Add title
-    strategy = graph.get('strategy', 'unknown')
-    dot.append(f'    label="Strategy: {strategy}";')
-    dot.append('    labelloc="t";')
-    dot.append("")
-    
-    # Add nodes
-    nodes = graph.get('graph', {}).get('nodes', [])
-    for node in nodes:
-        node_id = node['id'].replace('-', '_')
-        pattern = node['pattern']
-        desc = node.get('description', '')
-        
-        label = f"{pattern}\\n{desc}"
-        dot.append(f'    {node_id} [label="{label}"];')
-    
-    dot.append("")
-    
-    # Add connections
-    execution_order = graph.get('graph', {}).get('execution_order', [])
-    prev_group = []
-    
-    for group in execution_order:
-        current_group = [f"node_{n}" for n in group]
-        
-        if prev_group:
-            for prev_node in prev_group:
-                for curr_node in current_group:
-                    dot.append(f"    {prev_node} -> {curr_node};")
-        
-        prev_group = current_group
-    
-    # Highlight parallel groups
-    for group_idx, group in enumerate(execution_order):
-        if len(group) > 1:
-            dot.append(f"    {{ rank=same; {' '.join([f'node_{n}' for n in group])} }}")
-    
-    dot.append("}")
-    
-    return "\n".join(dot)
-
-
-def main():
-    """CLI interface."""
-    if len(sys.argv) < 2:
-        print("Usage: graph_to_mermaid.py <graph.json> [format]")
-        print("")
-        print("Formats:")
-        print("  mermaid  - Mermaid diagram (default)")
-        print("  dot      - Graphviz DOT format")
-        print("")
-        print("Examples:")
-        print("  graph_to_mermaid.py output/run-*/graph.json")
-        print("  graph_to_mermaid.py graph.json dot > graph.dot")
-        sys.exit(1)
-    
-    graph_file = sys.argv[1]
-    format_type = sys.argv[2] if len(sys.argv) > 2 else "mermaid"
-    
+    return "\n".join(iter_graphviz(graph, max_group))
+
+
+def main(argv: Optional[List[str]] = None):
+    """CLI: graph_to_mermaid.py <graph.json|-> [mermaid|dot] [--max-group N]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Render an execution graph as a Mermaid or Graphviz diagram',
+        epilog='Examples:\n'
+               '  graph_to_mermaid.py output/run-*/graph.json\n'
+               '  graph_to_mermaid.py graph.json dot > graph.dot',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('graph_file', help="Graph JSON file ('-' for stdin)")
+    parser.add_argument('format', nargs='?', default='mermaid', choices=['mermaid', 'dot'],
+                        help='mermaid (default) or dot (Graphviz)')
+    parser.add_argument('--max-group', type=int, default=DEFAULT_MAX_GROUP,
+                        help=f'Collapse parallel groups larger than this (default: {DEFAULT_MAX_GROUP})')
+    args = parser.parse_args(argv)
+
     try:
-        with open(graph_file, 'r') as f:
-            graph_json = f.read()
+        if args.graph_file == '-':
+            graph = _load(sys.stdin.read())
+        else:
+            with open(args.graph_file, 'r') as f:
+                graph = _load(f.read())
     except FileNotFoundError:
-        print(f"Error: File not found: {graph_file}")
+        print(f"Error: File not found: {args.graph_file}")
         sys.exit(1)
-    
-    if format_type == "mermaid":
-        print(graph_to_mermaid(graph_json))
-    elif format_type == "dot":
-        print(graph_to_graphviz(graph_json))
-    else:
-        print(f"Unknown format: {format_type}")
+    except ValueError as e:
+        print(f"Error parsing JSON: {e}")
         sys.exit(1)
 
+    lines = iter_mermaid if args.format == 'mermaid' else iter_graphviz
+    out = sys.stdout
+    for line in lines(graph, args.max_group):
+        out.write(line + "\n")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,91 @@
+#!/bin/bash
+# Persistent semantic.py / graph_planner.py worker for shell agents
+#
+# Starts one Python process (semantic.py serve) as a coprocess and sends it
+# JSON-lines requests, instead of paying interpreter startup per call and
+# passing large texts on argv.
+#
+#   source "$LIB_DIR/semantic-worker.sh"
+#   semantic_worker_start
+#   semantic_call entities "$text"          # -> {"hardware": [...], ...}
+#   semantic_call type "$text"              # -> {"type": "technical"}
+#   semantic_request '{"command": "similarity", "text1": "...", "text2": "..."}'
+#   semantic_worker_stop
+#
+# Responses are {"id": ..., "ok": true, "result": ...}. semantic_call sends
+# "raw": true, so the reply is "ok<TAB><result JSON>" or "error<TAB><message>"
+# and the result is cut off by its fixed prefix; it prints only the result
+# and returns 1 on errors. If SEMANTIC_WORKER_SOCKET names the socket of a
+# running `semantic.py serve --socket PATH`, requests go there instead
+# (needs socat).
+
+SEMANTIC_WORKER_PY="${SEMANTIC_WORKER_PY:-$(dirname "${BASH_SOURCE[0]}")/utils/semantic.py}"
+
+# Escape a string for a JSON string literal (raw control characters are
+# accepted by the worker)
+_semantic_json_escape() {
+    local s="$1"
+    s=${s//\\/\\\\}
+    s=${s//\"/\\\"}
+    s=${s//$'\n'/\\n}
+    s=${s//$'\r'/\\r}
+    s=${s//$'\t'/\\t}
+    printf '%s' "$s"
+}
+
+semantic_worker_start() {
+    [ -n "$SEMANTIC_WORKER_PID" ] && return 0
+    [ -n "$SEMANTIC_WORKER_SOCKET" ] && return 0
+    coproc SEMANTIC_WORKER { python3 "$SEMANTIC_WORKER_PY" serve; }
+}
+
+semantic_worker_stop() {
+    if [ -n "$SEMANTIC_WORKER_PID" ]; then
+        exec {SEMANTIC_WORKER[1]}>&-
+        wait "$SEMANTIC_WORKER_PID" 2>/dev/null
+    fi
+}
+
+# Send one raw JSON request line, print the raw response line
+semantic_request() {
+    local response
+    if [ -n "$SEMANTIC_WORKER_SOCKET" ]; then
+        if ! command -v socat &> /dev/null; then
+            echo "Error: SEMANTIC_WORKER_SOCKET requires socat" >&2
+            return 1
+        fi
+        printf '%s\n' "$1" | socat - "UNIX-CONNECT:$SEMANTIC_WORKER_SOCKET"
+        return
+    fi
+
+    semantic_worker_start
+    printf '%s\n' "$1" >&"${SEMANTIC_WORKER[1]}"
+    IFS= read -r response <&"${SEMANTIC_WORKER[0]}" || {
+        echo "Error: semantic worker exited" >&2
+        return 1
+    }
+    printf '%s\n' "$response"
+}
+
+# semantic_call <command> <text>: run a single-text command, print its result
+semantic_call() {
+    local response
+    response=$(semantic_request "{\"command\": \"$1\", \"raw\": true, \"text\": \"$(_semantic_json_escape "$2")\"}") || return 1
+    case "$response" in
+        "ok"$'\t'*)
+            printf '%s\n' "${response#ok$'\t'}"
+            ;;
+        *)
+            echo "Error: ${response#error$'\t'}" >&2
+            return 1
+            ;;
+    esac
+}
+
+# If called directly (not sourced), run one request: semantic-worker.sh <command> <text>
+if [ "${BASH_SOURCE[0]}" = "${0}" ]; then
+    semantic_call "$@"
+    status=$?
+    semantic_worker_stop
+    exit $status
+fi
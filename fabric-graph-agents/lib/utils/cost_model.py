@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Measured cost model for fabric pattern calls.
+
+Every executed graph node adds a sample (seconds, input tokens, output tokens)
+to a persisted per-pattern/per-model history. A node's time is predicted with
+a least-squares fit of seconds against input tokens over the recent samples
+of its pattern and model (falling back to the pattern under any model, then
+to DEFAULT_NODE_SECONDS), and its output size with the mean output tokens.
+
+Graph wall time is predicted by replaying the executor's scheduling policy
+(ready nodes in execution_order priority, `jobs` at a time) over the predicted
+node times; with enough jobs this is the critical path.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_HISTORY_PATH = Path(
+    os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')
+) / 'fabric-graph-agents' / 'pattern-timings.json'
+
+HISTORY_VERSION = 1
+HISTORY_LIMIT = 50  # Most recent samples kept per pattern/model
+
+# Used for patterns without history (the planner's old fixed estimate)
+DEFAULT_NODE_SECONDS = 15.0
+DEFAULT_OUTPUT_TOKENS = 500
+DEFAULT_DIMENSION_TOKENS = 1000
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(chars: int) -> int:
+    """Rough token count of a text length (no tokenizer dependency)."""
+    return -(-chars // CHARS_PER_TOKEN) if chars > 0 else 0
+
+
+def _fit(samples: List[List[float]]) -> Tuple[float, float]:
+    """Least-squares (latency, seconds per input token) from [seconds, in, out] samples."""
+    n = len(samples)
+    mean_x = sum(s[1] for s in samples) / n
+    mean_y = sum(s[0] for s in samples) / n
+    var_x = sum((s[1] - mean_x) ** 2 for s in samples)
+    if var_x == 0:
+        return mean_y, 0.0
+    slope = sum((s[1] - mean_x) * (s[0] - mean_y) for s in samples) / var_x
+    if slope <= 0:
+        return mean_y, 0.0  # Noise, not a size effect
+    return mean_y - slope * mean_x, slope
+
+
+class CostModel:
+    """
+    Per-pattern/per-model latency history.
+
+    Args:
+        path: History file (None: in-memory only, no history)
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self.samples: Dict[str, List[List[float]]] = {}
+        self._dirty = False
+
+        if self.path:
+            try:
+                data = json.loads(self.path.read_text())
+                if data.get('version') == HISTORY_VERSION:
+                    self.samples = data.get('samples', {})
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def _key(pattern: str, model: Optional[str]) -> str:
+        return f"{pattern}|{model or ''}"
+
+    def record(self, pattern: str, model: Optional[str], seconds: float,
+               input_tokens: int, output_tokens: int) -> None:
+        """Add one measured pattern call."""
+        samples = self.samples.setdefault(self._key(pattern, model), [])
+        samples.append([round(seconds, 3), input_tokens, output_tokens])
+        del samples[:-HISTORY_LIMIT]
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the history atomically (only if something changed)."""
+        if not self.path or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps({'version': HISTORY_VERSION, 'samples': self.samples}))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def _history(self, pattern: str, model: Optional[str]) -> List[List[float]]:
+        exact = self.samples.get(self._key(pattern, model))
+        if exact:
+            return exact
+        prefix = f"{pattern}|"
+        return [s for key, samples in self.samples.items() if key.startswith(prefix) for s in samples]
+
+    def has_history(self, pattern: str, model: Optional[str] = None) -> bool:
+        return bool(self._history(pattern, model))
+
+    def node_seconds(self, pattern: str, model: Optional[str], input_tokens: int) -> float:
+        """
+        Predict the duration of one pattern call.
+
+        Args:
+            pattern: Pattern name
+            model: Model name (None: any)
+            input_tokens: Input size
+
+        Returns:
+            Predicted seconds
+        """
+        samples = self._history(pattern, model)
+        if not samples:
+            return DEFAULT_NODE_SECONDS
+        latency, per_token = _fit(samples)
+        return max(0.0, latency + per_token * input_tokens)
+
+    def output_tokens(self, pattern: str, model: Optional[str]) -> int:
+        """Predicted output size of a pattern call (mean of history)."""
+        samples = self._history(pattern, model)
+        if not samples:
+            return DEFAULT_OUTPUT_TOKENS
+        return round(sum(s[2] for s in samples) / len(samples))
+
+    def stats(self) -> Dict[str, Dict]:
+        """Summary per pattern/model: runs, mean seconds, latency and tokens per second."""
+        summary = {}
+        for key, samples in sorted(self.samples.items()):
+            latency, per_token = _fit(samples)
+            seconds = sum(s[0] for s in samples)
+            summary[key] = {
+                'runs': len(samples),
+                'mean_seconds': round(seconds / len(samples), 3),
+                'latency_seconds': round(latency, 3),
+                'input_tokens_per_second': round(1 / per_token, 1) if per_token else None,
+                'output_tokens_per_second': round(sum(s[2] for s in samples) / seconds, 1) if seconds else None
+            }
+        return summary
+
+
+def predict_graph(
+    graph: Dict,
+    cost_model: CostModel,
+    dimension_tokens: Optional[Dict[str, int]] = None,
+    model: Optional[str] = None,
+    jobs: int = 4
+) -> Dict:
+    """
+    Predict per-node times, critical path and wall time of a planned graph.
+
+    Args:
+        graph: Planner output or its 'graph' object
+        cost_model: Latency history
+        dimension_tokens: Dimension ID -> input tokens (default: DEFAULT_DIMENSION_TOKENS)
+        model: Model the graph will run with
+        jobs: Concurrent pattern calls
+
+    Returns:
+        Dict with 'wall_seconds', 'critical_path_seconds', 'measured' (every
+        pattern had history) and per-node 'nodes' seconds
+    """
+    graph = graph.get('graph', graph)
+    nodes = {node['id']: node for node in graph.get('nodes', [])}
+    dimension_tokens = dimension_tokens or {}
+
+    order = [f'node-{n}' if isinstance(n, int) else n for group in graph.get('execution_order', []) for n in group]
+    priority = {node_id: order.index(node_id) if node_id in order else len(order) for node_id in nodes}
+    deps = {node_id: [i for i in node.get('input_dimensions', []) if i in nodes] for node_id, node in nodes.items()}
+
+    seconds: Dict[str, float] = {}
+    out_tokens: Dict[str, int] = {}
+    finish: Dict[str, float] = {}
+
+    def predict(node_id: str) -> None:
+        if node_id in seconds:
+            return
+        node = nodes[node_id]
+        input_tokens = 0
+        for input_id in node.get('input_dimensions', []):
+            if input_id in nodes:
+                predict(input_id)
+                input_tokens += out_tokens[input_id]
+            else:
+                input_tokens += dimension_tokens.get(input_id, DEFAULT_DIMENSION_TOKENS)
+        pattern = node.get('pattern', '')
+        seconds[node_id] = cost_model.node_seconds(pattern, model, input_tokens)
+        out_tokens[node_id] = cost_model.output_tokens(pattern, model)
+        finish[node_id] = seconds[node_id] + max((finish[d] for d in deps[node_id]), default=0.0)
+
+    for node_id in nodes:
+        predict(node_id)
+
+    # List scheduling with the executor's policy
+    clock = 0.0
+    done_at: Dict[str, float] = {}
+    running: List[Tuple[float, str]] = []
+    waiting = set(nodes)
+    while waiting or running:
+        ready = sorted((n for n in waiting if all(d in done_at and done_at[d] <= clock for d in deps[n])),
+                       key=priority.get)
+        for node_id in ready[:max(1, jobs) - len(running)]:
+            waiting.discard(node_id)
+            running.append((clock + seconds[node_id], node_id))
+        if not running:
+            break  # Unsatisfiable dependencies
+        running.sort()
+        clock, node_id = running.pop(0)
+        done_at[node_id] = clock
+
+    return {
+        'wall_seconds': round(clock, 1),
+        'critical_path_seconds': round(max(finish.values(), default=0.0), 1),
+        'measured': all(cost_model.has_history(n.get('pattern', ''), model) for n in nodes.values()),
+        'nodes': {node_id: round(s, 1) for node_id, s in seconds.items()}
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    """CLI: cost_model.py [--history PATH] (prints per-pattern/model stats)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Inspect the measured pattern latency history')
+    parser.add_argument('--history', type=Path, default=DEFAULT_HISTORY_PATH,
+                        help=f'History file (default: {DEFAULT_HISTORY_PATH})')
+    args = parser.parse_args(argv)
+
+    print(json.dumps(CostModel(args.history).stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Parallel executor for graph_planner execution graphs.
+
+Runs the fabric pattern of every node in a bounded thread pool. A node starts
+as soon as all of its inputs are ready, so independent branches overlap and
+wall time approaches the critical path instead of the sum of the parallel
+groups. `execution_order` only sets priority among ready nodes.
+
+Node inputs are dimension IDs (loaded from <input_dir>/_metadata.json, like
+dimensional.sh get_dimension) or IDs of other nodes, whose output is piped in.
+Outputs, logs and the final result use the same layout as graph.sh:
+
+    <output_dir>/temp/<node-id>.md     node outputs
+    <output_dir>/final.md              output of the last node
+    <output_dir>/logs/graph.log        execution log
+    <output_dir>/logs/timings.json     measured per-node timings
+
+Successful node timings are also added to the cost model history (see
+cost_model.py), which the planner uses to predict later runs.
+
+Node outputs are kept in a content-addressed store (see output_store.py)
+keyed by pattern, model and exact input, so re-running a graph only calls
+fabric for nodes whose inputs changed; --explain lists which nodes were
+cache hits and why the others ran.
+"""
+
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from cost_model import DEFAULT_HISTORY_PATH, CostModel, estimate_tokens
+from output_store import DEFAULT_STORE_PATH, OutputStore, node_key
+
+DEFAULT_JOBS = 4
+
+# Separator between concatenated node inputs (as in graph.sh)
+INPUT_SEPARATOR = "\n\n---\n\n"
+
+
+def fabric_command(model: Optional[str] = None) -> List[str]:
+    """
+    Resolve the fabric command like fabric-wrapper.sh (fabric-ai, then fabric).
+
+    Args:
+        model: Model to pass with --model (default: $FABRIC_MODEL)
+
+    Returns:
+        Command prefix; the pattern arguments are appended per node
+    """
+    cmd = shutil.which('fabric-ai') or shutil.which('fabric')
+    if not cmd:
+        raise FileNotFoundError('fabric not found')
+    model = model or os.environ.get('FABRIC_MODEL')
+    return [cmd, '--model', model] if model else [cmd]
+
+
+def load_graph(data: Dict) -> Dict:
+    """
+    Extract and validate the graph from planner output.
+
+    Args:
+        data: build_execution_graph() output, or just its 'graph' object
+
+    Returns:
+        Graph dict with 'nodes' and 'execution_order'
+
+    Raises:
+        ValueError: On duplicate node IDs or dependency cycles
+    """
+    graph = data.get('graph', data)
+    nodes = graph.get('nodes', [])
+
+    ids = [node['id'] for node in nodes]
+    if len(set(ids)) != len(ids):
+        raise ValueError('duplicate node IDs in graph')
+
+    # Kahn's algorithm, only to reject cycles before anything runs
+    deps = {node['id']: set(node_dependencies(node, ids)) for node in nodes}
+    remaining = dict(deps)
+    while remaining:
+        ready = [node_id for node_id, d in remaining.items() if not d & remaining.keys()]
+        if not ready:
+            raise ValueError(f'dependency cycle between nodes: {", ".join(sorted(remaining))}')
+        for node_id in ready:
+            del remaining[node_id]
+
+    return graph
+
+
+def node_dependencies(node: Dict, node_ids) -> List[str]:
+    """Inputs of a node that are outputs of other nodes."""
+    return [i for i in node.get('input_dimensions', []) if i in node_ids]
+
+
+def load_dimensions(input_dir: Path) -> Dict[str, str]:
+    """
+    Map dimension IDs to their text, from <input_dir>/_metadata.json.
+
+    Args:
+        input_dir: Dimension directory
+
+    Returns:
+        Dimension ID -> content (missing files are left out)
+    """
+    metadata_path = Path(input_dir) / '_metadata.json'
+    try:
+        metadata = json.loads(metadata_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+    dimensions = {}
+    for dim in metadata.get('dimensions', []):
+        path = Path(input_dir) / dim.get('filename', '')
+        if dim.get('id') and path.is_file():
+            dimensions[dim['id']] = path.read_text(encoding='utf-8', errors='replace')
+    return dimensions
+
+
+class GraphExecutor:
+    """
+    Execute one planned graph.
+
+    Args:
+        graph: Planner output or graph dict
+        input_dir: Dimension directory
+        output_dir: Output directory (graph.sh layout)
+        jobs: Maximum concurrent pattern calls
+        run_pattern: Callable (pattern, input_text) -> output_text; raises on
+            failure. Defaults to piping the input through fabric -p.
+        model: Model for fabric (default: $FABRIC_MODEL)
+        cost_model: History to record measured node timings in
+        store: Output store to reuse and record node outputs (None: no caching)
+    """
+
+    def __init__(
+        self,
+        graph: Dict,
+        input_dir: Path,
+        output_dir: Path,
+        jobs: int = DEFAULT_JOBS,
+        run_pattern: Optional[Callable[[str, str], str]] = None,
+        model: Optional[str] = None,
+        cost_model: Optional[CostModel] = None,
+        store: Optional[OutputStore] = None
+    ):
+        self.plan = graph
+        self.graph = load_graph(graph)
+        self.nodes = {node['id']: node for node in self.graph.get('nodes', [])}
+        self.input_dir = Path(input_dir)
+        self.output_dir = Path(output_dir)
+        self.jobs = max(1, jobs)
+        self.model = model or os.environ.get('FABRIC_MODEL')
+        self.run_pattern = run_pattern or self._run_fabric
+        self.cost_model = cost_model
+        self.store = store
+
+        self.dimensions = load_dimensions(self.input_dir)
+        self.outputs: Dict[str, str] = {}
+        self.timings: Dict[str, Dict] = {}
+        self._log_lock = threading.Lock()
+        self._start = 0.0
+
+        # Priority among ready nodes: position in execution_order (the
+        # planner lists node numbers there), unlisted nodes last
+        order = [f'node-{n}' if isinstance(n, int) else n
+                 for group in self.graph.get('execution_order', []) for n in group]
+        self.priority = {node_id: order.index(node_id) if node_id in order else len(order)
+                         for node_id in self.nodes}
+
+    def _run_fabric(self, pattern: str, input_text: str) -> str:
+        proc = subprocess.run(
+            fabric_command(self.model) + ['-p', pattern],
+            input=input_text, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip() or f'fabric exited with {proc.returncode}')
+        return proc.stdout
+
+    def log(self, message: str) -> None:
+        line = f"[{time.strftime('%H:%M:%S')}] {message}"
+        with self._log_lock:
+            print(line, file=sys.stderr)
+            with open(self.output_dir / 'logs' / 'graph.log', 'a') as f:
+                f.write(line + '\n')
+
+    def _node_input(self, node: Dict) -> str:
+        parts = []
+        for input_id in node.get('input_dimensions', []):
+            text = self.outputs.get(input_id) if input_id in self.nodes else self.dimensions.get(input_id)
+            if text:
+                parts.append(text + INPUT_SEPARATOR)
+        return ''.join(parts)
+
+    def _execute_node(self, node_id: str) -> None:
+        node = self.nodes[node_id]
+        pattern = node.get('pattern', '')
+        self.log(f"Executing {node_id}: {pattern} - {node.get('description', '')}")
+
+        input_text = self._node_input(node)
+        key = node_key(pattern, self.model, input_text)
+        started = time.monotonic()
+        status = 'ok'
+        cached = self.store.get(key) if self.store is not None and input_text else None
+        if cached is not None:
+            output, status = cached, 'cached'
+        elif not input_text:
+            self.log(f"Warning: No input for {node_id}")
+            output, status = "No input provided\n", 'no_input'
+        else:
+            try:
+                output = self.run_pattern(pattern, input_text)
+                if self.store is not None:
+                    self.store.put(key, output)
+            except Exception as e:
+                self.log(f"Error executing {node_id}: {e}")
+                output, status = f"Error executing pattern {pattern}\n", 'error'
+        finished = time.monotonic()
+
+        (self.output_dir / 'temp' / f'{node_id}.md').write_text(output)
+        self.outputs[node_id] = output
+        self.timings[node_id] = {
+            'pattern': pattern,
+            'model': self.model,
+            'status': status,
+            'cache_key': key,
+            'input_chars': len(input_text),
+            'output_chars': len(output),
+            'start_seconds': round(started - self._start, 3),
+            'seconds': round(finished - started, 3)
+        }
+        self.log(f"Node {node_id} {'cached' if status == 'cached' else 'complete'} in {finished - started:.1f}s")
+
+    def critical_path_seconds(self) -> float:
+        """Longest chain of measured node durations through the graph."""
+        finish: Dict[str, float] = {}
+
+        def longest(node_id: str) -> float:
+            if node_id not in finish:
+                deps = node_dependencies(self.nodes[node_id], self.nodes)
+                finish[node_id] = self.timings.get(node_id, {}).get('seconds', 0.0) + max(
+                    (longest(d) for d in deps), default=0.0
+                )
+            return finish[node_id]
+
+        return max((longest(node_id) for node_id in self.nodes), default=0.0)
+
+    def explain(self) -> List[str]:
+        """
+        One line per node: cache hit, or why it was executed.
+
+        A node that ran although its upstream nodes were all cache hits had
+        a new dimension input, pattern or model.
+        """
+        lines = []
+        for node_id in sorted(self.nodes, key=self.priority.get):
+            timing = self.timings.get(node_id)
+            if timing is None:
+                continue
+            if timing['status'] == 'cached':
+                reason = 'cache hit'
+            elif timing['status'] in ('error', 'no_input'):
+                reason = f"not cached ({timing['status'].replace('_', ' ')})"
+            elif self.store is None:
+                reason = 'executed (cache disabled)'
+            else:
+                rerun = [d for d in node_dependencies(self.nodes[node_id], self.nodes)
+                         if self.timings.get(d, {}).get('status') != 'cached']
+                reason = f"executed (upstream changed: {', '.join(rerun)})" if rerun else 'executed (new input)'
+            lines.append(f"{node_id:10} {timing['pattern']:32} {timing['cache_key'][:12]}  {reason}")
+        return lines
+
+    def run(self) -> Dict:
+        """
+        Execute the graph.
+
+        Returns:
+            Timing summary (also written to logs/timings.json)
+        """
+        (self.output_dir / 'temp').mkdir(parents=True, exist_ok=True)
+        (self.output_dir / 'logs').mkdir(parents=True, exist_ok=True)
+        (self.output_dir / 'graph.json').write_text(json.dumps(self.plan, indent=2))
+
+        self._start = time.monotonic()
+        self.log(f"Starting graph execution ({len(self.nodes)} nodes, {self.jobs} jobs)")
+
+        waiting = {node_id: set(node_dependencies(node, self.nodes)) for node_id, node in self.nodes.items()}
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while waiting or running:
+                ready = sorted((n for n, deps in waiting.items() if not deps), key=self.priority.get)
+                for node_id in ready[:self.jobs - len(running)]:
+                    del waiting[node_id]
+                    running[pool.submit(self._execute_node, node_id)] = node_id
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node_id = running.pop(future)
+                    future.result()
+                    for deps in waiting.values():
+                        deps.discard(node_id)
+
+        wall = time.monotonic() - self._start
+        self.log(f"Graph execution complete in {round(wall)}s")
+
+        order = sorted(self.nodes, key=self.priority.get)
+        if order and (self.output_dir / 'temp' / f'{order[-1]}.md').exists():
+            shutil.copyfile(self.output_dir / 'temp' / f'{order[-1]}.md', self.output_dir / 'final.md')
+
+        summary = {
+            'wall_seconds': round(wall, 3),
+            'critical_path_seconds': round(self.critical_path_seconds(), 3),
+            'serial_seconds': round(sum(t['seconds'] for t in self.timings.values()), 3),
+            'jobs': self.jobs,
+            'dimension_chars': {dim_id: len(text) for dim_id, text in self.dimensions.items()},
+            'nodes': {node_id: self.timings[node_id] for node_id in order}
+        }
+        (self.output_dir / 'logs' / 'timings.json').write_text(json.dumps(summary, indent=2))
+
+        if self.cost_model is not None:
+            for timing in self.timings.values():
+                if timing['status'] == 'ok':
+                    self.cost_model.record(timing['pattern'], self.model, timing['seconds'],
+                                           estimate_tokens(timing['input_chars']),
+                                           estimate_tokens(timing['output_chars']))
+            self.cost_model.save()
+        return summary
+
+
+def main(argv: Optional[List[str]] = None):
+    """CLI: graph_executor.py <graph_json|-> <input_dir> <output_dir> [--jobs N] [--model M]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Execute a graph_planner execution graph in parallel')
+    parser.add_argument('graph', help='Planner JSON file, or - for stdin')
+    parser.add_argument('input_dir', type=Path, help='Dimension directory (with _metadata.json)')
+    parser.add_argument('output_dir', type=Path, help='Output directory')
+    parser.add_argument('-j', '--jobs', type=int, default=DEFAULT_JOBS,
+                        help=f'Maximum concurrent pattern calls (default: {DEFAULT_JOBS})')
+    parser.add_argument('--model', help='Model for fabric (default: $FABRIC_MODEL)')
+    parser.add_argument('--history', type=Path, default=DEFAULT_HISTORY_PATH,
+                        help=f'Pattern timing history to update (default: {DEFAULT_HISTORY_PATH})')
+    parser.add_argument('--no-history', action='store_true', help='Do not record timings in the history')
+    parser.add_argument('--store', type=Path, default=DEFAULT_STORE_PATH,
+                        help=f'Node output store (default: {DEFAULT_STORE_PATH})')
+    parser.add_argument('--no-cache', action='store_true', help='Run every node, ignoring stored outputs')
+    parser.add_argument('--explain', action='store_true', help='List which nodes were cache hits and why others ran')
+    parser.add_argument('--fabric-cmd', help='Command run per node instead of fabric; gets the '
+                                             'pattern as last argument and the input on stdin')
+    args = parser.parse_args(argv)
+
+    graph = json.loads(sys.stdin.read() if args.graph == '-' else Path(args.graph).read_text())
+
+    run_pattern = None
+    if args.fabric_cmd:
+        def run_pattern(pattern: str, input_text: str) -> str:
+            proc = subprocess.run(shlex.split(args.fabric_cmd) + [pattern],
+                                  input=input_text, capture_output=True, text=True)
+            if proc.returncode != 0:
+                raise RuntimeError(proc.stderr.strip() or f'exited with {proc.returncode}')
+            return proc.stdout
+
+    try:
+        cost_model = None if args.no_history else CostModel(args.history)
+        store = None if args.no_cache else OutputStore(args.store)
+        executor = GraphExecutor(graph, args.input_dir, args.output_dir, args.jobs, run_pattern, args.model,
+                                 cost_model, store)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    summary = executor.run()
+    if args.explain:
+        print('\n'.join(executor.explain()), file=sys.stderr)
+    print(json.dumps({k: v for k, v in summary.items() if k != 'nodes'}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,11 @@ Determines optimal execution strategies based on dimensions.
 """
 
 import json
+import os
 import sys
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+from cost_model import DEFAULT_HISTORY_PATH, CostModel, estimate_tokens, predict_graph
 
 
 def classify_goal(goal: str) -> str:
@@ -127,27 +130,24 @@ def select_patterns(dimension: Dict, goal_type: str) -> List[str]:
     return patterns
 
 
-def build_execution_graph(dimensions: List[Dict], goal: str, depth: str = 'normal') -> Dict:
+def _build_nodes(strategy: str, dimensions: List[Dict], goal_type: str) -> Tuple[List[Dict], List[List[int]]]:
     """
-    Build complete execution graph.
+    Build the nodes and execution order of a strategy.
     
     Args:
+        strategy: Strategy name
         dimensions: List of dimension metadata
-        goal: Goal description
-        depth: Depth level
+        goal_type: Type of goal
         
     Returns:
-        Execution graph JSON
+        Tuple of (nodes, execution_order)
     """
-    goal_type = classify_goal(goal)
-    strategy = select_strategy(dimensions, goal_type, depth)
-    
     nodes = []
     execution_order = []
     node_id = 1
     
     if strategy == 'sequential_enrichment':
-        # Sequential chain
+        # Sequential chain (over all dimensions at once)
         patterns = select_patterns(dimensions[0], goal_type)
         prev_node = None
         
@@ -155,7 +155,7 @@ def build_execution_graph(dimensions: List[Dict], goal: str, depth: str = 'norma
             node = {
                 'id': f'node-{node_id}',
                 'pattern': pattern,
-                'input_dimensions': [dimensions[0]['id']] if prev_node is None else [prev_node],
+                'input_dimensions': [d['id'] for d in dimensions] if prev_node is None else [prev_node],
                 'parallel_group': node_id,
                 'description': f'Apply {pattern}'
             }
@@ -226,19 +226,84 @@ def build_execution_graph(dimensions: List[Dict], goal: str, depth: str = 'norma
         nodes.append(synthesis_node)
         execution_order.append([node_id])
     
-    # Estimate execution time
-    estimated_time = len(nodes) * 15  # 15 seconds per node average
-    if strategy in ['parallel_diverge_merge', 'conditional_branching']:
-        estimated_time = estimated_time // 2  # Parallel execution
+    return nodes, execution_order
+
+
+def _dimension_tokens(dimensions: List[Dict]) -> Dict[str, int]:
+    """Input size of each dimension, where the metadata carries its content."""
+    return {
+        d['id']: estimate_tokens(len(d['content']))
+        for d in dimensions if isinstance(d.get('content'), str)
+    }
+
+
+def build_execution_graph(
+    dimensions: List[Dict],
+    goal: str,
+    depth: str = 'normal',
+    cost_model: Optional[CostModel] = None,
+    model: Optional[str] = None,
+    jobs: int = 4
+) -> Dict:
+    """
+    Build complete execution graph.
+    
+    Time is predicted from measured pattern latencies (see cost_model.py).
+    When several same-type dimensions could either be processed in parallel
+    and merged or run through one sequential chain, and every pattern of
+    both plans has history, the plan with the lower predicted wall time is
+    chosen.
+    
+    Args:
+        dimensions: List of dimension metadata
+        goal: Goal description
+        depth: Depth level
+        cost_model: Measured latency history (default: none, fixed estimates)
+        model: Model the graph will run with
+        jobs: Concurrent pattern calls available to the executor
+        
+    Returns:
+        Execution graph JSON
+    """
+    goal_type = classify_goal(goal)
+    strategy = select_strategy(dimensions, goal_type, depth)
+    cost_model = cost_model or CostModel()
+    dimension_tokens = _dimension_tokens(dimensions)
+    
+    candidates = [strategy]
+    if strategy == 'parallel_diverge_merge':
+        candidates.append('sequential_enrichment')
+    
+    plans = {}
+    for candidate in candidates:
+        nodes, execution_order = _build_nodes(candidate, dimensions, goal_type)
+        graph = {'nodes': nodes, 'execution_order': execution_order}
+        plans[candidate] = (graph, predict_graph(graph, cost_model, dimension_tokens, model, jobs))
+    
+    reasoning = f'Selected {strategy} for {len(dimensions)} {goal_type} dimension(s)'
+    if all(prediction['measured'] for _, prediction in plans.values()):
+        fastest = min(candidates, key=lambda c: plans[c][1]['wall_seconds'])
+        if plans[fastest][1]['wall_seconds'] < plans[strategy][1]['wall_seconds']:
+            reasoning = (f'Selected {fastest} for {len(dimensions)} {goal_type} dimension(s): '
+                         f'predicted {plans[fastest][1]["wall_seconds"]}s vs '
+                         f'{plans[strategy][1]["wall_seconds"]}s for {strategy}')
+            strategy = fastest
+    
+    graph, prediction = plans[strategy]
+    nodes = graph['nodes']
     
     return {
         'strategy': strategy,
-        'reasoning': f'Selected {strategy} for {len(dimensions)} {goal_type} dimension(s)',
-        'graph': {
-            'nodes': nodes,
-            'execution_order': execution_order
+        'reasoning': reasoning,
+        'graph': graph,
+        'estimated_time_seconds': round(prediction['wall_seconds']),
+        'cost_estimate': {
+            'wall_seconds': prediction['wall_seconds'],
+            'critical_path_seconds': prediction['critical_path_seconds'],
+            'measured': prediction['measured'],
+            'jobs': jobs,
+            'candidates': {c: plans[c][1]['wall_seconds'] for c in candidates}
         },
-        'estimated_time_seconds': estimated_time,
         'quality_gates': [
             {
                 'after_node': nodes[-1]['id'],
@@ -249,6 +314,19 @@ def build_execution_graph(dimensions: List[Dict], goal: str, depth: str = 'norma
     }
 
 
+def plan_with_history(dimensions: List[Dict], goal: str, depth: str = 'normal') -> Dict:
+    """
+    Build the execution graph with the measured history, model and pool size
+    from the environment (GRAPH_HISTORY, FABRIC_MODEL, GRAPH_JOBS).
+    """
+    return build_execution_graph(
+        dimensions, goal, depth,
+        CostModel(os.environ.get('GRAPH_HISTORY', DEFAULT_HISTORY_PATH)),
+        model=os.environ.get('FABRIC_MODEL'),
+        jobs=int(os.environ.get('GRAPH_JOBS', 4))
+    )
+
+
 def main():
     """CLI interface for graph planning."""
     if len(sys.argv) < 2:
@@ -257,6 +335,8 @@ def main():
         print("  classify <goal>                    - Classify goal type")
         print("  strategy <dimensions_json> <goal>  - Select strategy")
         print("  plan <dimensions_json> <goal>      - Build execution graph")
+        print("\nplan uses measured pattern timings (GRAPH_HISTORY, default")
+        print(f"{DEFAULT_HISTORY_PATH}), FABRIC_MODEL and GRAPH_JOBS.")
         sys.exit(1)
     
     command = sys.argv[1]
@@ -282,7 +362,7 @@ def main():
         depth = sys.argv[4] if len(sys.argv) > 4 else 'normal'
         
         dimensions = json.loads(dimensions_json)
-        graph = build_execution_graph(dimensions, goal, depth)
+        graph = plan_with_history(dimensions, goal, depth)
         
         print(json.dumps(graph, indent=2))
     
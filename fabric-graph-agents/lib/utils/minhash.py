@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+MinHash + LSH near-duplicate detection for fabric graph agents.
+
+Files are read and signed one at a time (only the current file's text and
+words are in memory) with one-permutation MinHash: every word shingle is
+hashed once into one of NUM_PERM bins, keeping the minimum per bin, and
+empty bins are filled from their right neighbour (rotation densification).
+Signing is O(shingles), not O(shingles x permutations).
+
+Near-duplicates are found with LSH banding: signatures are cut into bands,
+documents sharing any band bucket become candidates, and candidates are
+confirmed by their estimated Jaccard similarity. Total work is roughly
+linear in the number of documents.
+
+Signatures can be cached on disk keyed by path, mtime and size, so repeated
+runs only hash new or changed files. One cache serves any number of corpora:
+entries are dropped when their file is gone, when unused for
+CACHE_MAX_AGE_DAYS, or (least recently used first) beyond CACHE_MAX_ENTRIES.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+NUM_PERM = 128
+SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.8
+
+# Hash key, so signatures from different versions/settings never mix
+HASH_KEY = b'fabric-minhash-v1'
+_HASH_BITS = 64
+_EMPTY = -1
+
+DEFAULT_CACHE_PATH = Path(
+    os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')
+) / 'fabric-graph-agents' / 'minhash-signatures.json'
+
+# Signature cache pruning: unused entries expire, and the cache is capped
+CACHE_MAX_AGE_DAYS = 90
+CACHE_MAX_ENTRIES = 50000
+
+_TOKEN = re.compile(r'\w+')
+
+
+def iter_shingles(text: str, size: int = SHINGLE_SIZE) -> Iterable[str]:
+    """
+    Yield word shingles (overlapping word n-grams) of a text.
+
+    Args:
+        text: Input text
+        size: Words per shingle
+
+    Returns:
+        Iterator of shingles; a text shorter than size yields itself once
+    """
+    words = _TOKEN.findall(text.lower())
+    if len(words) < size:
+        if words:
+            yield ' '.join(words)
+        return
+    for i in range(len(words) - size + 1):
+        yield ' '.join(words[i:i + size])
+
+
+def signature(text: str, num_perm: int = NUM_PERM, shingle_size: int = SHINGLE_SIZE) -> Optional[List[int]]:
+    """
+    Compute the one-permutation MinHash signature of a text.
+
+    Args:
+        text: Input text
+        num_perm: Signature length (bins)
+        shingle_size: Words per shingle
+
+    Returns:
+        List of num_perm ints, or None for a text without words
+    """
+    bins = [_EMPTY] * num_perm
+    for shingle in iter_shingles(text, shingle_size):
+        h = int.from_bytes(
+            hashlib.blake2b(shingle.encode('utf-8'), digest_size=8, key=HASH_KEY).digest(),
+            'big'
+        )
+        b, value = h % num_perm, h // num_perm
+        if bins[b] == _EMPTY or value < bins[b]:
+            bins[b] = value
+
+    filled = [i for i, v in enumerate(bins) if v != _EMPTY]
+    if not filled:
+        return None
+
+    # Rotation densification: an empty bin borrows the value of the next
+    # filled bin to its right, offset by the distance so borrowed values
+    # can't collide with real ones
+    offset = (1 << _HASH_BITS) // num_perm + 1
+    for i in range(num_perm):
+        if bins[i] == _EMPTY:
+            distance = 1
+            while bins[(i + distance) % num_perm] == _EMPTY:
+                distance += 1
+            bins[i] = bins[(i + distance) % num_perm] + distance * offset
+    return bins
+
+
+def estimate_jaccard(sig1: List[int], sig2: List[int]) -> float:
+    """
+    Estimate Jaccard similarity of two documents from their signatures.
+
+    Args:
+        sig1: First signature
+        sig2: Second signature
+
+    Returns:
+        Fraction of matching signature positions (0-1)
+    """
+    return sum(1 for a, b in zip(sig1, sig2) if a == b) / len(sig1)
+
+
+def choose_bands(threshold: float, num_perm: int = NUM_PERM) -> Tuple[int, int]:
+    """
+    Pick LSH bands x rows for a similarity threshold.
+
+    The S-curve 1 - (1 - s^rows)^bands is steepest around
+    (1/bands)^(1/rows); the divisor pair of num_perm whose midpoint is
+    closest to the threshold is used.
+
+    Args:
+        threshold: Jaccard similarity threshold (0-1)
+        num_perm: Signature length
+
+    Returns:
+        Tuple of (bands, rows)
+    """
+    options = [(num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+    return min(options, key=lambda br: abs((1 / br[0]) ** (1 / br[1]) - threshold))
+
+
+def find_near_duplicates(
+    signatures: Dict[str, List[int]],
+    threshold: float = DEFAULT_THRESHOLD
+) -> List[List[str]]:
+    """
+    Group documents whose estimated Jaccard similarity reaches threshold.
+
+    Args:
+        signatures: Document ID -> signature (documents without one are skipped)
+        threshold: Jaccard similarity threshold (0-1)
+
+    Returns:
+        Groups of document IDs (size >= 2), each sorted, largest first
+    """
+    ids = [doc_id for doc_id, sig in signatures.items() if sig]
+    if not ids:
+        return []
+
+    num_perm = len(signatures[ids[0]])
+    bands, rows = choose_bands(threshold, num_perm)
+
+    parent = list(range(len(ids)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for band in range(bands):
+        start = band * rows
+        buckets: Dict[tuple, List[int]] = defaultdict(list)
+        for i, doc_id in enumerate(ids):
+            buckets[tuple(signatures[doc_id][start:start + rows])].append(i)
+
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    a, b = find(members[x]), find(members[y])
+                    if a == b:
+                        continue  # Already grouped: skip the comparison
+                    if estimate_jaccard(signatures[ids[members[x]]], signatures[ids[members[y]]]) >= threshold:
+                        parent[b] = a
+
+    groups: Dict[int, List[str]] = defaultdict(list)
+    for i, doc_id in enumerate(ids):
+        groups[find(i)].append(doc_id)
+
+    result = [sorted(group) for group in groups.values() if len(group) > 1]
+    result.sort(key=lambda group: (-len(group), group[0]))
+    return result
+
+
+class SignatureCache:
+    """
+    On-disk cache of file signatures keyed by path, mtime and size.
+
+    Entries for other signature settings (length, shingle size, hash key)
+    are ignored, so changing settings just rehashes. Each entry records when
+    it was last used (day resolution, so plain hits rarely rewrite the file).
+    Saving drops entries of deleted files, entries unused for max_age_days,
+    and the least recently used ones beyond max_entries.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        num_perm: int = NUM_PERM,
+        shingle_size: int = SHINGLE_SIZE,
+        max_age_days: float = CACHE_MAX_AGE_DAYS,
+        max_entries: int = CACHE_MAX_ENTRIES
+    ):
+        self.path = Path(path)
+        self.settings = f"{HASH_KEY.decode()}:{num_perm}:{shingle_size}"
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.pruned = 0
+        self.max_age = max_age_days * 86400
+        self.max_entries = max_entries
+        self._now = int(time.time())
+        self._seen = set()
+        self._dirty = False
+
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get('settings') == self.settings:
+                self.entries = data.get('files', {})
+        except (OSError, ValueError):
+            pass
+
+    def get(self, file_path: Path) -> Tuple[bool, Optional[List[int]]]:
+        """Return (hit, signature) for a file, using the cached entry if unchanged."""
+        stat = file_path.stat()
+        self._seen.add(str(file_path))
+        entry = self.entries.get(str(file_path))
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            self.hits += 1
+            if self._now - entry.get('used', 0) >= 86400:
+                entry['used'] = self._now
+                self._dirty = True
+            return True, entry['signature']
+        return False, None
+
+    def put(self, file_path: Path, sig: Optional[List[int]]) -> None:
+        stat = file_path.stat()
+        self._seen.add(str(file_path))
+        self.entries[str(file_path)] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'signature': sig,
+            'used': self._now
+        }
+        self.misses += 1
+        self._dirty = True
+
+    def save(self) -> None:
+        """Prune, then write the cache atomically (only if something changed)."""
+        # Files of other corpora are kept unless deleted or expired; entries
+        # without a 'used' stamp (older caches) count as used now
+        stale = [
+            key for key, entry in self.entries.items()
+            if key not in self._seen and (
+                self._now - entry.get('used', self._now) > self.max_age
+                or not os.path.exists(key)
+            )
+        ]
+        for key in stale:
+            del self.entries[key]
+
+        excess = len(self.entries) - self.max_entries
+        if excess > 0:
+            by_use = sorted(self.entries, key=lambda key: self.entries[key].get('used', self._now))
+            for key in by_use[:excess]:
+                del self.entries[key]
+            stale.extend(by_use[:excess])
+
+        self.pruned += len(stale)
+        if not (self._dirty or stale):
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps({'settings': self.settings, 'files': self.entries}))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def sign_files(
+    paths: Iterable[Path],
+    cache: Optional[SignatureCache] = None,
+    num_perm: int = NUM_PERM,
+    shingle_size: int = SHINGLE_SIZE
+) -> Dict[str, Optional[List[int]]]:
+    """
+    Sign files one at a time, reusing cached signatures of unchanged files.
+
+    Args:
+        paths: Files to sign
+        cache: Optional signature cache
+        num_perm: Signature length
+        shingle_size: Words per shingle
+
+    Returns:
+        Path string -> signature (None for files without words)
+    """
+    signatures = {}
+    for path in paths:
+        path = Path(path).resolve()
+        if cache is not None:
+            hit, sig = cache.get(path)
+            if hit:
+                signatures[str(path)] = sig
+                continue
+
+        text = path.read_text(encoding='utf-8', errors='replace')
+        sig = signature(text, num_perm, shingle_size)
+        signatures[str(path)] = sig
+        if cache is not None:
+            cache.put(path, sig)
+
+    if cache is not None:
+        cache.save()
+    return signatures
+
+
+def expand_paths(args: Iterable[str], extensions: Tuple[str, ...] = ('.md', '.txt')) -> List[Path]:
+    """
+    Expand CLI arguments to files: directories are walked for text files.
+
+    Args:
+        args: File or directory paths
+        extensions: File suffixes to collect from directories
+
+    Returns:
+        Sorted list of file paths
+    """
+    files = []
+    for arg in args:
+        path = Path(arg)
+        if path.is_dir():
+            files.extend(p for p in path.rglob('*') if p.is_file() and p.suffix in extensions)
+        else:
+            files.append(path)
+    return sorted(files)
+
+
+def main(argv: Optional[List[str]] = None):
+    """CLI: minhash.py <file-or-dir>... [--threshold T] [--cache PATH | --no-cache]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Find near-duplicate documents with MinHash/LSH')
+    parser.add_argument('paths', nargs='*', help='Files or directories (default: JSON list of texts on stdin)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Jaccard similarity threshold 0-1 (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--cache', type=Path, default=DEFAULT_CACHE_PATH,
+                        help=f'Signature cache file (default: {DEFAULT_CACHE_PATH})')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the signature cache')
+    args = parser.parse_args(argv)
+
+    if args.paths:
+        cache = None if args.no_cache else SignatureCache(args.cache)
+        signatures = sign_files(expand_paths(args.paths), cache)
+        cache_info = {'hits': cache.hits, 'hashed': cache.misses, 'pruned': cache.pruned} if cache else None
+    else:
+        texts = json.load(sys.stdin)
+        signatures = {str(i): signature(text) for i, text in enumerate(texts)}
+        cache_info = None
+
+    groups = find_near_duplicates(signatures, args.threshold)
+    result = {
+        'documents': len(signatures),
+        'threshold': args.threshold,
+        'groups': groups
+    }
+    if cache_info:
+        result['cache'] = cache_info
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store of pattern outputs.
+
+A pattern call is a deterministic function of (pattern, model, input), so
+its output is stored under the SHA-256 of exactly that. Graph nodes feed on
+their upstream outputs, so a node is only re-run when its pattern, model or
+some input actually changed (Make-style); an upstream node that re-runs but
+produces the same text still lets its dependents hit the cache.
+
+    <store>/<key[:2]>/<key>     output text
+
+Failed calls are never stored. Clear the store (or pass --no-cache) after
+changing fabric's default model, which is not part of the key unless
+--model / FABRIC_MODEL names it.
+
+Shell workflows use the `run` command (see fabric_cached in
+lib/fabric-wrapper.sh); graph_executor.py uses the store directly.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+DEFAULT_STORE_PATH = Path(
+    os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')
+) / 'fabric-graph-agents' / 'node-outputs'
+
+# Bump to invalidate every stored output
+STORE_VERSION = 1
+
+
+def node_key(pattern: str, model: Optional[str], input_text: str) -> str:
+    """
+    Content address of a pattern call.
+
+    Args:
+        pattern: Pattern name
+        model: Model name (None: fabric's default)
+        input_text: Exact input piped to the pattern
+
+    Returns:
+        Hex SHA-256 key
+    """
+    header = json.dumps([STORE_VERSION, pattern, model or '']).encode('utf-8')
+    digest = hashlib.sha256(header + b'\0')
+    digest.update(input_text.encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+class OutputStore:
+    """
+    Directory of stored outputs, one file per key.
+
+    Args:
+        path: Store directory (created on first write)
+    """
+
+    def __init__(self, path: Path = DEFAULT_STORE_PATH):
+        self.path = Path(path)
+
+    def _object(self, key: str) -> Path:
+        return self.path / key[:2] / key
+
+    def get(self, key: str) -> Optional[str]:
+        """Stored output for a key, or None."""
+        try:
+            return self._object(key).read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+    def put(self, key: str, output: str) -> None:
+        """Store an output atomically (concurrent writers of one key are harmless)."""
+        target = self._object(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f'{key}.{os.getpid()}.tmp')
+        tmp_path.write_text(output, encoding='utf-8')
+        os.replace(tmp_path, target)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def main(argv: Optional[List[str]] = None):
+    """CLI: output_store.py run <pattern> [--model M] [--explain] | clear"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Content-addressed cache of fabric pattern outputs')
+    parser.add_argument('--store', type=Path, default=DEFAULT_STORE_PATH,
+                        help=f'Store directory (default: {DEFAULT_STORE_PATH})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='Run a pattern on stdin, reusing the stored output for the same input')
+    run.add_argument('pattern')
+    run.add_argument('--model', help='Model for fabric (default: $FABRIC_MODEL)')
+    run.add_argument('--explain', action='store_true', help='Report cache hit or miss on stderr')
+    run.add_argument('--log', type=Path, default=os.environ.get('FABRIC_CACHE_LOG'),
+                     help='Also append the hit/miss report to this file (default: $FABRIC_CACHE_LOG)')
+    run.add_argument('--no-cache', action='store_true', help='Always run the pattern (still stores the output)')
+
+    commands.add_parser('clear', help='Delete every stored output')
+    args = parser.parse_args(argv)
+
+    store = OutputStore(args.store)
+    if args.command == 'clear':
+        store.clear()
+        return
+
+    from graph_executor import fabric_command
+
+    try:
+        command = fabric_command(args.model)
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(127)
+
+    model = args.model or os.environ.get('FABRIC_MODEL')
+    explain = args.explain or os.environ.get('FABRIC_CACHE_EXPLAIN') == '1'
+    input_text = sys.stdin.read()
+    key = node_key(args.pattern, model, input_text)
+
+    def report(result: str) -> None:
+        line = f"{result:10}  {args.pattern:32} {key[:12]}"
+        if explain:
+            print(line, file=sys.stderr)
+        if args.log:
+            with open(args.log, 'a') as f:
+                f.write(line + '\n')
+
+    output = None if args.no_cache else store.get(key)
+    if output is not None:
+        report('cache hit')
+        sys.stdout.write(output)
+        return
+
+    proc = subprocess.run(command + ['--pattern', args.pattern],
+                          input=input_text, stdout=subprocess.PIPE, text=True)
+    report('executed' if proc.returncode == 0 else 'failed')
+    sys.stdout.write(proc.stdout)
+    if proc.returncode != 0:
+        sys.exit(proc.returncode)
+    store.put(key, proc.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,37 @@ Semantic analysis utilities for fabric graph agents.
 Provides text analysis, similarity scoring, and semantic clustering.
 """
 
+import hashlib
 import json
+import math
 import re
 import sys
 from typing import Dict, List, Set, Tuple
-from collections import Counter
+from collections import Counter, OrderedDict, defaultdict
+
+# Common stop words excluded from keywords
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
+    'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
+})
+
+_WORD = re.compile(r'\b[a-z]{3,}\b')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase content words (3+ letters, no stop words).
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        List of words in order
+    """
+    return [w for w in _WORD.findall(text.lower()) if w not in _STOP_WORDS]
 
 
 def extract_keywords(text: str, top_n: int = 10) -> List[str]:
@@ -22,21 +48,8 @@ def extract_keywords(text: str, top_n: int = 10) -> List[str]:
     Returns:
         List of top keywords
     """
-    # Remove common stop words
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-        'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-        'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
-        'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
-    }
-    
-    # Tokenize and clean
-    words = re.findall(r'\b[a-z]{3,}\b', text.lower())
-    words = [w for w in words if w not in stop_words]
-    
     # Count frequencies
-    counter = Counter(words)
+    counter = Counter(tokenize(text))
     
     return [word for word, _ in counter.most_common(top_n)]
 
@@ -68,6 +81,158 @@ def calculate_similarity(text1: str, text2: str) -> float:
     return round(similarity, 2)
 
 
+# Term patterns per semantic type (each counted once per match)
+_TYPE_PATTERNS = {
+    'technical': [
+        r'configure|install|setup|command|script|code|api|protocol',
+        r'wpa[23]|ssh|firewall|vlan|802\.11|ip|port',
+        r'uci|opkg|iptables|wireless|network',
+    ],
+    'affective': [
+        r'worried|concerned|anxious|frustrated|confused|uncertain',
+        r'hope|wish|want|need|fear|worry',
+        r'difficult|hard|easy|simple|complex|complicated',
+        r'feel|think|believe|wonder|question',
+    ],
+    'cognitive': [
+        r'understand|learn|know|figure out|determine|decide',
+        r'why|how|what|when|where|which',
+        r'problem|solution|approach|strategy|method',
+        r'consider|evaluate|analyze|assess|review',
+    ],
+}
+
+# Term patterns per entity type (matched case-insensitively)
+_ENTITY_PATTERNS = {
+    'hardware': [
+        r'atheros|ar\d+|broadcom|bcm\d+|qualcomm|qca\d+',
+        r'ubiquiti|tp-link|netgear|asus|linksys',
+        r'router|ap|access point|switch|modem',
+    ],
+    'software': [
+        r'openwrt|dd-wrt|tomato|lede',
+        r'dropbear|openssh|dnsmasq|hostapd',
+        r'suricata|zeek|snort',
+    ],
+    'protocols': [
+        r'wpa[23]?|wep|802\.11[a-z]*',
+        r'ssh|http|https|ftp|telnet|smtp',
+        r'tcp|udp|icmp|arp',
+    ],
+}
+
+
+def _compile_term_scanner() -> 're.Pattern':
+    """
+    Compile every term of every pattern into one alternation.
+    
+    The text is scanned once and each match is then classified against the
+    individual patterns. Terms never overlap across patterns (a shorter term
+    can't end at a word boundary inside a longer one), so one scan finds
+    exactly what one findall per pattern would. Alternatives are grouped by
+    first character behind a lookahead, so most positions are rejected with
+    a single character-class test.
+    """
+    by_first: Dict[str, List[str]] = defaultdict(list)
+    for table in (_ENTITY_PATTERNS, _TYPE_PATTERNS):
+        for pattern in (p for patterns in table.values() for p in patterns):
+            for alternative in pattern.split('|'):
+                if alternative[1:] not in by_first[alternative[0]]:
+                    by_first[alternative[0]].append(alternative[1:])
+    
+    groups = '|'.join(first + '(?:' + '|'.join(rests) + ')' for first, rests in by_first.items())
+    return re.compile(r'\b(?=[' + ''.join(by_first) + r'])(?:' + groups + r')\b', re.IGNORECASE)
+
+
+_TERM = _compile_term_scanner()
+_TERM_CLASSIFIERS = (
+    [('type', name, re.compile(p)) for name, ps in _TYPE_PATTERNS.items() for p in ps] +
+    [('entity', name, re.compile(p, re.IGNORECASE)) for name, ps in _ENTITY_PATTERNS.items() for p in ps]
+)
+
+# IPs and commands keep case and may overlap terms, so they have their own scans
+_IP_ADDRESS = re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b')
+_COMMAND = re.compile(r'`([^`]+)`|\$\s*([^\n]+)')  # In backticks or after $
+
+_ANALYSIS_CACHE_SIZE = 128
+_analysis_cache: 'OrderedDict[bytes, Dict]' = OrderedDict()
+_term_classes: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+
+def _classify_term(term: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Semantic types (once per matching pattern) and entity types of a scanned term."""
+    classes = _term_classes.get(term)
+    if classes is None:
+        types = tuple(name for kind, name, p in _TERM_CLASSIFIERS if kind == 'type' and p.fullmatch(term))
+        entities = tuple(name for kind, name, p in _TERM_CLASSIFIERS if kind == 'entity' and p.fullmatch(term))
+        classes = _term_classes[term] = (types, entities)
+    return classes
+
+
+def _count_code_spans(text: str) -> int:
+    """Number of `code` spans, paired left to right like re.findall(r'`[^`]+`')."""
+    parts = text.split('`')
+    count, i = 0, 0
+    while i < len(parts) - 2:
+        if parts[i + 1]:
+            count += 1
+            i += 2
+        else:
+            i += 1
+    return count
+
+
+def _analyze(text: str) -> Dict:
+    """
+    Scan a text once for type scores, entities and structure stats.
+    
+    Results are memoized by content hash (the most recent
+    _ANALYSIS_CACHE_SIZE texts) and must not be mutated by callers.
+    """
+    key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    cached = _analysis_cache.get(key)
+    if cached is not None:
+        _analysis_cache.move_to_end(key)
+        return cached
+    
+    text_lower = text.lower()
+    
+    type_scores = dict.fromkeys(_TYPE_PATTERNS, 0)
+    found = {name: set() for name in _ENTITY_PATTERNS}
+    for term, count in Counter(_TERM.findall(text_lower)).items():
+        types, entities = _classify_term(term)
+        for name in types:
+            type_scores[name] += count
+        for name in entities:
+            found[name].add(term)
+    type_scores['technical'] += _count_code_spans(text_lower)
+    
+    found['ip_addresses'] = set(_IP_ADDRESS.findall(text))
+    found['commands'] = {inline or shell for inline, shell in _COMMAND.findall(text)}
+    
+    words = len(text.split())
+    structure = {
+        'word_count': words,
+        'line_count': text.count('\n') + 1,
+        'header_count': text.count('#'),
+        'list_item_count': text.count('-') + text.count('*'),
+        'code_block_count': text.count('```') // 2,
+        'has_questions': '?' in text,
+        'has_commands': '`' in text or '$' in text,
+        'avg_sentence_length': words / max(1, text.count('.') + text.count('!') + text.count('?'))
+    }
+    
+    result = {
+        'type_scores': type_scores,
+        'entities': {name: tuple(sorted(filter(None, values))) for name, values in found.items()},
+        'structure': structure
+    }
+    _analysis_cache[key] = result
+    if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
+    return result
+
+
 def detect_semantic_type(text: str) -> str:
     """
     Detect semantic type of text (technical, affective, cognitive).
@@ -78,43 +243,7 @@ def detect_semantic_type(text: str) -> str:
     Returns:
         Semantic type: 'technical', 'affective', or 'cognitive'
     """
-    text_lower = text.lower()
-    
-    # Technical indicators
-    technical_patterns = [
-        r'\b(configure|install|setup|command|script|code|api|protocol)\b',
-        r'\b(wpa[23]|ssh|firewall|vlan|802\.11|ip|port)\b',
-        r'\b(uci|opkg|iptables|wireless|network)\b',
-        r'`[^`]+`',  # Code blocks
-    ]
-    
-    # Affective indicators
-    affective_patterns = [
-        r'\b(worried|concerned|anxious|frustrated|confused|uncertain)\b',
-        r'\b(hope|wish|want|need|fear|worry)\b',
-        r'\b(difficult|hard|easy|simple|complex|complicated)\b',
-        r'\b(feel|think|believe|wonder|question)\b',
-    ]
-    
-    # Cognitive indicators
-    cognitive_patterns = [
-        r'\b(understand|learn|know|figure out|determine|decide)\b',
-        r'\b(why|how|what|when|where|which)\b',
-        r'\b(problem|solution|approach|strategy|method)\b',
-        r'\b(consider|evaluate|analyze|assess|review)\b',
-    ]
-    
-    # Count matches
-    technical_score = sum(len(re.findall(p, text_lower)) for p in technical_patterns)
-    affective_score = sum(len(re.findall(p, text_lower)) for p in affective_patterns)
-    cognitive_score = sum(len(re.findall(p, text_lower)) for p in cognitive_patterns)
-    
-    # Determine type
-    scores = {
-        'technical': technical_score,
-        'affective': affective_score,
-        'cognitive': cognitive_score
-    }
+    scores = _analyze(text)['type_scores']
     
     return max(scores, key=scores.get) if max(scores.values()) > 0 else 'cognitive'
 
@@ -123,6 +252,11 @@ def cluster_by_similarity(texts: List[str], threshold: float = 50.0) -> List[Lis
     """
     Cluster texts by semantic similarity.
     
+    Greedy, in input order: each unassigned text starts a cluster and takes
+    every later unassigned text with calculate_similarity() >= threshold.
+    Keywords are extracted once per text and candidate pairs come from an
+    inverted index, so texts sharing no indexed keyword are never compared.
+    
     Args:
         texts: List of texts to cluster
         threshold: Similarity threshold for clustering (0-100)
@@ -131,6 +265,29 @@ def cluster_by_similarity(texts: List[str], threshold: float = 50.0) -> List[Lis
         List of clusters (each cluster is a list of text indices)
     """
     n = len(texts)
+    if threshold <= 0:
+        # Every pair qualifies (even 0% similarity): one cluster
+        return [list(range(n))] if n else []
+    
+    # Same keyword sets calculate_similarity() uses, computed once per text
+    keyword_sets = [set(extract_keywords(text, 20)) for text in texts]
+    
+    # Prefix filter: a pair can only reach Jaccard t if they share one of
+    # the |A| - ceil(t*|A|) + 1 rarest keywords of each set, so only those
+    # are indexed. Lowered by half a rounding step, since scores are
+    # rounded to 2 decimals before comparing.
+    min_jaccard = (threshold - 0.005) / 100
+    doc_freq = Counter(kw for kws in keyword_sets for kw in kws)
+    index: Dict[str, List[int]] = defaultdict(list)
+    prefixes = []
+    for doc_id, kws in enumerate(keyword_sets):
+        ordered = sorted(kws, key=lambda kw: (doc_freq[kw], kw))
+        prefix_len = len(ordered) - math.ceil(min_jaccard * len(ordered) - 1e-9) + 1
+        prefix = ordered[:max(0, prefix_len)]
+        prefixes.append(prefix)
+        for kw in prefix:
+            index[kw].append(doc_id)
+    
     clusters = []
     assigned = set()
     
@@ -141,11 +298,21 @@ def cluster_by_similarity(texts: List[str], threshold: float = 50.0) -> List[Lis
         cluster = [i]
         assigned.add(i)
         
-        for j in range(i + 1, n):
-            if j in assigned:
+        # Only texts sharing an indexed keyword can be similar enough
+        candidates = {
+            j
+            for kw in prefixes[i]
+            for j in index[kw]
+            if j > i and j not in assigned
+        }
+        
+        keywords_i = keyword_sets[i]
+        for j in sorted(candidates):
+            intersection = len(keywords_i & keyword_sets[j])
+            union = len(keywords_i) + len(keyword_sets[j]) - intersection
+            if intersection < min_jaccard * union:
                 continue
-                
-            similarity = calculate_similarity(texts[i], texts[j])
+            similarity = round((intersection / union) * 100, 2)
             if similarity >= threshold:
                 cluster.append(j)
                 assigned.add(j)
@@ -163,65 +330,9 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
         text: Input text
         
     Returns:
-        Dictionary of entity types and their values
+        Dictionary of entity types and their values (each list sorted)
     """
-    entities = {
-        'hardware': [],
-        'software': [],
-        'protocols': [],
-        'ip_addresses': [],
-        'commands': []
-    }
-    
-    # Hardware patterns
-    hardware_patterns = [
-        r'\b(atheros|ar\d+|broadcom|bcm\d+|qualcomm|qca\d+)\b',
-        r'\b(ubiquiti|tp-link|netgear|asus|linksys)\b',
-        r'\b(router|ap|access point|switch|modem)\b',
-    ]
-    
-    # Software patterns
-    software_patterns = [
-        r'\b(openwrt|dd-wrt|tomato|lede)\b',
-        r'\b(dropbear|openssh|dnsmasq|hostapd)\b',
-        r'\b(suricata|zeek|snort)\b',
-    ]
-    
-    # Protocol patterns
-    protocol_patterns = [
-        r'\b(wpa[23]?|wep|802\.11[a-z]*)\b',
-        r'\b(ssh|http|https|ftp|telnet|smtp)\b',
-        r'\b(tcp|udp|icmp|arp)\b',
-    ]
-    
-    # IP addresses
-    ip_pattern = r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b'
-    
-    # Commands (in backticks or after $)
-    command_pattern = r'`([^`]+)`|\$\s*([^\n]+)'
-    
-    text_lower = text.lower()
-    
-    # Extract entities
-    for pattern in hardware_patterns:
-        entities['hardware'].extend(re.findall(pattern, text_lower, re.IGNORECASE))
-    
-    for pattern in software_patterns:
-        entities['software'].extend(re.findall(pattern, text_lower, re.IGNORECASE))
-    
-    for pattern in protocol_patterns:
-        entities['protocols'].extend(re.findall(pattern, text_lower, re.IGNORECASE))
-    
-    entities['ip_addresses'] = re.findall(ip_pattern, text)
-    
-    commands = re.findall(command_pattern, text)
-    entities['commands'] = [c[0] or c[1] for c in commands if c[0] or c[1]]
-    
-    # Remove duplicates and empty strings
-    for key in entities:
-        entities[key] = list(set(filter(None, entities[key])))
-    
-    return entities
+    return {key: list(values) for key, values in _analyze(text)['entities'].items()}
 
 
 def analyze_text_structure(text: str) -> Dict[str, any]:
@@ -234,15 +345,27 @@ def analyze_text_structure(text: str) -> Dict[str, any]:
     Returns:
         Dictionary with structure analysis
     """
+    return dict(_analyze(text)['structure'])
+
+
+def analyze_text(text: str) -> Dict[str, any]:
+    """
+    Semantic type, type scores, entities and structure of a text in one scan.
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        Dictionary with 'type', 'type_scores', 'entities' and 'structure'
+    """
+    analysis = _analyze(text)
+    scores = analysis['type_scores']
+    
     return {
-        'word_count': len(text.split()),
-        'line_count': len(text.split('\n')),
-        'header_count': text.count('#'),
-        'list_item_count': text.count('-') + text.count('*'),
-        'code_block_count': text.count('```') // 2,
-        'has_questions': '?' in text,
-        'has_commands': '`' in text or '$' in text,
-        'avg_sentence_length': len(text.split()) / max(1, text.count('.') + text.count('!') + text.count('?'))
+        'type': max(scores, key=scores.get) if max(scores.values()) > 0 else 'cognitive',
+        'type_scores': dict(scores),
+        'entities': {key: list(values) for key, values in analysis['entities'].items()},
+        'structure': dict(analysis['structure'])
     }
 
 
@@ -256,6 +379,10 @@ def main():
         print("  type <text>                  - Detect semantic type")
         print("  entities <text>              - Extract entities")
         print("  structure <text>             - Analyze structure")
+        print("  analyze <text>               - Type, entities and structure in one scan")
+        print("  dedup <file|dir>...          - Near-duplicate groups (MinHash/LSH, see minhash.py)")
+        print("  similarity-matrix [file...]  - TF-IDF cosine similarity of many texts (see tfidf.py)")
+        print("  serve [--socket PATH]        - JSON-lines worker for many requests (see worker.py)")
         sys.exit(1)
     
     command = sys.argv[1]
@@ -286,6 +413,23 @@ def main():
         structure = analyze_text_structure(text)
         print(json.dumps(structure, indent=2))
     
+    elif command == 'analyze':
+        text = sys.argv[2] if len(sys.argv) > 2 else sys.stdin.read()
+        analysis = analyze_text(text)
+        print(json.dumps(analysis, indent=2))
+    
+    elif command == 'dedup':
+        from minhash import main as dedup_main
+        dedup_main(sys.argv[2:])
+    
+    elif command == 'similarity-matrix':
+        from tfidf import main as similarity_matrix_main
+        similarity_matrix_main(sys.argv[2:])
+    
+    elif command == 'serve':
+        from worker import main as serve_main
+        serve_main(sys.argv[2:])
+    
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
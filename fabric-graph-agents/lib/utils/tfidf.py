@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+TF-IDF cosine similarity for batches of texts.
+
+Builds one document-term matrix for the whole batch (sublinear TF, smoothed
+IDF, L2-normalized rows) and computes all pairwise cosine similarities with
+a single sparse matrix product, or the top-k neighbours of every text.
+
+NumPy and SciPy are optional: with them the matrix is a scipy.sparse CSR
+matrix and similarities come from X @ X.T; without them the same weights are
+kept as sparse dicts and dot products are accumulated through an inverted
+index. Scores are on the same 0-100 scale as semantic.calculate_similarity.
+"""
+
+import json
+import math
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from semantic import tokenize
+
+try:
+    import numpy as np
+    from scipy import sparse
+    HAVE_SCIPY = True
+except ImportError:  # Pure-Python fallback
+    HAVE_SCIPY = False
+
+
+def _weights(texts: List[str]) -> Tuple[List[Dict[int, float]], Dict[str, int]]:
+    """Sparse L2-normalized TF-IDF rows (term index -> weight) and the vocabulary."""
+    counts = [Counter(tokenize(text)) for text in texts]
+
+    vocab: Dict[str, int] = {}
+    doc_freq: Counter = Counter()
+    for row in counts:
+        doc_freq.update(row.keys())
+    for term in sorted(doc_freq):
+        vocab[term] = len(vocab)
+
+    n = len(texts)
+    idf = {term: math.log((1 + n) / (1 + df)) + 1 for term, df in doc_freq.items()}
+
+    rows = []
+    for row in counts:
+        weights = {vocab[t]: (1 + math.log(tf)) * idf[t] for t, tf in row.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        rows.append({i: w / norm for i, w in weights.items()} if norm else {})
+    return rows, vocab
+
+
+def build_matrix(texts: List[str]):
+    """
+    Build the document-term TF-IDF matrix for a batch of texts.
+
+    Args:
+        texts: Input texts
+
+    Returns:
+        Tuple of (matrix, vocabulary dict term -> column). The matrix is a
+        scipy.sparse CSR matrix when SciPy is available, else a list of
+        sparse row dicts.
+    """
+    rows, vocab = _weights(texts)
+    if not HAVE_SCIPY:
+        return rows, vocab
+
+    indptr = [0]
+    indices: List[int] = []
+    data: List[float] = []
+    for row in rows:
+        indices.extend(row.keys())
+        data.extend(row.values())
+        indptr.append(len(indices))
+    matrix = sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int64), np.asarray(indptr)),
+        shape=(len(rows), max(1, len(vocab)))
+    )
+    return matrix, vocab
+
+
+def _python_products(rows: List[Dict[int, float]]) -> List[Dict[int, float]]:
+    """Pairwise dot products of sparse rows via an inverted index (nonzero only)."""
+    postings: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
+    for doc, row in enumerate(rows):
+        for term, weight in row.items():
+            postings[term].append((doc, weight))
+
+    products = []
+    for row in rows:
+        scores: Dict[int, float] = defaultdict(float)
+        for term, weight in row.items():
+            for other, other_weight in postings[term]:
+                scores[other] += weight * other_weight
+        products.append(scores)
+    return products
+
+
+def similarity_matrix(texts: List[str]) -> List[List[float]]:
+    """
+    Cosine similarity of every pair of texts.
+
+    Args:
+        texts: Input texts
+
+    Returns:
+        n x n matrix of scores (0-100, 2 decimals); the diagonal is 100
+        for any text with content words
+    """
+    matrix, _ = build_matrix(texts)
+    n = len(texts)
+    if HAVE_SCIPY:
+        dense = (matrix @ matrix.T).toarray() * 100
+        return np.round(np.clip(dense, 0, 100), 2).tolist()
+
+    result = [[0.0] * n for _ in range(n)]
+    for i, scores in enumerate(_python_products(matrix)):
+        for j, score in scores.items():
+            result[i][j] = round(min(score, 1.0) * 100, 2)
+    return result
+
+
+def top_k_neighbors(
+    texts: List[str],
+    k: int = 5,
+    min_score: float = 0.0
+) -> List[List[Tuple[int, float]]]:
+    """
+    The k most similar other texts for every text.
+
+    Args:
+        texts: Input texts
+        k: Neighbours per text
+        min_score: Minimum score to report (0-100)
+
+    Returns:
+        For each text, a list of (index, score) sorted by score descending
+        (ties by index); texts never list themselves
+    """
+    matrix, _ = build_matrix(texts)
+    neighbors = []
+
+    if HAVE_SCIPY:
+        products = (matrix @ matrix.T).tocsr()
+        for i in range(len(texts)):
+            start, end = products.indptr[i], products.indptr[i + 1]
+            cols = products.indices[start:end]
+            scores = np.round(np.clip(products.data[start:end], 0, 1) * 100, 2)
+            keep = (cols != i) & (scores > 0) & (scores >= min_score)
+            cols, scores = cols[keep], scores[keep]
+            if len(cols) > k > 0:
+                # Keep everything tied with the k-th best so ties break by index
+                kth = -np.partition(-scores, k - 1)[k - 1]
+                top = scores >= kth
+                cols, scores = cols[top], scores[top]
+            ranked = sorted(zip(cols.tolist(), scores.tolist()), key=lambda cs: (-cs[1], cs[0]))
+            neighbors.append(ranked[:k])
+        return neighbors
+
+    for i, scores in enumerate(_python_products(matrix)):
+        ranked = sorted(
+            ((j, round(min(s, 1.0) * 100, 2)) for j, s in scores.items() if j != i),
+            key=lambda cs: (-cs[1], cs[0])
+        )
+        neighbors.append([(j, s) for j, s in ranked if s > 0 and s >= min_score][:k])
+    return neighbors
+
+
+def _read_inputs(paths: List[str]) -> Tuple[List[str], List[str]]:
+    """IDs and texts from files, or from a JSON list/object on stdin."""
+    if paths:
+        return paths, [Path(p).read_text(encoding='utf-8', errors='replace') for p in paths]
+
+    data = json.load(sys.stdin)
+    if isinstance(data, dict):
+        return [str(key) for key in data], [str(value) for value in data.values()]
+    return [str(i) for i in range(len(data))], [str(text) for text in data]
+
+
+def main(argv: Optional[List[str]] = None):
+    """CLI: tfidf.py [FILE...] [--top-k K] [--min-score S] (JSON on stdin without files)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='TF-IDF cosine similarity matrix for many texts')
+    parser.add_argument('paths', nargs='*',
+                        help='Files to compare (default: JSON list or {id: text} object on stdin)')
+    parser.add_argument('--top-k', type=int, default=None,
+                        help='Report the K most similar texts per input instead of the full matrix')
+    parser.add_argument('--min-score', type=float, default=0.0,
+                        help='With --top-k: minimum score to report (0-100)')
+    args = parser.parse_args(argv)
+
+    ids, texts = _read_inputs(args.paths)
+
+    if args.top_k is not None:
+        result = {
+            'ids': ids,
+            'neighbors': {
+                ids[i]: [{'id': ids[j], 'similarity': score} for j, score in ranked]
+                for i, ranked in enumerate(top_k_neighbors(texts, args.top_k, args.min_score))
+            }
+        }
+    else:
+        result = {'ids': ids, 'matrix': similarity_matrix(texts)}
+
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
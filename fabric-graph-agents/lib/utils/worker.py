@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Long-lived JSON-lines worker for the fabric graph agent utilities.
+
+Starting Python for every semantic.py / graph_planner.py call costs far more
+than the call itself, and passing text on argv breaks on large inputs. The
+worker loads the utilities once and answers one JSON request per line, either
+on stdin/stdout (for a shell coprocess, see lib/semantic-worker.sh) or on a
+Unix socket shared by several agents.
+
+Request:  {"id": 1, "command": "entities", "text": "..."}
+Response: {"id": 1, "ok": true, "result": {...}}
+          {"id": 1, "ok": false, "error": "..."}
+
+Results are the same JSON the matching CLI command prints. Parameters are
+named as in the CLI usage (text, text1/text2, texts, goal, dimensions,
+depth, ...); request lines may contain raw control characters in strings.
+
+Clients without a JSON parser (shell) can add "raw": true to get a line
+that starts with a fixed status instead, so the result can be cut off
+without parsing:
+
+    ok<TAB><result JSON>
+    error<TAB><message>
+"""
+
+import json
+import os
+import socketserver
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+import graph_planner
+import semantic
+
+
+def _similarity_matrix(texts: List[str], top_k: Optional[int] = None, min_score: float = 0.0) -> Dict:
+    from tfidf import similarity_matrix, top_k_neighbors
+
+    if top_k is None:
+        return {'matrix': similarity_matrix(texts)}
+    return {'neighbors': [
+        [{'index': j, 'similarity': score} for j, score in ranked]
+        for ranked in top_k_neighbors(texts, top_k, min_score)
+    ]}
+
+
+def _strategy(dimensions: List[Dict], goal: str = 'analyze', depth: str = 'normal') -> Dict:
+    goal_type = graph_planner.classify_goal(goal)
+    return {'strategy': graph_planner.select_strategy(dimensions, goal_type, depth)}
+
+
+COMMANDS: Dict[str, Callable[..., Any]] = {
+    'ping': lambda: {'pid': os.getpid()},
+    # semantic.py
+    'keywords': lambda text, top_n=10: semantic.extract_keywords(text, top_n),
+    'similarity': lambda text1, text2: {'similarity': semantic.calculate_similarity(text1, text2)},
+    'type': lambda text: {'type': semantic.detect_semantic_type(text)},
+    'entities': semantic.extract_entities,
+    'structure': semantic.analyze_text_structure,
+    'analyze': semantic.analyze_text,
+    'cluster': lambda texts, threshold=50.0: semantic.cluster_by_similarity(texts, threshold),
+    'similarity-matrix': _similarity_matrix,
+    # graph_planner.py
+    'classify': lambda goal: {'goal_type': graph_planner.classify_goal(goal)},
+    'strategy': _strategy,
+    'plan': lambda dimensions, goal='analyze', depth='normal': graph_planner.plan_with_history(
+        dimensions, goal, depth
+    ),
+}
+
+
+def _handle(line: str) -> Tuple[Dict, bool]:
+    request_id = None
+    raw = False
+    try:
+        request = json.loads(line, strict=False)
+        if not isinstance(request, dict):
+            raise ValueError('request must be a JSON object')
+        request_id = request.pop('id', None)
+        raw = bool(request.pop('raw', False))
+        command = request.pop('command', None)
+        if command not in COMMANDS:
+            raise ValueError(f'unknown command: {command}')
+        return {'id': request_id, 'ok': True, 'result': COMMANDS[command](**request)}, raw
+    except Exception as e:  # Report and keep serving
+        return {'id': request_id, 'ok': False, 'error': f'{type(e).__name__}: {e}'}, raw
+
+
+def handle_line(line: str) -> Dict:
+    """
+    Answer one request line.
+
+    Args:
+        line: JSON request object
+
+    Returns:
+        Response object (never raises for bad requests)
+    """
+    return _handle(line)[0]
+
+
+def respond(line: str) -> str:
+    """
+    Response line (without newline) for one request line, honouring "raw".
+
+    Args:
+        line: JSON request object
+
+    Returns:
+        JSON response, or "ok\t<result>" / "error\t<message>" for raw requests
+    """
+    response, raw = _handle(line)
+    if not raw:
+        return json.dumps(response)
+    if response['ok']:
+        return 'ok\t' + json.dumps(response['result'])
+    return 'error\t' + ' '.join(response['error'].split())
+
+
+def serve_stream(infile: TextIO, outfile: TextIO) -> int:
+    """
+    Answer requests line by line until EOF.
+
+    Args:
+        infile: Request stream
+        outfile: Response stream (flushed after every response)
+
+    Returns:
+        Number of requests handled
+    """
+    handled = 0
+    for line in infile:
+        if not line.strip():
+            continue
+        outfile.write(respond(line) + '\n')
+        outfile.flush()
+        handled += 1
+    return handled
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for raw in self.rfile:
+            if not raw.strip():
+                continue
+            with self.server.lock:
+                response = respond(raw.decode('utf-8', errors='replace'))
+            self.wfile.write((response + '\n').encode('utf-8'))
+            self.wfile.flush()
+
+
+class _SocketServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve_socket(path: str) -> None:
+    """
+    Serve requests on a Unix socket, one connection per client, until interrupted.
+
+    Requests are handled one at a time (the utilities share caches).
+
+    Args:
+        path: Socket path (a stale socket file is replaced)
+    """
+    if os.path.exists(path):
+        os.unlink(path)
+    with _SocketServer(path, _Handler) as server:
+        server.lock = threading.Lock()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
+
+
+def main(argv: Optional[List[str]] = None):
+    """CLI: worker.py [--socket PATH]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='JSON-lines worker for semantic.py / graph_planner.py commands')
+    parser.add_argument('--socket', help='Serve on this Unix socket instead of stdin/stdout')
+    args = parser.parse_args(argv)
+
+    if args.socket:
+        serve_socket(args.socket)
+    else:
+        serve_stream(sys.stdin, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
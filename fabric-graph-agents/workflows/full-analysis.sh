@@ -3,6 +3,14 @@
 
 set -e
 
+# Pattern outputs are cached by pattern + input (lib/utils/output_store.py),
+# so re-running on the same input only calls fabric for changed steps.
+# --explain lists the cache hits at the end.
+if [ "$1" = "--explain" ]; then
+    EXPLAIN=1
+    shift
+fi
+
 INPUT_FILE="$1"
 OUTPUT_BASE="${2:-./analysis-$(date +%Y%m%d-%H%M%S)}"
 
@@ -12,7 +20,7 @@ if [ -z "$INPUT_FILE" ]; then
 ║     FABRIC GRAPH AGENTS - FULL ANALYSIS WORKFLOW             ║
 ╚══════════════════════════════════════════════════════════════╝
 
-Usage: $0 <input_file> [output_dir]
+Usage: $0 [--explain] <input_file> [output_dir]
 
 This runs the COMPLETE workflow:
   1. Dimensional Extraction
@@ -36,6 +44,8 @@ if [ ! -f "$INPUT_FILE" ]; then
 fi
 
 AGENTS_DIR="$HOME/Documents/projetos/hub/.myscripts/fabric-graph-agents/agents"
+LIB_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/../lib" && pwd)"
+source "$LIB_DIR/fabric-wrapper.sh"
 
 # Colors for output
 GREEN='\033[0;32m'
@@ -60,6 +70,7 @@ section() {
 
 # Create output structure
 mkdir -p "$OUTPUT_BASE"/{dimensions,questions,research,validation,synthesis,graphs,logs}
+export FABRIC_CACHE_LOG="$OUTPUT_BASE/logs/cache.log"
 
 log "🚀 Starting FULL ANALYSIS WORKFLOW"
 log "📥 Input: $INPUT_FILE"
@@ -72,7 +83,7 @@ section "STAGE 1: DIMENSIONAL EXTRACTION"
 
 log "Extracting semantic dimensions..."
 
-cat "$INPUT_FILE" | fabric-ai --pattern dimension_extractor_ultra | \
+cat "$INPUT_FILE" | fabric_cached dimension_extractor_ultra | \
     sed -n '/^```json/,/^```$/p' | sed '1d;$d' > "$OUTPUT_BASE/dimensions/_extraction.json"
 
 # Parse and create dimension files
@@ -108,14 +119,14 @@ for dim_file in "$OUTPUT_BASE/dimensions"/*.md; do
         dim_name=$(basename "$dim_file" .md)
         log "  🔍 Processing: $dim_name"
         
-        cat "$dim_file" | fabric-ai --pattern extract_questions > \
+        cat "$dim_file" | fabric_cached extract_questions > \
             "$OUTPUT_BASE/questions/${dim_name}-questions.md" 2>/dev/null || \
             echo "# Questions for $dim_name\n\nFailed to extract questions." > \
             "$OUTPUT_BASE/questions/${dim_name}-questions.md"
         
         # Also improve the questions
         cat "$OUTPUT_BASE/questions/${dim_name}-questions.md" | \
-            fabric-ai --pattern improve_prompt > \
+            fabric_cached improve_prompt > \
             "$OUTPUT_BASE/questions/${dim_name}-improved.md" 2>/dev/null || \
             cp "$OUTPUT_BASE/questions/${dim_name}-questions.md" \
                "$OUTPUT_BASE/questions/${dim_name}-improved.md"
@@ -141,7 +152,7 @@ cat "$OUTPUT_BASE/dimensions"/*.md | \
 # Generate search queries
 log "  🔎 Analyzing threats..."
 cat "$OUTPUT_BASE/research/_combined-technical.md" | \
-    fabric-ai --pattern search_query_generator > \
+    fabric_cached search_query_generator > \
     "$OUTPUT_BASE/research/search-queries.md" 2>/dev/null || \
     echo "# Search Queries\n\nFailed to generate queries." > \
     "$OUTPUT_BASE/research/search-queries.md"
@@ -149,7 +160,7 @@ cat "$OUTPUT_BASE/research/_combined-technical.md" | \
 # Optimize queries
 log "  🎯 Optimizing search queries..."
 cat "$OUTPUT_BASE/research/search-queries.md" | \
-    fabric-ai --pattern deep_search_optimizer > \
+    fabric_cached deep_search_optimizer > \
     "$OUTPUT_BASE/research/optimized-queries.md" 2>/dev/null || \
     cp "$OUTPUT_BASE/research/search-queries.md" \
        "$OUTPUT_BASE/research/optimized-queries.md"
@@ -165,7 +176,7 @@ log "Running security analysis on technical dimensions..."
 
 # Generate security questions
 cat "$OUTPUT_BASE/research/_combined-technical.md" | \
-    fabric-ai --pattern ask_secure_by_design_questions > \
+    fabric_cached ask_secure_by_design_questions > \
     "$OUTPUT_BASE/validation/security-questions.md" 2>/dev/null || \
     echo "# Security Questions\n\nFailed to generate." > \
     "$OUTPUT_BASE/validation/security-questions.md"
@@ -173,7 +184,7 @@ cat "$OUTPUT_BASE/research/_combined-technical.md" | \
 # Analyze risks
 log "  ⚠️  Analyzing risks..."
 cat "$OUTPUT_BASE/validation/security-questions.md" | \
-    fabric-ai --pattern analyze_risk > \
+    fabric_cached analyze_risk > \
     "$OUTPUT_BASE/validation/risk-analysis.md" 2>/dev/null || \
     echo "# Risk Analysis\n\nFailed to analyze." > \
     "$OUTPUT_BASE/validation/risk-analysis.md"
@@ -193,21 +204,21 @@ cat "$OUTPUT_BASE/dimensions"/*.md > "$OUTPUT_BASE/synthesis/_all-dimensions.md"
 # Extract wisdom
 log "  💡 Extracting wisdom..."
 cat "$OUTPUT_BASE/synthesis/_all-dimensions.md" | \
-    fabric-ai --pattern extract_wisdom > \
+    fabric_cached extract_wisdom > \
     "$OUTPUT_BASE/synthesis/wisdom.md" 2>/dev/null || \
     echo "# Wisdom\n\nFailed to extract." > "$OUTPUT_BASE/synthesis/wisdom.md"
 
 # Extract insights
 log "  🎯 Extracting insights..."
 cat "$OUTPUT_BASE/synthesis/wisdom.md" | \
-    fabric-ai --pattern extract_insights > \
+    fabric_cached extract_insights > \
     "$OUTPUT_BASE/synthesis/insights.md" 2>/dev/null || \
     echo "# Insights\n\nFailed to extract." > "$OUTPUT_BASE/synthesis/insights.md"
 
 # Extract recommendations
 log "  📋 Generating recommendations..."
 cat "$OUTPUT_BASE/synthesis/insights.md" | \
-    fabric-ai --pattern extract_recommendations > \
+    fabric_cached extract_recommendations > \
     "$OUTPUT_BASE/synthesis/recommendations.md" 2>/dev/null || \
     echo "# Recommendations\n\nFailed to generate." > "$OUTPUT_BASE/synthesis/recommendations.md"
 
@@ -350,6 +361,11 @@ echo ""
 echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
 echo ""
 success "FULL ANALYSIS COMPLETE!"
+if [ -n "$EXPLAIN" ] && [ -f "$FABRIC_CACHE_LOG" ]; then
+    echo ""
+    echo "🗄️  Pattern cache ($(grep -c '^cache hit' "$FABRIC_CACHE_LOG" || true) hits):"
+    sed 's/^/   /' "$FABRIC_CACHE_LOG"
+fi
 echo ""
 echo "🚀 Next Steps:"
 echo "   1. Read: $OUTPUT_BASE/MASTER-ACTION-PLAN.md"
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: transcript sanitization on a long auto-caption transcript.
+
+Compares the previous approach (join JSON3 events, then 18 per-case
+re.sub passes plus a whitespace pass) against the single precompiled
+marker pattern applied once to the joined events.
+
+Usage:
+    python benchmarks/bench_sanitizer.py
+    python benchmarks/bench_sanitizer.py --events 120000 --runs 5
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lib.transcript import parse_json3_to_text  # noqa: E402
+
+_LEGACY_MARKERS = [
+    r'\[Music\]', r'\[music\]', r'\[MUSIC\]',
+    r'\[Applause\]', r'\[applause\]', r'\[APPLAUSE\]',
+    r'\[Laughter\]', r'\[laughter\]', r'\[LAUGHTER\]',
+    r'\(Music\)', r'\(music\)', r'\(MUSIC\)',
+    r'\(Applause\)', r'\(applause\)', r'\(APPLAUSE\)',
+    r'\(Laughter\)', r'\(laughter\)', r'\(LAUGHTER\)',
+]
+
+_WORDS = (
+    "so the model uses attention over the whole context and that is why "
+    "we see these scaling results in practice you know it is kind of "
+    "interesting because the data pipeline matters more than the architecture"
+).split()
+
+
+def build_auto_caption_json3(num_events: int, seed: int = 42) -> dict:
+    """Build a synthetic JSON3 payload shaped like YouTube auto-captions."""
+    rng = random.Random(seed)
+    events = []
+    for i in range(num_events):
+        if i % 3 == 2:
+            # Auto-captions interleave newline-only events
+            events.append({"tStartMs": i * 1000, "aAppend": 1, "segs": [{"utf8": "\n"}]})
+            continue
+        segs = [{"utf8": ("" if j == 0 else " ") + rng.choice(_WORDS)} for j in range(rng.randint(3, 8))]
+        if rng.random() < 0.02:
+            segs.append({"utf8": " " + rng.choice(["[Music]", "[applause]", "(Laughter)"])})
+        events.append({"tStartMs": i * 1000, "dDurationMs": 2000, "segs": segs})
+    return {"events": events}
+
+
+def legacy_parse_and_sanitize(json_data: dict) -> str:
+    """Previous implementation: join events, then sanitize the full text."""
+    text_parts = []
+    for event in json_data.get('events', []):
+        if 'segs' not in event:
+            continue
+        line = ''.join(seg.get('utf8', '') for seg in event['segs']).strip()
+        if line and line != '\n':
+            text_parts.append(line)
+    text = ' '.join(text_parts)
+    for marker in _LEGACY_MARKERS:
+        text = re.sub(marker, '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def _best_of(func, data, runs: int) -> float:
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=60000, help="JSON3 events to generate (default: 60000)")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per variant, best is reported (default: 5)")
+    args = parser.parse_args()
+
+    data = build_auto_caption_json3(args.events)
+
+    legacy_text = legacy_parse_and_sanitize(data)
+    new_text = parse_json3_to_text(data)
+    if legacy_text != new_text:
+        print("❌ Output mismatch between legacy and single-pass sanitizer", file=sys.stderr)
+        return 1
+
+    legacy = _best_of(legacy_parse_and_sanitize, data, args.runs)
+    single = _best_of(parse_json3_to_text, data, args.runs)
+
+    print(f"Transcript: {len(new_text.split()):,} words, {len(new_text) / 1024:.0f} KB")
+    print(f"  legacy (join + 19 passes): {legacy * 1000:8.1f} ms")
+    print(f"  single pass after joining: {single * 1000:8.1f} ms")
+    print(f"  speedup: {legacy / single:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
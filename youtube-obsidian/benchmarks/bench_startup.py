@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CLI startup time and import cost of light commands.
+
+Runs commands that never touch YouTube or Fabric (help, status, listing)
+under `python -X importtime` and reports wall time, total import time and
+the most expensive top-level imports. Heavy dependencies (yt-dlp, tenacity,
+requests, tiktoken via the Fabric orchestrator) must only load on the
+extraction/analysis path; a command that imports any of them fails the
+benchmark.
+
+Results are compared with the checked-in baseline
+(benchmarks/startup_baseline.json); --save-baseline rewrites it on the
+current machine.
+
+Commands run with HOME and OBSVAULT pointed at a temporary directory, so the
+user's config and vault are never read or created. One untimed warm-up run
+per command creates the default config (and its parse cache) first, as on
+any machine after the first run.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 10 --top 10
+    python benchmarks/bench_startup.py --save-baseline
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "startup_baseline.json"
+
+COMMANDS = {
+    "yt --help": ["yt", "--help"],
+    "yt status --all": ["yt", "status", "--all"],
+    "yt --list-processed": ["yt", "--list-processed"],
+    "yt-obsidian --help": ["yt-obsidian.py", "--help"],
+}
+
+# Modules that must not be imported by the commands above
+HEAVY_MODULES = (
+    "yt_dlp",
+    "tenacity",
+    "requests",
+    "tiktoken",
+    "lib.extractor",
+    "lib.fabric_orchestrator",
+)
+
+
+def parse_importtime(stderr: str):
+    """Parse -X importtime output into (name, self_us, cumulative_us, depth) rows."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        self_us, cumulative_us, raw_name = int(fields[0]), int(fields[1]), fields[2]
+        name = raw_name.strip()
+        depth = (len(raw_name) - len(raw_name.lstrip(" ")) - 1) // 2
+        rows.append((name, self_us, cumulative_us, depth))
+    return rows
+
+
+def run_command(args, env):
+    """Run one command under -X importtime; returns (wall seconds, import rows)."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    wall = time.perf_counter() - start
+    return wall, parse_importtime(proc.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per command (median reported)")
+    parser.add_argument("--top", type=int, default=6, help="Top-level imports to list per command")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Write results to {BASELINE_PATH.name}")
+    args = parser.parse_args()
+
+    baseline = {}
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text())
+
+    results = {}
+    heavy_found = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, HOME=tmp, OBSVAULT=tmp)
+        # Interpreter startup alone, for reference
+        base_runs = [run_command(["-c", "pass"], env)[0] for _ in range(args.runs)]
+        interpreter_ms = statistics.median(base_runs) * 1000
+        print(f"Python interpreter startup: {interpreter_ms:.0f} ms\n")
+
+        for label, command in COMMANDS.items():
+            walls, import_totals = [], []
+            rows = []
+            run_command(command, env)  # Warm-up
+            for _ in range(args.runs):
+                wall, rows = run_command(command, env)
+                walls.append(wall)
+                import_totals.append(sum(r[1] for r in rows))
+
+            wall_ms = statistics.median(walls) * 1000
+            import_ms = statistics.median(import_totals) / 1000
+            results[label] = {"wall_ms": round(wall_ms, 1), "import_ms": round(import_ms, 1)}
+
+            previous = baseline.get("commands", {}).get(label)
+            delta = ""
+            if previous:
+                delta = f"  (baseline {previous['wall_ms']:.0f} ms wall, {previous['import_ms']:.0f} ms imports)"
+            print(f"{label}: {wall_ms:.0f} ms wall, {import_ms:.0f} ms imports{delta}")
+
+            top_level = sorted((r for r in rows if r[3] == 0), key=lambda r: r[2], reverse=True)
+            for name, _, cumulative_us, _ in top_level[:args.top]:
+                print(f"    {cumulative_us / 1000:7.1f} ms  {name}")
+
+            names = {r[0] for r in rows}
+            heavy = [m for m in HEAVY_MODULES if m in names]
+            if heavy:
+                heavy_found = True
+                print(f"    ✗ imports heavy modules: {', '.join(heavy)}")
+            print()
+
+    if args.save_baseline:
+        BASELINE_PATH.write_text(json.dumps({
+            "python": sys.version.split()[0],
+            "interpreter_ms": round(interpreter_ms, 1),
+            "commands": results
+        }, indent=2) + "\n")
+        print(f"Saved baseline to {BASELINE_PATH}")
+
+    return 1 if heavy_found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
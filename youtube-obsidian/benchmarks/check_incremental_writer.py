@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Regression check: IncrementalWriter appends on LF, CRLF and bare notes.
+
+Each case writes a note, appends a pattern section through
+append_patterns_to_note and compares the saved note byte for byte.
+Exits non-zero on the first mismatch.
+
+Usage:
+    python benchmarks/check_incremental_writer.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lib.incremental_writer import append_patterns_to_note  # noqa: E402
+
+SECTION = "\n\n## AI Analysis - s2\n\nout\n"
+
+# (name, note, update_frontmatter, expected note after the append)
+CASES = [
+    (
+        "lf frontmatter",
+        "---\ntitle: x\nfabric_patterns:\n- s1\n---\nbody\n",
+        True,
+        "---\nfabric_patterns:\n- s1\n- s2\ntitle: x\n---\nbody\n" + SECTION,
+    ),
+    (
+        # Header is rewritten with LF fences, the CRLF body is kept as is
+        "crlf frontmatter",
+        "---\r\ntitle: x\r\nfabric_patterns:\r\n- s1\r\n---\r\nbody\r\n",
+        True,
+        "---\nfabric_patterns:\n- s1\n- s2\ntitle: x\n---\nbody\r\n" + SECTION,
+    ),
+    (
+        "crlf frontmatter, in place",
+        "---\r\ntitle: x\r\n---\r\nbody\r\n",
+        False,
+        "---\ntitle: x\n---\nbody\r\n" + SECTION,
+    ),
+    (
+        "lf frontmatter, in place",
+        "---\ntitle: x\n---\nbody\n",
+        False,
+        "---\ntitle: x\n---\nbody\n" + SECTION,
+    ),
+    (
+        "no frontmatter",
+        "body\n",
+        True,
+        "---\nfabric_patterns:\n- s2\n---\nbody\n" + SECTION,
+    ),
+]
+
+
+def main() -> int:
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, note, update_frontmatter, expected in CASES:
+            path = Path(tmp) / "note.md"
+            path.write_bytes(note.encode("utf-8"))
+            append_patterns_to_note(path, {"s2": "out"}, update_frontmatter=update_frontmatter)
+            saved = path.read_bytes().decode("utf-8")
+            if saved == expected:
+                print(f"✅ {name}")
+            else:
+                failed += 1
+                print(f"❌ {name}\n   expected {expected!r}\n   got      {saved!r}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Golden-file check and benchmark for format_combined_output.
+
+Every benchmarks/golden/markdown/<name>.in.md is formatted with the default
+options and compared byte for byte against <name>.out.md (recorded with the
+chained remove_chunk_markers -> normalize_headings -> clean_horizontal_rules
+pipeline). Each input is also compared against that chain for every option
+combination. Then a long multi-chunk output is timed with both.
+Exits non-zero on any mismatch.
+
+Usage:
+    python benchmarks/check_markdown_format.py
+    python benchmarks/check_markdown_format.py --parts 2000 --runs 5
+"""
+
+import argparse
+import itertools
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lib.markdown_utils import (  # noqa: E402
+    clean_horizontal_rules,
+    format_combined_output,
+    normalize_headings,
+    remove_chunk_markers,
+)
+
+GOLDEN_DIR = Path(__file__).resolve().parent / "golden" / "markdown"
+
+
+def chained_format(text, base_heading_level=4, keep_chunk_markers=False, clean_rules=True):
+    """The previous format_combined_output: one full pass per step."""
+    if not text:
+        return text
+    if not keep_chunk_markers:
+        text = remove_chunk_markers(text)
+    text = normalize_headings(text, base_level=base_heading_level)
+    if clean_rules:
+        text = clean_horizontal_rules(text)
+    return text.strip()
+
+
+def build_combined_output(parts):
+    """Combined output shaped like FabricOrchestrator._combine_outputs."""
+    body = (GOLDEN_DIR / "chunked_summary.in.md").read_text(encoding="utf-8")
+    sections = []
+    for i in range(1, parts + 1):
+        sections.append(f"## Part {i}/{parts}")
+        sections.append(f"*Timestamp: 00:{i % 60:02d}:00 - 00:{(i + 1) % 60:02d}:00*")
+        sections.append(body)
+        sections.append("---")
+    return "\n".join(sections)
+
+
+def _best_of(func, text, runs):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--parts", type=int, default=1000, help="Chunk outputs in the timed input (default: 1000)")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per variant, best is reported (default: 5)")
+    args = parser.parse_args()
+
+    failed = 0
+    for path in sorted(GOLDEN_DIR.glob("*.in.md")):
+        name = path.name[:-len(".in.md")]
+        text = path.read_bytes().decode("utf-8")
+        expected = path.with_name(f"{name}.out.md").read_bytes().decode("utf-8")
+
+        if format_combined_output(text) != expected:
+            failed += 1
+            print(f"❌ {name}: differs from {name}.out.md", file=sys.stderr)
+            continue
+
+        for level, keep, clean in itertools.product((1, 3, 4, 6), (False, True), (False, True)):
+            options = dict(base_heading_level=level, keep_chunk_markers=keep, clean_rules=clean)
+            if format_combined_output(text, **options) != chained_format(text, **options):
+                failed += 1
+                print(f"❌ {name}: differs from the chained pipeline with {options}", file=sys.stderr)
+                break
+        else:
+            print(f"✅ {name}")
+
+    if failed:
+        return 1
+
+    text = build_combined_output(args.parts)
+    if format_combined_output(text) != chained_format(text):
+        print("❌ Output mismatch on the timed input", file=sys.stderr)
+        return 1
+
+    chained = _best_of(chained_format, text, args.runs)
+    fused = _best_of(format_combined_output, text, args.runs)
+
+    print(f"Combined output: {args.parts} parts, {len(text) / 1024:.0f} KB")
+    print(f"  chained (3 passes): {chained * 1000:8.1f} ms")
+    print(f"  fused line pass:    {fused * 1000:8.1f} ms")
+    print(f"  speedup: {chained / fused:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Simulation: replay recorded request timings against chunk size choices.
+
+Fits a latency profile from the timings the orchestrator records
+(.cache/timings.jsonl), then simulates whole runs for each candidate chunk
+size: patterns run one after another, each pattern's chunks go out on
+`parallelism` workers, requests wait for TPM allowance in a sliding
+60-second window, and every request's latency is the profile estimate
+scaled by a residual resampled from the recorded timings. The planner's
+pick is compared with the fixed 8000-token baseline.
+
+Without a timings log, a synthetic one is generated from the default
+profile (clearly marked in the output).
+
+Usage:
+    python benchmarks/sim_chunk_plan.py --timings $OBSVAULT/youtube/.cache/timings.jsonl
+    python benchmarks/sim_chunk_plan.py --tokens 20000 60000 --patterns 8 --parallelism 3
+"""
+
+import argparse
+import heapq
+import random
+import sys
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lib.chunk_planner import (  # noqa: E402
+    PREAMBLE_TOKENS,
+    ThroughputProfile,
+    candidate_plans,
+    estimate_run,
+    load_timings,
+    max_chunk_for_model
+)
+from lib.rate_limiter import estimate_tokens, get_model_tpm, resolve_model_name  # noqa: E402
+
+FIXED_CHUNK_TOKENS = 8000
+
+
+def synthetic_timings(profile: ThroughputProfile, count: int, rng: random.Random):
+    """Timings drawn from a profile with log-normal noise."""
+    records = []
+    for _ in range(count):
+        input_tokens = rng.randint(1500, 9000)
+        seconds = profile.latency(input_tokens) * rng.lognormvariate(0, 0.25)
+        records.append({
+            "input_tokens": input_tokens,
+            "output_tokens": profile.output_tokens,
+            "seconds": seconds,
+            "success": True
+        })
+    return records
+
+
+def residuals(profile: ThroughputProfile, records):
+    """Observed / predicted latency ratios to resample noise from."""
+    ratios = [
+        r["seconds"] / profile.latency(r["input_tokens"])
+        for r in records
+        if r.get("success", True) and r.get("seconds", 0) > 0
+    ]
+    return ratios or [1.0]
+
+
+def simulate(plan, num_patterns, model, profile, ratios, join, rng):
+    """Simulated wall time of one run for a plan."""
+    tpm = get_model_tpm(model)
+    overhead = estimate_tokens("") + PREAMBLE_TOKENS
+    request_tokens = plan.chunk_tokens + overhead + profile.output_tokens
+    join_tokens = plan.num_chunks * profile.output_tokens + overhead + profile.output_tokens
+
+    window = deque()  # (start_time, tokens) of requests in the last 60s
+    used = 0
+    now = 0.0
+
+    def admit(at, tokens):
+        """Earliest start >= at with TPM allowance for tokens."""
+        nonlocal used
+        while True:
+            while window and window[0][0] + 60 <= at:
+                used -= window.popleft()[1]
+            if used + tokens <= tpm or not window:
+                window.append((at, tokens))
+                used += tokens
+                return at
+            at = window[0][0] + 60
+
+    for _ in range(num_patterns):
+        workers = [now] * plan.parallelism
+        heapq.heapify(workers)
+        finish = now
+        for _ in range(plan.num_chunks):
+            free_at = heapq.heappop(workers)
+            start = admit(free_at, request_tokens)
+            done = start + profile.latency(request_tokens) * rng.choice(ratios)
+            heapq.heappush(workers, done)
+            finish = max(finish, done)
+        now = finish
+        if join and plan.num_chunks > 1:
+            start = admit(now, join_tokens)
+            now = start + profile.latency(join_tokens) * rng.choice(ratios)
+
+    return now
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--timings", type=Path, help="Recorded timings (JSON lines)")
+    parser.add_argument("--model", default="llama-4-scout", help="Model alias or name")
+    parser.add_argument("--tokens", type=int, nargs="+", default=[12000, 40000, 120000],
+                        help="Transcript sizes to simulate (tokens)")
+    parser.add_argument("--patterns", type=int, default=5, help="Patterns per run")
+    parser.add_argument("--parallelism", type=int, default=1, help="Concurrent chunks per pattern")
+    parser.add_argument("--max-chunk", type=int, default=FIXED_CHUNK_TOKENS, help="Chunk size cap")
+    parser.add_argument("--no-join", action="store_true", help="Don't simulate join requests")
+    parser.add_argument("--runs", type=int, default=20, help="Simulated runs per candidate")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    model = resolve_model_name(args.model)
+    join = not args.no_join
+
+    records = load_timings(args.timings, model) if args.timings else []
+    if len(records) < 3 and args.timings:
+        records = load_timings(args.timings)  # Any model beats no data
+    if len(records) >= 3:
+        source = f"{len(records)} recorded timings from {args.timings}"
+    else:
+        records = synthetic_timings(ThroughputProfile(), 200, rng)
+        source = "SYNTHETIC timings (no log given or too few records)"
+
+    profile = ThroughputProfile.from_records(records)
+    ratios = residuals(profile, records)
+
+    print(f"Model: {model} | patterns: {args.patterns} | parallelism: {args.parallelism}")
+    print(f"Profile: {profile.base_latency:.2f}s + {profile.seconds_per_1k_tokens:.2f}s/1K tokens, "
+          f"~{profile.output_tokens} output tokens ({source})")
+
+    for total in args.tokens:
+        plans = candidate_plans(
+            total, args.patterns, model,
+            parallelism=args.parallelism,
+            max_chunk_tokens=args.max_chunk,
+            profile=profile,
+            join=join
+        )
+        fixed = estimate_run(
+            total, min(args.max_chunk, FIXED_CHUNK_TOKENS), args.patterns, model,
+            parallelism=args.parallelism, profile=profile, join=join
+        )
+        shown = plans[:6]
+        if all(p.chunk_tokens != fixed.chunk_tokens for p in shown):
+            shown.append(fixed)
+
+        print(f"\nTranscript: {total:,} tokens")
+        print(f"  {'':2}{'chunk':>7} {'chunks':>6} {'requests':>8} {'tokens':>10} {'est(s)':>8} {'sim(s)':>8}")
+        for plan in shown:
+            mark = "★" if plan is plans[0] else ("=" if plan.chunk_tokens == fixed.chunk_tokens else "")
+            row = (f"  {mark:2}{plan.chunk_tokens:>7,} {plan.num_chunks:>6} {plan.requests:>8} "
+                   f"{plan.total_tokens:>10,} {plan.est_seconds:>8.0f}")
+            if plan.chunk_tokens > max_chunk_for_model(model, profile):
+                # Groq rejects requests larger than the TPM allowance outright
+                print(f"{row} {'rejected':>8}  (request exceeds model limit)")
+                continue
+            sims = [simulate(plan, args.patterns, model, profile, ratios, join, rng) for _ in range(args.runs)]
+            print(f"{row} {sum(sims) / len(sims):>8.0f}")
+
+    print("\n★ = planner pick, = = fixed chunk size baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,13 +6,21 @@ This module provides intelligent caching to:
 - Enable incremental pattern additions
 - Track processing history and token usage
 - Provide foundation for bulk processing
+
+Concurrency: every file is written atomically (temp file + rename) and
+index.json updates are merged under an advisory lock, so several yt
+processes can share one cache directory without corrupting it.
 """
 
 from pathlib import Path
+import atexit
 import json
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Dict, List, Any
-from dataclasses import dataclass, asdict
+from typing import Optional, Dict, List, Any, Tuple
+from dataclasses import dataclass, asdict, replace
+
+from .filesystem import atomic_write_text, file_lock
 
 
 @dataclass
@@ -44,6 +52,7 @@ class CacheEntry:
     processing_history: List[Dict[str, Any]]
     chunks: Optional[List[Dict[str, Any]]] = None  # Cached chunk info
     phase1_metadata: Optional[Dict[str, Any]] = None  # Global context
+    channel: str = ""  # Channel/uploader name (indexed by SQLite backend)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CacheEntry':
@@ -53,21 +62,48 @@ class CacheEntry:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON serialization"""
         return asdict(self)
+    
+    def copy(self) -> 'CacheEntry':
+        """Copy with independent list fields (safe to mutate and save back)"""
+        return replace(
+            self,
+            patterns_run=list(self.patterns_run),
+            processing_history=list(self.processing_history)
+        )
 
 
 class CacheManager:
     """Manages video processing cache"""
     
-    def __init__(self, cache_dir: Path):
+    # Parsed entries shared by all instances in this process, keyed by cache
+    # file path and validated against the file's (mtime_ns, size) on lookup
+    ENTRY_CACHE_SIZE = 256
+    _entry_cache: 'OrderedDict[str, Tuple[Tuple[int, int], CacheEntry]]' = OrderedDict()
+    
+    def __init__(self, cache_dir: Path, write_behind: bool = False, load_index: bool = True):
         """Initialize cache manager
         
         Args:
             cache_dir: Directory for cache files (e.g., $OBSVAULT/youtube/.cache)
+            write_behind: Buffer index updates in memory and write them in a
+                single flush() (called automatically at interpreter exit)
+            load_index: Read index.json; if False the index starts empty and
+                is never read (backends that keep their own index)
         """
         self.cache_dir = Path(cache_dir).expanduser()
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.index_file = self.cache_dir / "index.json"
-        self._load_index()
+        self.lock_file = self.cache_dir / "index.json.lock"
+        self.write_behind = write_behind
+        # Pending index changes: video_id -> index info, or None for deletion
+        self._pending: Dict[str, Optional[Dict[str, Any]]] = {}
+        if load_index:
+            self._load_index()
+        else:
+            self._create_new_index()
+        
+        if write_behind:
+            atexit.register(self.flush)
     
     def exists(self, video_id: str) -> bool:
         """Check if video already processed
@@ -94,9 +130,20 @@ class CacheManager:
         
         cache_file = self.cache_dir / f"{video_id}.json"
         try:
+            stat = cache_file.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            
+            # Reuse the parsed entry unless the file changed on disk
+            cached = self._entry_cache.get(str(cache_file))
+            if cached and cached[0] == stamp:
+                self._entry_cache.move_to_end(str(cache_file))
+                return cached[1].copy()
+            
             with open(cache_file) as f:
                 data = json.load(f)
-            return CacheEntry.from_dict(data)
+            entry = CacheEntry.from_dict(data)
+            self._remember(cache_file, stamp, entry)
+            return entry.copy()
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"⚠️  Warning: Failed to load cache for {video_id}: {e}")
             # Invalidate corrupt cache
@@ -113,20 +160,18 @@ class CacheManager:
         cache_file = self.cache_dir / f"{video_id}.json"
         
         # Save individual cache file
-        with open(cache_file, 'w') as f:
-            json.dump(entry.to_dict(), f, indent=2)
+        atomic_write_text(cache_file, json.dumps(entry.to_dict(), indent=2))
+        stat = cache_file.stat()
+        self._remember(cache_file, (stat.st_mtime_ns, stat.st_size), entry.copy())
         
         # Update index
-        if 'videos' not in self.index:
-            self.index['videos'] = {}
-        
-        self.index['videos'][video_id] = {
+        self._update_index(video_id, {
             'title': entry.title,
+            'channel': entry.channel,
             'markdown_path': entry.markdown_path,
             'last_processed': entry.last_updated,
             'patterns_count': len(entry.patterns_run)
-        }
-        self._save_index()
+        })
     
     def get_note_path(self, video_id: str) -> Optional[str]:
         """Get markdown note path for video
@@ -137,6 +182,11 @@ class CacheManager:
         Returns:
             Path to markdown note, or None if not found
         """
+        # The index already carries the note path; no per-video file needed
+        info = self.index.get('videos', {}).get(video_id)
+        if info and info.get('markdown_path'):
+            return info['markdown_path']
+        
         cache = self.get_cache(video_id)
         return cache.markdown_path if cache else None
     
@@ -184,12 +234,11 @@ class CacheManager:
             video_id: YouTube video ID
         """
         cache_file = self.cache_dir / f"{video_id}.json"
-        if cache_file.exists():
-            cache_file.unlink()
+        cache_file.unlink(missing_ok=True)
+        self._entry_cache.pop(str(cache_file), None)
         
-        if video_id in self.index.get('videos', {}):
-            del self.index['videos'][video_id]
-            self._save_index()
+        if video_id in self.index.get('videos', {}) or video_id in self._pending:
+            self._update_index(video_id, None)
     
     def list_all(self) -> List[Dict[str, Any]]:
         """List all cached videos
@@ -244,8 +293,77 @@ class CacheManager:
             'videos': {}
         }
     
+    def flush(self) -> None:
+        """Write pending index updates to disk
+        
+        Re-reads index.json under the lock and applies only this process's
+        changes, so concurrent runs never lose each other's updates.
+        """
+        if not self._pending:
+            return
+        
+        with file_lock(self.lock_file):
+            self._load_index()
+            videos = self.index.setdefault('videos', {})
+            for video_id, info in self._pending.items():
+                if info is None:
+                    videos.pop(video_id, None)
+                else:
+                    videos[video_id] = info
+            self._save_index()
+        
+        self._pending.clear()
+    
+    def _remember(self, cache_file: Path, stamp: Tuple[int, int], entry: CacheEntry) -> None:
+        """Store a parsed entry in the shared LRU, evicting the oldest"""
+        key = str(cache_file)
+        self._entry_cache[key] = (stamp, entry)
+        self._entry_cache.move_to_end(key)
+        while len(self._entry_cache) > self.ENTRY_CACHE_SIZE:
+            self._entry_cache.popitem(last=False)
+    
+    def _update_index(self, video_id: str, info: Optional[Dict[str, Any]]) -> None:
+        """Record an index change (None deletes) and flush unless write-behind"""
+        videos = self.index.setdefault('videos', {})
+        if info is None:
+            videos.pop(video_id, None)
+        else:
+            videos[video_id] = info
+        
+        self._pending[video_id] = info
+        if not self.write_behind:
+            self.flush()
+    
     def _save_index(self) -> None:
-        """Save index file"""
+        """Save index file (atomically; callers hold the index lock)"""
         self.index['last_updated'] = datetime.now().isoformat()
-        with open(self.index_file, 'w') as f:
-            json.dump(self.index, f, indent=2)
+        atomic_write_text(self.index_file, json.dumps(self.index, indent=2))
+
+
+CACHE_BACKENDS = ("json", "sqlite")
+
+
+def create_cache_manager(
+    cache_dir: Path,
+    backend: str = "json",
+    write_behind: bool = False
+) -> CacheManager:
+    """Create a cache manager for the configured storage backend
+    
+    Args:
+        cache_dir: Directory for cache files (e.g., $OBSVAULT/youtube/.cache)
+        backend: "json" (one file per video + index.json) or "sqlite"
+        write_behind: Coalesce JSON index updates into one flush per run
+            (the SQLite backend commits each write transactionally instead)
+        
+    Returns:
+        CacheManager instance (SQLiteCacheManager for "sqlite")
+    """
+    if backend == "sqlite":
+        from .sqlite_cache import SQLiteCacheManager
+        return SQLiteCacheManager(cache_dir)
+    
+    if backend != "json":
+        raise ValueError(f"Unknown cache backend '{backend}' (expected one of: {', '.join(CACHE_BACKENDS)})")
+    
+    return CacheManager(cache_dir, write_behind=write_behind)
@@ -0,0 +1,409 @@
+"""Adaptive chunk sizing from model limits and measured throughput.
+
+Chooses the chunk size for a run instead of using a fixed max_chunk_tokens.
+Fewer, larger chunks send less repeated overhead (system prompt + preamble)
+but serialize work; more, smaller chunks can run in parallel but burn TPM
+on overhead. The planner estimates wall time for every even split of the
+transcript and picks the fastest one that fits the model's limits:
+
+- Latency: ceil(chunks / parallelism) rounds per pattern, each taking the
+  per-request latency measured for that request size
+- TPM: tokens beyond the first minute's allowance are throttled
+- RPM: requests beyond the first minute's allowance are throttled
+
+Per-request latency comes from a ThroughputProfile, fitted from the timings
+the orchestrator records (see record_timing) or built-in defaults.
+"""
+
+import json
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .rate_limiter import (
+    GROQ_MODELS,
+    MAX_REQUEST_TOKENS,
+    estimate_tokens,
+    get_model_context_window,
+    get_model_tpm
+)
+
+# Smallest chunk worth sending (below this, overhead dominates)
+MIN_CHUNK_TOKENS = 1000
+# Tokens of context preamble expected per request (see packet_builder)
+PREAMBLE_TOKENS = 300
+# Recorded timings used to fit a profile (most recent per model)
+PROFILE_SAMPLE_SIZE = 200
+
+
+@dataclass
+class ThroughputProfile:
+    """Per-request latency model: base + per-1K-input-tokens cost.
+
+    Attributes:
+        base_latency: Seconds per request independent of size (queueing,
+            process startup, output generation)
+        seconds_per_1k_tokens: Extra seconds per 1K input tokens
+        output_tokens: Typical output tokens per request (counts toward TPM)
+        samples: Number of recorded timings the profile was fitted from
+    """
+    base_latency: float = 4.0
+    seconds_per_1k_tokens: float = 0.6
+    output_tokens: int = 1200
+    samples: int = 0
+
+    def latency(self, input_tokens: int) -> float:
+        """Estimated seconds for one request of input_tokens"""
+        return self.base_latency + self.seconds_per_1k_tokens * input_tokens / 1000
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> "ThroughputProfile":
+        """Fit a profile from recorded timings by least squares.
+
+        Args:
+            records: Dicts with input_tokens, seconds, and optional output_tokens
+
+        Returns:
+            ThroughputProfile: Fitted profile (defaults if too few records)
+        """
+        points = [
+            (r["input_tokens"] / 1000, r["seconds"], r.get("output_tokens", 0))
+            for r in records
+            if r.get("success", True) and r.get("seconds", 0) > 0
+        ]
+        if len(points) < 3:
+            return cls()
+
+        n = len(points)
+        mean_x = sum(x for x, _, _ in points) / n
+        mean_y = sum(y for _, y, _ in points) / n
+        var_x = sum((x - mean_x) ** 2 for x, _, _ in points)
+
+        default = cls()
+        if var_x > 0:
+            slope = sum((x - mean_x) * (y - mean_y) for x, y, _ in points) / var_x
+            slope = max(0.0, slope)
+        else:
+            slope = default.seconds_per_1k_tokens
+        base = max(0.5, mean_y - slope * mean_x)
+
+        outputs = [o for _, _, o in points if o]
+        output_tokens = int(sum(outputs) / len(outputs)) if outputs else default.output_tokens
+
+        return cls(
+            base_latency=base,
+            seconds_per_1k_tokens=slope,
+            output_tokens=output_tokens,
+            samples=n
+        )
+
+
+@dataclass
+class ChunkPlan:
+    """Chosen chunking for a run.
+
+    Attributes:
+        chunk_tokens: Max transcript tokens per chunk
+        num_chunks: Resulting number of chunks
+        parallelism: Concurrent requests per pattern
+        requests: Total requests (chunks x patterns, plus joins)
+        total_tokens: Tokens counted against TPM (input + output)
+        est_seconds: Estimated wall time
+        bound: Which limit dominates ("latency", "tpm" or "rpm")
+    """
+    chunk_tokens: int
+    num_chunks: int
+    parallelism: int
+    requests: int
+    total_tokens: int
+    est_seconds: float
+    bound: str
+
+    def describe(self) -> str:
+        """One-line human readable summary"""
+        return (
+            f"{self.num_chunks} chunk(s) × ≤{self.chunk_tokens:,} tokens, "
+            f"{self.parallelism} parallel, {self.requests} requests, "
+            f"~{self.total_tokens:,} tokens → ~{self.est_seconds:.0f}s ({self.bound}-bound)"
+        )
+
+
+def max_chunk_for_model(model: str, profile: Optional[ThroughputProfile] = None) -> int:
+    """Largest chunk a single request can carry for the model.
+
+    A request (input + output) must fit the context window, the per-request
+    limit, and the TPM allowance (larger requests are rejected outright).
+
+    Args:
+        model: Model name or alias
+        profile: Throughput profile (for expected output size)
+
+    Returns:
+        Max transcript tokens per chunk
+    """
+    profile = profile or ThroughputProfile()
+    overhead = estimate_tokens("") + PREAMBLE_TOKENS
+    per_request = min(
+        get_model_context_window(model) - profile.output_tokens,
+        MAX_REQUEST_TOKENS,
+        get_model_tpm(model) - profile.output_tokens
+    )
+    return max(MIN_CHUNK_TOKENS, per_request - overhead)
+
+
+def estimate_run(
+    total_tokens: int,
+    chunk_tokens: int,
+    num_patterns: int,
+    model: str,
+    parallelism: int = 1,
+    profile: Optional[ThroughputProfile] = None,
+    overlap_tokens: int = 200,
+    join: bool = False
+) -> ChunkPlan:
+    """Estimate wall time and token cost of one chunking choice.
+
+    Args:
+        total_tokens: Transcript tokens
+        chunk_tokens: Max transcript tokens per chunk
+        num_patterns: Patterns run over every chunk
+        model: Model name or alias
+        parallelism: Concurrent requests per pattern
+        profile: Throughput profile (default: built-in)
+        overlap_tokens: Overlap between consecutive chunks
+        join: Whether multi-chunk outputs are joined with an extra request
+
+    Returns:
+        ChunkPlan: Estimate for this choice
+    """
+    profile = profile or ThroughputProfile()
+    overhead = estimate_tokens("") + PREAMBLE_TOKENS
+
+    if total_tokens <= chunk_tokens:
+        num_chunks = 1
+    else:
+        step = max(1, chunk_tokens - overlap_tokens)
+        num_chunks = math.ceil((total_tokens - overlap_tokens) / step)
+    per_chunk = min(chunk_tokens, math.ceil(total_tokens / num_chunks) + overlap_tokens)
+    request_tokens = per_chunk + overhead
+
+    chunk_requests = num_chunks * num_patterns
+    join_requests = num_patterns if join and num_chunks > 1 else 0
+    join_tokens = num_chunks * profile.output_tokens + overhead
+
+    requests = chunk_requests + join_requests
+    total = (
+        chunk_requests * (request_tokens + profile.output_tokens)
+        + join_requests * (join_tokens + profile.output_tokens)
+    )
+
+    rounds = math.ceil(num_chunks / parallelism)
+    latency_bound = num_patterns * rounds * profile.latency(request_tokens)
+    latency_bound += join_requests * profile.latency(join_tokens)
+
+    # The first minute's allowance is available immediately; the rest trickles in
+    tpm = get_model_tpm(model)
+    tpm_bound = max(0, total - tpm) / tpm * 60
+    rpm = _model_rpm(model)
+    rpm_bound = max(0, requests - rpm) / rpm * 60
+
+    bounds = {"latency": latency_bound, "tpm": tpm_bound, "rpm": rpm_bound}
+    bound = max(bounds, key=bounds.get)
+
+    return ChunkPlan(
+        chunk_tokens=per_chunk,
+        num_chunks=num_chunks,
+        parallelism=parallelism,
+        requests=requests,
+        total_tokens=total,
+        est_seconds=bounds[bound],
+        bound=bound
+    )
+
+
+def candidate_plans(
+    total_tokens: int,
+    num_patterns: int,
+    model: str,
+    parallelism: int = 1,
+    max_chunk_tokens: Optional[int] = None,
+    profile: Optional[ThroughputProfile] = None,
+    overlap_tokens: int = 200,
+    join: bool = False
+) -> List[ChunkPlan]:
+    """Estimate every even split of the transcript that fits the model.
+
+    Args:
+        total_tokens: Transcript tokens
+        num_patterns: Patterns run over every chunk
+        model: Model name or alias
+        parallelism: Concurrent requests per pattern
+        max_chunk_tokens: Optional user cap on chunk size
+        profile: Throughput profile (default: built-in)
+        overlap_tokens: Overlap between consecutive chunks
+        join: Whether multi-chunk outputs are joined with an extra request
+
+    Returns:
+        List of ChunkPlan, fastest first
+    """
+    profile = profile or ThroughputProfile()
+    upper = max_chunk_for_model(model, profile)
+    if max_chunk_tokens:
+        upper = min(upper, max_chunk_tokens)
+    lower = min(MIN_CHUNK_TOKENS, upper)
+
+    plans = []
+    seen = set()
+    max_chunks = max(1, math.ceil(total_tokens / lower))
+    for n in range(1, max_chunks + 1):
+        # Even split into n chunks, accounting for the overlap each one repeats
+        size = math.ceil((total_tokens + (n - 1) * overlap_tokens) / n)
+        if size > upper:
+            continue
+        size = max(size, lower)
+        if size in seen:
+            continue
+        seen.add(size)
+        plans.append(estimate_run(
+            total_tokens, size, num_patterns, model,
+            parallelism=parallelism,
+            profile=profile,
+            overlap_tokens=overlap_tokens,
+            join=join
+        ))
+        if size == lower:
+            break
+
+    if not plans:
+        plans.append(estimate_run(
+            total_tokens, upper, num_patterns, model,
+            parallelism=parallelism,
+            profile=profile,
+            overlap_tokens=overlap_tokens,
+            join=join
+        ))
+
+    # Ties go to fewer chunks (less repeated overhead)
+    return sorted(plans, key=lambda p: (round(p.est_seconds, 1), p.num_chunks))
+
+
+def plan_chunks(
+    total_tokens: int,
+    num_patterns: int,
+    model: str,
+    parallelism: int = 1,
+    max_chunk_tokens: Optional[int] = None,
+    profile: Optional[ThroughputProfile] = None,
+    overlap_tokens: int = 200,
+    join: bool = False
+) -> ChunkPlan:
+    """Pick the chunk size with the lowest estimated wall time.
+
+    Args:
+        total_tokens: Transcript tokens
+        num_patterns: Patterns run over every chunk
+        model: Model name or alias
+        parallelism: Concurrent requests per pattern
+        max_chunk_tokens: Optional user cap on chunk size
+        profile: Throughput profile (default: built-in)
+        overlap_tokens: Overlap between consecutive chunks
+        join: Whether multi-chunk outputs are joined with an extra request
+
+    Returns:
+        ChunkPlan: Fastest plan
+    """
+    return candidate_plans(
+        total_tokens, num_patterns, model,
+        parallelism=parallelism,
+        max_chunk_tokens=max_chunk_tokens,
+        profile=profile,
+        overlap_tokens=overlap_tokens,
+        join=join
+    )[0]
+
+
+def record_timing(
+    log_path: Path,
+    model: str,
+    pattern: str,
+    input_tokens: int,
+    output_tokens: int,
+    seconds: float,
+    success: bool
+) -> None:
+    """Append one request timing to the JSON-lines log.
+
+    Args:
+        log_path: Timings log (e.g., $OBSVAULT/youtube/.cache/timings.jsonl)
+        model: Model used
+        pattern: Pattern name
+        input_tokens: Estimated input tokens
+        output_tokens: Estimated output tokens
+        seconds: Wall time of the request (including retries)
+        success: Whether the request succeeded
+    """
+    record = {
+        "timestamp": time.time(),
+        "model": model,
+        "pattern": pattern,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "seconds": round(seconds, 3),
+        "success": success
+    }
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    # Single small O_APPEND write: safe with concurrent writers
+    with open(log_path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def load_timings(log_path: Path, model: Optional[str] = None) -> List[Dict]:
+    """Load recorded timings, optionally only for one model.
+
+    Args:
+        log_path: Timings log
+        model: Optional model name to filter by
+
+    Returns:
+        List of timing records (oldest first); empty if no log
+    """
+    records = []
+    try:
+        with open(log_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if model is None or record.get("model") == model:
+                    records.append(record)
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def load_profile(log_path: Optional[Path], model: str) -> ThroughputProfile:
+    """Fit a throughput profile from the most recent timings for a model.
+
+    Args:
+        log_path: Timings log (None = defaults)
+        model: Model name or alias
+
+    Returns:
+        ThroughputProfile: Fitted profile, or defaults without enough data
+    """
+    if log_path is None:
+        return ThroughputProfile()
+    return ThroughputProfile.from_records(load_timings(log_path, model)[-PROFILE_SAMPLE_SIZE:])
+
+
+def _model_rpm(model: str) -> int:
+    """Requests per minute for a model (30 if unknown)"""
+    if model in GROQ_MODELS:
+        return GROQ_MODELS[model].rpm
+    for candidate in GROQ_MODELS.values():
+        if candidate.name == model:
+            return candidate.rpm
+    return 30
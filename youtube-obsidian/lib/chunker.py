@@ -12,7 +12,13 @@ from pathlib import Path
 from typing import List, Dict, Optional
 
 from . import token_counter
-from .packet_builder import create_packet, EnrichedPacket, VideoContext
+from .packet_builder import (
+    create_packet,
+    build_shared_preamble,
+    EnrichedPacket,
+    SharedPreamble,
+    VideoContext
+)
 from .metadata_extractor import GlobalMetadata
 
 
@@ -22,16 +28,21 @@ class TranscriptChunker:
     def __init__(
         self,
         max_chunk_tokens: int = 8000,
-        overlap_tokens: int = 200
+        overlap_tokens: int = 200,
+        preamble_fraction: Optional[float] = None
     ):
         """Initialize chunker.
         
         Args:
             max_chunk_tokens: Maximum tokens per chunk (default: 8000)
             overlap_tokens: Overlap between chunks (default: 200)
+            preamble_fraction: If set, render the context preamble once per
+                video and shrink it to at most this fraction of
+                max_chunk_tokens (default: None, per-packet preamble)
         """
         self.max_chunk_tokens = max_chunk_tokens
         self.overlap_tokens = overlap_tokens
+        self.preamble_fraction = preamble_fraction
     
     def chunk_and_enrich(
         self,
@@ -70,6 +81,11 @@ class TranscriptChunker:
             video_context = VideoContext.from_video_info(video_info)
             print(f"   📺 Video context: {video_context.channel_name} | {len(video_context.tags)} tags")
         
+        # Render the shared preamble once for all packets
+        shared_preamble = None
+        if self.preamble_fraction:
+            shared_preamble = self._build_shared_preamble(video_title, metadata, video_context)
+        
         # Step 1: Analyze transcript
         total_tokens = token_counter.count_tokens(transcript)
         total_length = len(transcript)
@@ -85,7 +101,8 @@ class TranscriptChunker:
                 video_duration_seconds,
                 metadata,
                 total_tokens,
-                video_context=video_context
+                video_context=video_context,
+                shared_preamble=shared_preamble
             )
         else:
             # Calculate optimal chunk size
@@ -120,7 +137,8 @@ class TranscriptChunker:
                 chunks,
                 video_title,
                 metadata,
-                video_context=video_context
+                video_context=video_context,
+                shared_preamble=shared_preamble
             )
         
         # Step 6: Save if requested
@@ -129,6 +147,42 @@ class TranscriptChunker:
         
         return packets
     
+    def _build_shared_preamble(
+        self,
+        video_title: str,
+        metadata: GlobalMetadata,
+        video_context: Optional[VideoContext]
+    ) -> SharedPreamble:
+        """Render the context preamble once, within the configured token budget.
+        
+        Args:
+            video_title: Video title
+            metadata: Global metadata from Phase 1
+            video_context: Optional VideoContext with YouTube metadata
+        
+        Returns:
+            SharedPreamble: Rendered preamble shared by all packets
+        """
+        budget = int(self.max_chunk_tokens * self.preamble_fraction)
+        preamble = build_shared_preamble(
+            video_title=video_title,
+            video_summary=metadata.summary,
+            key_topics=metadata.topics,
+            video_context=video_context,
+            max_tokens=budget,
+            count_tokens=token_counter.count_tokens
+        )
+        
+        share = preamble.token_count / self.max_chunk_tokens * 100
+        print(
+            f"   📎 Shared preamble: {preamble.token_count} tokens ({share:.1f}% of chunk budget, "
+            f"{preamble.max_tags} tags, {preamble.description_words} description words)"
+        )
+        if not preamble.fits_budget:
+            print(f"   ⚠️  Preamble still exceeds its {budget}-token budget after shrinking")
+        
+        return preamble
+    
     def _create_single_packet(
         self,
         transcript: str,
@@ -136,7 +190,8 @@ class TranscriptChunker:
         video_duration_seconds: int,
         metadata: GlobalMetadata,
         token_count: int,
-        video_context: Optional[VideoContext] = None
+        video_context: Optional[VideoContext] = None,
+        shared_preamble: Optional[SharedPreamble] = None
     ) -> List[EnrichedPacket]:
         """Create a single enriched packet (no chunking needed).
         
@@ -147,6 +202,7 @@ class TranscriptChunker:
             metadata: Global metadata
             token_count: Pre-calculated token count
             video_context: Optional VideoContext with YouTube metadata (V4.0)
+            shared_preamble: Optional preamble rendered once per video
         
         Returns:
             List with single EnrichedPacket
@@ -165,7 +221,8 @@ class TranscriptChunker:
             ),
             transcript_segment=transcript,
             token_count=token_count,
-            video_context=video_context
+            video_context=video_context,
+            shared_preamble=shared_preamble
         )
         
         return [packet]
@@ -175,7 +232,8 @@ class TranscriptChunker:
         chunks: List[Dict],
         video_title: str,
         metadata: GlobalMetadata,
-        video_context: Optional[VideoContext] = None
+        video_context: Optional[VideoContext] = None,
+        shared_preamble: Optional[SharedPreamble] = None
     ) -> List[EnrichedPacket]:
         """Create enriched packets from chunks.
         
@@ -184,6 +242,7 @@ class TranscriptChunker:
             video_title: Video title
             metadata: Global metadata
             video_context: Optional VideoContext with YouTube metadata (V4.0)
+            shared_preamble: Optional preamble rendered once per video
         
         Returns:
             List[EnrichedPacket]: Enriched packets
@@ -202,7 +261,8 @@ class TranscriptChunker:
                 timestamp_range=chunk['timestamp_range'],
                 transcript_segment=chunk['text'],
                 token_count=chunk['token_count'],
-                video_context=video_context
+                video_context=video_context,
+                shared_preamble=shared_preamble
             )
             packets.append(packet)
         
@@ -254,7 +314,8 @@ def chunk_transcript(
     max_chunk_tokens: int = 8000,
     overlap_tokens: int = 200,
     save_dir: Optional[Path] = None,
-    video_info: Optional[Dict] = None
+    video_info: Optional[Dict] = None,
+    preamble_fraction: Optional[float] = None
 ) -> List[EnrichedPacket]:
     """Convenience function for transcript chunking.
     
@@ -267,13 +328,16 @@ def chunk_transcript(
         overlap_tokens: Overlap between chunks (default: 200)
         save_dir: Optional save directory
         video_info: Optional dict from extractor with YouTube metadata (V4.0)
+        preamble_fraction: Render the preamble once per video, capped at this
+            fraction of max_chunk_tokens (default: None, per-packet preamble)
     
     Returns:
         List[EnrichedPacket]: Enriched packets ready for processing
     """
     chunker = TranscriptChunker(
         max_chunk_tokens=max_chunk_tokens,
-        overlap_tokens=overlap_tokens
+        overlap_tokens=overlap_tokens,
+        preamble_fraction=preamble_fraction
     )
     
     return chunker.chunk_and_enrich(
@@ -5,7 +5,6 @@ Handles loading, creating, and managing user configuration from ~/.yt-obsidian/c
 """
 
 import os
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
@@ -50,6 +49,18 @@ class Config:
     fabric_command: str = "fabric-ai"
     timeout_per_pattern: int = 120
     chunk_size: int = 8000
+    adaptive_chunking: bool = False  # Plan chunk size per run (chunk_size becomes the cap)
+    parallelism: int = 1  # Chunks processed concurrently per pattern
+    preamble_fraction: float = 0.15  # Max share of chunk_size for the context preamble
+    
+    # Phase 1 (global metadata) settings
+    phase1_combined: bool = False  # One JSON request instead of three patterns
+    
+    # Transcript settings
+    sound_markers: Optional[list] = None  # None = built-in list (lib.transcript)
+    
+    # Cache settings
+    cache_backend: str = "json"  # json (one file per video) or sqlite
     
 
 DEFAULT_CONFIG_CONTENT = """# yt - YouTube to Obsidian Configuration
@@ -162,7 +173,53 @@ expert:
   timeout_per_pattern: 120
   
   # Chunk size for large transcripts (tokens)
+  # With adaptive_chunking this is the upper bound, not a fixed size
   chunk_size: 8000
+  
+  # Pick the chunk size per run from the model's TPM/context limits, the
+  # number of patterns, parallelism and recorded request timings
+  # (.cache/timings.jsonl), minimizing estimated wall time. Off by default:
+  # when enabled, chunks can come out well below chunk_size (about 4.5K
+  # tokens for a 6K TPM model), i.e. more chunks and more join calls
+  adaptive_chunking: false
+  
+  # Chunks sent concurrently per pattern (1 = sequential with delays)
+  parallelism: 1
+  
+  # Max share of chunk_size the per-chunk context preamble (channel, tags,
+  # description, summary, topics) may use. The preamble is rendered once per
+  # video and tags/description are trimmed until it fits. 0 disables this.
+  preamble_fraction: 0.15
+
+# ============================================================================
+# PHASE 1 SETTINGS
+# ============================================================================
+phase1:
+  # Extract summary, theme and topics with ONE request returning JSON
+  # (pattern: youtube_phase1_metadata from fabric-custom-patterns) instead
+  # of three separate patterns. Falls back to the three patterns if the
+  # pattern is missing or its output is not valid JSON.
+  combined: false
+
+# ============================================================================
+# TRANSCRIPT SETTINGS
+# ============================================================================
+transcript:
+  # Sound markers stripped from transcripts, e.g. "[Music]" or "(applause)"
+  # (case-insensitive). Leave unset for the built-in multilingual list.
+  # sound_markers: [music, applause, laughter]
+
+# ============================================================================
+# CACHE SETTINGS
+# ============================================================================
+cache:
+  # Storage backend for the processing cache ($OBSVAULT/youtube/.cache)
+  # Options: json, sqlite
+  #
+  # - json:   One JSON file per video plus index.json (default)
+  # - sqlite: Single WAL-mode database, fast stats/listings for large vaults
+  #           (existing JSON caches are imported automatically on first use)
+  backend: json
 """
 
 
@@ -209,6 +266,8 @@ def load_config() -> Config:
     
     # Try to load existing config
     try:
+        import yaml  # Deferred: only needed once a config file exists
+        
         with open(config_path, 'r') as f:
             user_config = yaml.safe_load(f)
         
@@ -252,6 +311,24 @@ def load_config() -> Config:
             config.fabric_command = expert.get('fabric_command', config.fabric_command)
             config.timeout_per_pattern = expert.get('timeout_per_pattern', config.timeout_per_pattern)
             config.chunk_size = expert.get('chunk_size', config.chunk_size)
+            config.adaptive_chunking = expert.get('adaptive_chunking', config.adaptive_chunking)
+            config.parallelism = expert.get('parallelism', config.parallelism)
+            config.preamble_fraction = expert.get('preamble_fraction', config.preamble_fraction)
+        
+        # Phase 1 settings
+        if 'phase1' in user_config:
+            phase1 = user_config['phase1']
+            config.phase1_combined = phase1.get('combined', config.phase1_combined)
+        
+        # Transcript settings
+        if user_config.get('transcript'):
+            transcript = user_config['transcript']
+            config.sound_markers = transcript.get('sound_markers', config.sound_markers)
+        
+        # Cache settings
+        if 'cache' in user_config:
+            cache = user_config['cache']
+            config.cache_backend = cache.get('backend', config.cache_backend)
         
         return config
         
@@ -67,7 +67,8 @@ def extract_metadata(
     url: str, 
     cookies_browser: Optional[str] = None,
     extract_transcript: bool = True,
-    transcript_lang: str = 'en'
+    transcript_lang: str = 'en',
+    sound_markers: Optional[Sequence[str]] = None
 ) -> Dict[str, Any]:
     """
     Extract video metadata and transcript using yt-dlp library mode.
@@ -78,6 +79,8 @@ def extract_metadata(
                         (e.g., "firefox", "chrome") for age-restricted videos
         extract_transcript: Whether to extract transcript (default: True)
         transcript_lang: Preferred transcript language (default: 'en')
+        sound_markers: Marker words stripped from the transcript
+                      (default: DEFAULT_SOUND_MARKERS in lib.transcript)
 
     Returns:
         Dictionary containing:
@@ -128,7 +131,9 @@ def extract_metadata(
         
         if extract_transcript:
             try:
-                transcript = extract_transcript_from_info(info, lang=transcript_lang)
+                transcript = extract_transcript_from_info(
+                    info, lang=transcript_lang, sound_markers=sound_markers
+                )
                 transcript_info = get_transcript_metadata(info, transcript, lang=transcript_lang)
             except Exception as e:
                 # Graceful degradation: continue even if transcript fails
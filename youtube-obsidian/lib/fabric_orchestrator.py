@@ -14,26 +14,48 @@ The orchestrator handles:
 - Debug/streaming mode for real-time visibility
 """
 
+import json
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 
 from .metadata_extractor import MetadataExtractor, GlobalMetadata
+from . import token_counter
 from .chunker import chunk_transcript
+from .chunk_planner import candidate_plans, load_profile, record_timing
 from .packet_builder import EnrichedPacket
 from .markdown_utils import format_combined_output
+from .filesystem import atomic_write_text
 from .rate_limiter import (
     RateLimitHandler, 
     RetryConfig, 
+    RECOMMENDED_MODELS,
     parse_thinking_tags,
     resolve_model_name,
     validate_request_size,
-    estimate_tokens
+    estimate_tokens,
+    get_model_context_window,
+    get_model_tpm,
+    MAX_REQUEST_TOKENS
 )
 
+# Share of a request's token limit a join batch may fill (rest is headroom
+# for the join pattern's system prompt and the model's output)
+JOIN_INPUT_FRACTION = 0.6
+# Upper bound on concurrent join calls per reduce level
+JOIN_MAX_WORKERS = 4
+
+# Per-pattern manifest of completed chunks (lives next to chunk_NNN.md)
+CHECKPOINT_FILENAME = "checkpoint.json"
+
+# Adaptive chunk size chosen for a video (in save_dir), reused on --resume
+CHUNK_PLAN_FILENAME = "chunk_plan.json"
+
 
 @dataclass
 class PatternResult:
@@ -42,10 +64,13 @@ class PatternResult:
     Attributes:
         pattern_name: Name of the Fabric pattern used
         success: Whether pattern completed successfully
-        outputs: List of outputs (one per chunk)
+        outputs: List of outputs in chunk order (on failure, only the chunks
+            that completed; use chunk_outputs for chunk numbers)
         error: Error message if failed
         combined_output: Final combined output text
         timing: Processing time in seconds per chunk
+        chunk_outputs: One-based chunk number -> output (same numbering as
+            chunk_NNN.md and the checkpoint manifest)
     """
     pattern_name: str
     success: bool
@@ -53,6 +78,26 @@ class PatternResult:
     error: Optional[str] = None
     combined_output: str = ""
     timing: List[float] = field(default_factory=list)
+    chunk_outputs: Dict[int, str] = field(default_factory=dict)
+
+
+@dataclass
+class JoinPart:
+    """One input to a join call in the hierarchical reduce.
+    
+    Attributes:
+        text: Chunk output, or the joined output of a lower reduce level
+        start_time: Timestamp where the covered range starts (HH:MM:SS)
+        end_time: Timestamp where the covered range ends (HH:MM:SS)
+    """
+    text: str
+    start_time: str
+    end_time: str
+    
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens of the text (without system prompt overhead)"""
+        return int(len(self.text.split()) * 1.3)
 
 
 @dataclass
@@ -86,7 +131,13 @@ class FabricOrchestrator:
         save_dir: Optional[Path] = None,
         debug: bool = False,
         stream: bool = False,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        resume: bool = False,
+        preamble_fraction: Optional[float] = None,
+        adaptive_chunking: bool = False,
+        parallelism: int = 1,
+        timings_log: Optional[Path] = None,
+        phase1_combined: bool = False
     ):
         """Initialize Fabric orchestrator.
         
@@ -100,6 +151,17 @@ class FabricOrchestrator:
             debug: Enable debug mode with detailed output
             stream: Enable streaming mode to see Fabric output in real-time
             model: Optional LLM model override (e.g., "llama-4-scout")
+            resume: Reuse checkpointed chunk outputs and Phase 1 results
+                from save_dir, running only the missing chunks
+            preamble_fraction: Render the chunk preamble once per video and
+                keep it under this fraction of max_chunk_tokens (None = off)
+            adaptive_chunking: Plan the chunk size per run from the model's
+                limits and recorded timings (max_chunk_tokens becomes a cap)
+            parallelism: Chunks processed concurrently per pattern (default: 1)
+            timings_log: Optional JSON-lines file to record request timings
+                in and fit the planner's latency profile from
+            phase1_combined: Run Phase 1 as one JSON request instead of three
+                patterns (falls back to the three patterns on failure)
         """
         self.fabric_command = fabric_command
         self.patterns = patterns or ["youtube_summary"]
@@ -109,6 +171,12 @@ class FabricOrchestrator:
         self.save_dir = save_dir
         self.debug = debug
         self.stream = stream
+        self.resume = resume and save_dir is not None
+        self.preamble_fraction = preamble_fraction
+        self.adaptive_chunking = adaptive_chunking
+        self.parallelism = max(1, parallelism)
+        self.timings_log = timings_log
+        self._checkpoint_lock = threading.Lock()  # Parallel chunks share the manifest
         # Resolve model alias to full name for Fabric CLI
         self.model = resolve_model_name(model) if model else None
         
@@ -116,7 +184,8 @@ class FabricOrchestrator:
         self.metadata_extractor = MetadataExtractor(
             fabric_command=fabric_command,
             timeout=timeout,
-            model=self.model  # Pass model to Phase 1 too
+            model=self.model,  # Pass model to Phase 1 too
+            combined=phase1_combined
         )
     
     def _log(self, msg: str, level: str = "info"):
@@ -163,6 +232,8 @@ class FabricOrchestrator:
         
         print("\n🎬 Starting Fabric orchestration...")
         print(f"   Patterns: {', '.join(self.patterns)}")
+        if self.resume:
+            print(f"   Resuming from checkpoints in {self.save_dir}")
         
         if self.debug:
             word_count = len(transcript.split())
@@ -180,7 +251,8 @@ class FabricOrchestrator:
         metadata = self.metadata_extractor.extract(
             transcript=transcript,
             video_title=video_title,
-            save_dir=metadata_save_dir
+            save_dir=metadata_save_dir,
+            reuse_saved=self.resume
         )
         
         phase1_time = time.time() - phase1_start
@@ -202,14 +274,22 @@ class FabricOrchestrator:
         print("✂️  Chunking and enriching transcript")
         chunk_start = time.time()
         
+        chunk_tokens = self.max_chunk_tokens
+        if self.adaptive_chunking:
+            # A resumed run must chunk exactly like the failed one, or every
+            # packet hash changes and no checkpoint matches
+            chunk_tokens = (self.resume and self._load_chunk_plan()) or self._plan_chunk_size(transcript)
+            self._save_chunk_plan(chunk_tokens)
+        
         packets = chunk_transcript(
             transcript=transcript,
             video_title=video_title,
             video_duration_seconds=video_duration_seconds,
             metadata=metadata,
-            max_chunk_tokens=self.max_chunk_tokens,
+            max_chunk_tokens=chunk_tokens,
             save_dir=self.save_dir,
-            video_info=video_info  # V4.0: Pass video_info for VideoContext enrichment
+            video_info=video_info,  # V4.0: Pass video_info for VideoContext enrichment
+            preamble_fraction=self.preamble_fraction
         )
         
         chunk_time = time.time() - chunk_start
@@ -277,7 +357,8 @@ class FabricOrchestrator:
     ) -> PatternResult:
         """Process all packets through a single pattern.
         
-        Includes inter-chunk delay to avoid rate limits.
+        Runs chunks one at a time with an inter-chunk delay to avoid rate
+        limits, or up to `parallelism` chunks concurrently (not in stream mode).
         
         Args:
             pattern: Fabric pattern name
@@ -286,67 +367,218 @@ class FabricOrchestrator:
         Returns:
             PatternResult: Results from processing pattern
         """
-        outputs = []
-        timing = []
         total = len(packets)
-        
-        # Calculate delay between chunks based on estimated tokens
-        # This helps avoid hitting rate limits on consecutive requests
-        inter_chunk_delay = 2.0 if total > 3 else 0.5
-        
-        for i, packet in enumerate(packets, 1):
-            print(f"      Chunk {i}/{total}...", end=" ", flush=True)
-            
-            if self.debug:
-                est_tokens = estimate_tokens(packet.to_fabric_input())
-                self._log(f"\n      Input tokens: ~{est_tokens}", "debug")
-            
-            # Get Fabric-ready input
-            fabric_input = packet.to_fabric_input()
-            
-            # Run pattern (with or without streaming)
-            chunk_start = time.time()
-            
-            if self.stream:
-                result = self._run_fabric_pattern_streaming(pattern, fabric_input, i, total)
-            else:
-                result = self._run_fabric_pattern(pattern, fabric_input)
-            
-            chunk_time = time.time() - chunk_start
-            timing.append(chunk_time)
+        restored = self._load_checkpoints(pattern, packets) if self.resume else {}
+        outputs_by_chunk: Dict[int, str] = {}
+        timing_by_chunk: Dict[int, float] = {}
+        failure: Optional[Tuple[int, str]] = None
+        
+        for i in sorted(restored):
+            outputs_by_chunk[i] = restored[i]
+            timing_by_chunk[i] = 0.0
+            print(f"      Chunk {i}/{total}... ↺ (checkpoint, {len(restored[i])} chars)")
+        
+        pending = [(i, packet) for i, packet in enumerate(packets, 1) if i not in restored]
+        
+        if self.parallelism > 1 and not self.stream and len(pending) > 1:
+            workers = min(self.parallelism, len(pending))
+            pool = ThreadPoolExecutor(max_workers=workers)
+            futures = {
+                pool.submit(self._run_chunk, pattern, packet, i, total): i
+                for i, packet in pending
+            }
+            try:
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    
+                    i = futures[future]
+                    result, chunk_time = future.result()
+                    timing_by_chunk[i] = chunk_time
+                    
+                    if result["success"]:
+                        # In-flight chunks still finish (and checkpoint) after a failure
+                        outputs_by_chunk[i] = result["output"]
+                        print(f"      Chunk {i}/{total}... ✓ ({chunk_time:.1f}s, {len(result['output'])} chars)")
+                    else:
+                        error_msg = result.get("error", "Unknown error")
+                        print(f"      Chunk {i}/{total}... ✗ ({error_msg})")
+                        if failure is None or i < failure[0]:
+                            failure = (i, error_msg)
+                        # Don't spend more TPM on a pattern that already failed
+                        for other in futures:
+                            other.cancel()
+            finally:
+                pool.shutdown(wait=True)
+        else:
+            # Calculate delay between chunks based on estimated tokens
+            # This helps avoid hitting rate limits on consecutive requests
+            inter_chunk_delay = 2.0 if total > 3 else 0.5
             
-            if result["success"]:
-                outputs.append(result["output"])
-                output_len = len(result["output"])
+            for i, packet in pending:
+                print(f"      Chunk {i}/{total}...", end=" ", flush=True)
+                
+                result, chunk_time = self._run_chunk(pattern, packet, i, total)
+                timing_by_chunk[i] = chunk_time
+                
+                if not result["success"]:
+                    error_msg = result.get("error", "Unknown error")
+                    print(f"✗ ({error_msg})")
+                    failure = (i, error_msg)
+                    break
+                
+                outputs_by_chunk[i] = result["output"]
                 if not self.stream:
-                    print(f"✓ ({chunk_time:.1f}s, {output_len} chars)")
+                    print(f"✓ ({chunk_time:.1f}s, {len(result['output'])} chars)")
                 
                 # Add delay between chunks to avoid rate limits
                 if i < total and inter_chunk_delay > 0:
                     if self.debug:
                         self._log(f"Waiting {inter_chunk_delay}s before next chunk...", "debug")
                     time.sleep(inter_chunk_delay)
-            else:
-                error_msg = result.get("error", "Unknown error")
-                print(f"✗ ({error_msg})")
-                return PatternResult(
-                    pattern_name=pattern,
-                    success=False,
-                    outputs=outputs,
-                    error=f"Chunk {i} failed: {error_msg}",
-                    timing=timing
-                )
+        
+        # outputs_by_chunk stays keyed by chunk number: after a parallel
+        # failure it has holes, and list positions would no longer match
+        outputs_by_chunk = dict(sorted(outputs_by_chunk.items()))
+        outputs = list(outputs_by_chunk.values())
+        timing = [timing_by_chunk[i] for i in sorted(timing_by_chunk)]
+        
+        if failure:
+            failed_chunk, error_msg = failure
+            if self.save_dir:
+                print(f"      💡 {len(outputs)} chunk(s) checkpointed; re-run with --resume to continue")
+            return PatternResult(
+                pattern_name=pattern,
+                success=False,
+                outputs=outputs,
+                error=f"Chunk {failed_chunk} failed: {error_msg}",
+                timing=timing,
+                chunk_outputs=outputs_by_chunk
+            )
         
         # Combine outputs
         print(f"      Combining {len(outputs)} outputs...")
-        combined = self._combine_outputs(pattern, outputs, packets)
+        combined = self._combine_outputs(pattern, outputs_by_chunk, packets)
         
         return PatternResult(
             pattern_name=pattern,
             success=True,
             outputs=outputs,
             combined_output=combined,
-            timing=timing
+            timing=timing,
+            chunk_outputs=outputs_by_chunk
+        )
+    
+    def _run_chunk(
+        self,
+        pattern: str,
+        packet: EnrichedPacket,
+        index: int,
+        total: int
+    ) -> Tuple[Dict, float]:
+        """Run one packet through a pattern, checkpointing and timing it.
+        
+        Args:
+            pattern: Pattern name
+            packet: Packet to process
+            index: One-based chunk number
+            total: Total number of chunks
+        
+        Returns:
+            Tuple of (result dict from _run_fabric_pattern, seconds taken)
+        """
+        # Get Fabric-ready input
+        fabric_input = packet.to_fabric_input()
+        input_tokens = estimate_tokens(fabric_input)
+        
+        if self.debug:
+            self._log(f"\n      Input tokens: ~{input_tokens}", "debug")
+        
+        # Run pattern (with or without streaming)
+        chunk_start = time.time()
+        
+        if self.stream:
+            result = self._run_fabric_pattern_streaming(pattern, fabric_input, index, total)
+        else:
+            result = self._run_fabric_pattern(pattern, fabric_input)
+        
+        chunk_time = time.time() - chunk_start
+        
+        if result["success"]:
+            self._save_checkpoint(pattern, index, packet, result["output"])
+        
+        if self.timings_log:
+            record_timing(
+                self.timings_log,
+                model=self._planning_model(),
+                pattern=pattern,
+                input_tokens=input_tokens,
+                output_tokens=int(len(result.get("output", "").split()) * 1.3),
+                seconds=chunk_time,
+                success=result["success"]
+            )
+        
+        return result, chunk_time
+    
+    def _planning_model(self) -> str:
+        """Model whose limits drive chunk planning (Fabric's default if none set)."""
+        return self.model or resolve_model_name(RECOMMENDED_MODELS["default"])
+    
+    def _plan_chunk_size(self, transcript: str) -> int:
+        """Choose max_chunk_tokens for this run from model limits and timings.
+        
+        Args:
+            transcript: Full transcript text
+        
+        Returns:
+            int: Chunk size to use (never above max_chunk_tokens)
+        """
+        model = self._planning_model()
+        profile = load_profile(self.timings_log, model)
+        total_tokens = token_counter.count_tokens(transcript)
+        
+        candidates = candidate_plans(
+            total_tokens,
+            num_patterns=len(self.patterns),
+            model=model,
+            parallelism=self.parallelism,
+            max_chunk_tokens=self.max_chunk_tokens,
+            profile=profile,
+            join=bool(self.join_pattern)
+        )
+        plan = candidates[0]
+        
+        source = f"{profile.samples} recorded timings" if profile.samples else "default latency profile"
+        print(f"📐 Chunk plan: {plan.describe()}")
+        print(f"   Model: {model.split('/')[-1]} | {len(self.patterns)} pattern(s) | {source}")
+        
+        if self.debug:
+            for alternative in candidates[1:4]:
+                self._log(f"  Alternative: {alternative.describe()}", "debug")
+        
+        return plan.chunk_tokens
+    
+    def _load_chunk_plan(self) -> Optional[int]:
+        """Chunk size saved by a previous run of this video (None if missing or above the cap)."""
+        try:
+            plan = json.loads((self.save_dir / CHUNK_PLAN_FILENAME).read_text())
+            chunk_tokens = int(plan["chunk_tokens"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        if not 0 < chunk_tokens <= self.max_chunk_tokens:
+            return None
+        print(f"📐 Chunk plan: reusing {chunk_tokens} tokens/chunk from the interrupted run")
+        return chunk_tokens
+    
+    def _save_chunk_plan(self, chunk_tokens: int):
+        """Record the chunk size used, so --resume can rebuild the same packets."""
+        if not self.save_dir:
+            return
+        self.save_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(
+            self.save_dir / CHUNK_PLAN_FILENAME,
+            json.dumps({"chunk_tokens": chunk_tokens, "model": self._planning_model()}, indent=2)
         )
     
     def _run_fabric_pattern(
@@ -534,15 +766,16 @@ class FabricOrchestrator:
     def _combine_outputs(
         self,
         pattern: str,
-        outputs: List[str],
+        outputs: Dict[int, str],
         packets: List[EnrichedPacket]
     ) -> str:
         """Combine multiple outputs from chunked processing.
         
         If single chunk, format and return.
         If multiple chunks:
-          1. If join_pattern is set, run it on combined outputs
-          2. Otherwise, concatenate and format
+          1. If join_pattern is set, tree-reduce the outputs with it
+             (see _tree_join)
+          2. Otherwise (or if joining fails), concatenate and format
         
         The formatting pipeline:
         1. Combine all chunk outputs
@@ -553,7 +786,7 @@ class FabricOrchestrator:
         
         Args:
             pattern: Pattern name
-            outputs: List of pattern outputs (one per chunk)
+            outputs: One-based chunk number -> pattern output
             packets: List of enriched packets (for metadata)
         
         Returns:
@@ -562,42 +795,34 @@ class FabricOrchestrator:
         if len(outputs) == 1:
             # Single chunk - just normalize headings
             return format_combined_output(
-                outputs[0],
+                next(iter(outputs.values())),
                 base_heading_level=4,  # Start at #### within AI Analysis section
                 keep_chunk_markers=False,
                 clean_rules=True
             )
         
-        # Multi-part output: first combine raw with separators
-        combined_parts = []
-        
-        for i, (output, packet) in enumerate(zip(outputs, packets), 1):
-            start_time, end_time = packet.timestamp_range
-            combined_parts.append(f"## Part {i}/{len(outputs)}")
-            combined_parts.append(f"*Timestamp: {start_time} - {end_time}*")
-            combined_parts.append("")
-            combined_parts.append(output)
-            combined_parts.append("")
-            combined_parts.append("---")
-            combined_parts.append("")
+        parts = [
+            JoinPart(
+                text=outputs[i],
+                start_time=packets[i - 1].timestamp_range[0],
+                end_time=packets[i - 1].timestamp_range[1]
+            )
+            for i in sorted(outputs)
+        ]
         
-        raw_combined = "\n".join(combined_parts)
+        # Multi-part output: first combine raw with separators
+        final_output = self._render_join_input(parts)
         
-        # If join_pattern is configured, run it on combined outputs
-        final_output = raw_combined
+        # If join_pattern is configured, tree-reduce the chunk outputs with it
         if self.join_pattern and len(outputs) > 1:
-            print(f"      🔗 Joining {len(outputs)} chunks with '{self.join_pattern}' pattern...")
-            
-            join_result = self._run_fabric_pattern(self.join_pattern, raw_combined)
+            joined = self._tree_join(parts)
             
-            if join_result["success"]:
-                final_output = join_result["output"]
+            if joined is not None:
+                final_output = joined
                 if self.debug:
                     self._log(f"Join pattern produced {len(final_output)} chars", "debug")
             else:
-                # Fall back to simple concatenation if join fails
-                error_msg = join_result.get("error", "Unknown error")
-                print(f"      ⚠️  Join pattern failed: {error_msg}, using concatenation")
+                print(f"      ⚠️  Join pattern could not reduce outputs, using concatenation")
         
         # Apply formatting pipeline
         formatted = format_combined_output(
@@ -609,11 +834,202 @@ class FabricOrchestrator:
         
         return formatted
     
+    def _render_join_input(self, parts: List[JoinPart]) -> str:
+        """Render parts with Part X/Y and timestamp markers for a join call."""
+        combined_parts = []
+        
+        for i, part in enumerate(parts, 1):
+            combined_parts.append(f"## Part {i}/{len(parts)}")
+            combined_parts.append(f"*Timestamp: {part.start_time} - {part.end_time}*")
+            combined_parts.append("")
+            combined_parts.append(part.text)
+            combined_parts.append("")
+            combined_parts.append("---")
+            combined_parts.append("")
+        
+        return "\n".join(combined_parts)
+    
+    def _join_budget(self) -> int:
+        """Max estimated input tokens for one join call, from the model's limits."""
+        request_limit = MAX_REQUEST_TOKENS
+        if self.model:
+            request_limit = min(request_limit, get_model_context_window(self.model))
+        
+        # estimate_tokens() adds a fixed system prompt overhead to every request
+        system_overhead = estimate_tokens("")
+        return int(request_limit * JOIN_INPUT_FRACTION) - system_overhead
+    
+    def _plan_join_batches(self, parts: List[JoinPart], budget: int) -> List[List[JoinPart]]:
+        """Group consecutive parts into batches that fit the token budget.
+        
+        Fan-in is derived from the budget and the average part size, so
+        small outputs are joined many at a time and large ones a few at a time.
+        """
+        avg_tokens = max(1, sum(p.tokens for p in parts) // len(parts))
+        fan_in = max(2, budget // avg_tokens)
+        
+        batches: List[List[JoinPart]] = []
+        current: List[JoinPart] = []
+        current_tokens = 0
+        
+        for part in parts:
+            if current and (current_tokens + part.tokens > budget or len(current) >= fan_in):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(part)
+            current_tokens += part.tokens
+        
+        if current:
+            batches.append(current)
+        
+        return batches
+    
+    def _join_batch(self, batch: List[JoinPart]) -> Optional[JoinPart]:
+        """Run join_pattern on one batch (single parts pass through unchanged).
+        
+        Returns:
+            Joined part, or None if the join call failed
+        """
+        if len(batch) == 1:
+            return batch[0]
+        
+        start_time, end_time = batch[0].start_time, batch[-1].end_time
+        raw = self._render_join_input(batch)
+        result = self._run_fabric_pattern(self.join_pattern, raw)
+        
+        if result["success"]:
+            return JoinPart(text=result["output"], start_time=start_time, end_time=end_time)
+        
+        error_msg = result.get("error", "Unknown error")
+        print(f"      ⚠️  Join failed for {start_time} - {end_time}: {error_msg}")
+        return None
+    
+    def _tree_join(self, parts: List[JoinPart]) -> Optional[str]:
+        """Hierarchically join outputs until a single result remains.
+        
+        Each level groups the current parts into token-budgeted batches,
+        joins the batches in parallel (bounded by the model's TPM), and
+        feeds the results to the next level. Levels grow logarithmically
+        with the number of chunks, so no join request overflows the model
+        context and latency stays bounded.
+        
+        Args:
+            parts: Chunk outputs with their timestamp ranges
+        
+        Returns:
+            Joined output, or None if the parts cannot be reduced to one
+            or any join call fails (the caller then concatenates)
+        """
+        budget = self._join_budget()
+        tpm = get_model_tpm(self.model) if self.model else get_model_tpm("")
+        level = 0
+        
+        while len(parts) > 1:
+            batches = self._plan_join_batches(parts, budget)
+            if len(batches) == len(parts):
+                # Every part alone fills the budget; joining cannot make progress
+                return None
+            
+            level += 1
+            avg_batch_tokens = max(1, sum(p.tokens for p in parts) // len(batches))
+            workers = max(1, min(len(batches), JOIN_MAX_WORKERS, tpm // avg_batch_tokens))
+            print(
+                f"      🔗 Join level {level}: {len(parts)} parts → {len(batches)} batches "
+                f"with '{self.join_pattern}' ({workers} parallel)"
+            )
+            
+            joined: List[JoinPart] = []
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for part in pool.map(self._join_batch, batches):
+                    if part is None:
+                        # No full join is possible any more; skip the queued batches
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        return None
+                    joined.append(part)
+            parts = joined
+        
+        return parts[0].text
+    
+    def _pattern_output_dir(self, pattern: str) -> Path:
+        """Directory holding a pattern's chunk outputs and checkpoint manifest."""
+        return self.save_dir / "outputs" / pattern
+    
+    def _save_checkpoint(self, pattern: str, index: int, packet: EnrichedPacket, output: str):
+        """Persist one successful chunk output as soon as it completes.
+        
+        Writes chunk_NNN.md (same file _save_pattern_outputs produces) and
+        records the packet hash in the pattern's checkpoint manifest, both
+        atomically, so an interrupted run never leaves a torn checkpoint.
+        
+        Args:
+            pattern: Pattern name
+            index: One-based chunk number
+            packet: Packet the output was produced from
+            output: Pattern output for the chunk
+        """
+        if not self.save_dir:
+            return
+        
+        pattern_dir = self._pattern_output_dir(pattern)
+        pattern_dir.mkdir(parents=True, exist_ok=True)
+        
+        chunk_file = f"chunk_{index:03d}.md"
+        atomic_write_text(pattern_dir / chunk_file, output)
+        
+        with self._checkpoint_lock:
+            manifest = self._read_checkpoint_manifest(pattern)
+            manifest["pattern"] = pattern
+            manifest.setdefault("chunks", {})[str(index)] = {
+                "packet_hash": packet.content_hash(),
+                "file": chunk_file
+            }
+            atomic_write_text(pattern_dir / CHECKPOINT_FILENAME, json.dumps(manifest, indent=2))
+    
+    def _read_checkpoint_manifest(self, pattern: str) -> Dict:
+        """Read a pattern's checkpoint manifest (empty if missing or corrupt)."""
+        manifest_path = self._pattern_output_dir(pattern) / CHECKPOINT_FILENAME
+        try:
+            return json.loads(manifest_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+    
+    def _load_checkpoints(self, pattern: str, packets: List[EnrichedPacket]) -> Dict[int, str]:
+        """Rehydrate checkpointed chunk outputs that still match their packets.
+        
+        A checkpoint is only reused when the packet hash matches, so a
+        different chunk size or changed transcript re-runs those chunks.
+        
+        Args:
+            pattern: Pattern name
+            packets: Packets of the current run
+        
+        Returns:
+            Dict of one-based chunk number -> output text
+        """
+        chunks = self._read_checkpoint_manifest(pattern).get("chunks", {})
+        pattern_dir = self._pattern_output_dir(pattern)
+        restored = {}
+        
+        for i, packet in enumerate(packets, 1):
+            entry = chunks.get(str(i))
+            if not entry or entry.get("packet_hash") != packet.content_hash():
+                continue
+            try:
+                restored[i] = (pattern_dir / entry["file"]).read_text()
+            except (OSError, KeyError):
+                continue
+        
+        if restored:
+            print(f"      ↺ Restored {len(restored)}/{len(packets)} chunk(s) from checkpoint")
+        
+        return restored
+    
     def _save_pattern_outputs(self, pattern_results: Dict[str, PatternResult]):
         """Save pattern outputs to disk.
         
         Creates structure:
         .fabric/{video_id}/outputs/{pattern_name}/
+            checkpoint.json     # Packet hashes of completed chunks (--resume)
             combined.md         # Final formatted output (goes into note)
             combined_raw.md     # Raw output with chunk markers (for debugging)
             chunk_001.md        # Individual chunk outputs
@@ -632,7 +1048,7 @@ class FabricOrchestrator:
             if not result.success:
                 continue
             
-            pattern_dir = outputs_dir / pattern_name
+            pattern_dir = self._pattern_output_dir(pattern_name)
             pattern_dir.mkdir(parents=True, exist_ok=True)
             
             # Save combined output (formatted)
@@ -640,10 +1056,11 @@ class FabricOrchestrator:
             combined_path.write_text(result.combined_output)
             
             # Save raw combined output (with chunk markers) if multiple chunks
-            if len(result.outputs) > 1:
+            total = len(result.chunk_outputs)
+            if total > 1:
                 raw_parts = []
-                for i, output in enumerate(result.outputs, 1):
-                    raw_parts.append(f"## Part {i}/{len(result.outputs)}")
+                for i, output in result.chunk_outputs.items():
+                    raw_parts.append(f"## Part {i}/{total}")
                     raw_parts.append("")
                     raw_parts.append(output)
                     raw_parts.append("")
@@ -654,7 +1071,7 @@ class FabricOrchestrator:
                 raw_combined_path.write_text("\n".join(raw_parts))
             
             # Save individual chunk outputs
-            for i, output in enumerate(result.outputs, 1):
+            for i, output in result.chunk_outputs.items():
                 chunk_path = pattern_dir / f"chunk_{i:03d}.md"
                 chunk_path.write_text(output)
         
@@ -673,7 +1090,13 @@ def orchestrate_fabric_analysis(
     debug: bool = False,
     stream: bool = False,
     model: Optional[str] = None,
-    video_info: Optional[Dict] = None
+    video_info: Optional[Dict] = None,
+    resume: bool = False,
+    preamble_fraction: Optional[float] = None,
+    adaptive_chunking: bool = False,
+    parallelism: int = 1,
+    timings_log: Optional[Path] = None,
+    phase1_combined: bool = False
 ) -> OrchestrationResult:
     """Convenience function for Fabric orchestration.
     
@@ -690,6 +1113,12 @@ def orchestrate_fabric_analysis(
         stream: Enable streaming mode to see Fabric output in real-time
         model: Optional LLM model override (e.g., "llama-4-scout")
         video_info: Optional dict from extractor with YouTube metadata (V4.0)
+        resume: Reuse checkpoints in save_dir and run only missing chunks
+        preamble_fraction: Cap for the shared preamble as a share of max_chunk_tokens
+        adaptive_chunking: Plan the chunk size from model limits and timings
+        parallelism: Chunks processed concurrently per pattern
+        timings_log: JSON-lines file of request timings (recorded and planned from)
+        phase1_combined: Run Phase 1 as one JSON request instead of three patterns
     
     Returns:
         OrchestrationResult: Complete orchestration results
@@ -702,7 +1131,13 @@ def orchestrate_fabric_analysis(
         save_dir=save_dir,
         debug=debug,
         stream=stream,
-        model=model
+        model=model,
+        resume=resume,
+        preamble_fraction=preamble_fraction,
+        adaptive_chunking=adaptive_chunking,
+        parallelism=parallelism,
+        timings_log=timings_log,
+        phase1_combined=phase1_combined
     )
     
     return orchestrator.orchestrate(
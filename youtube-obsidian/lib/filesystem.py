@@ -4,15 +4,26 @@ from __future__ import annotations
 
 import os
 import re
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional
 
 from .exceptions import FileSystemError
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
 _FALLBACK_TITLE = "Untitled Video"
 _MAX_TITLE_LENGTH = 100
 
+# Process umask, read once so atomic writes can give new files normal modes
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 def sanitize_title(title: str) -> str:
     """Return a filesystem-safe title string."""
@@ -113,6 +124,101 @@ def resolve_collision(filepath: Path) -> Path:
         counter += 1
 
 
+@contextmanager
+def atomic_writer(path: Path, overwrite: bool = True) -> Iterator[BinaryIO]:
+    """Stream a file's new content atomically via a temp file in the same directory.
+
+    Readers never observe a partially written file: content goes to a
+    sibling temp file that is fsynced and then renamed over the target when
+    the block exits cleanly. On error the temp file is removed and the
+    target is left untouched.
+
+    Args:
+        path: Destination file path
+        overwrite: If False, fail with FileExistsError instead of replacing
+            an existing file (the check and the create are a single step)
+
+    Yields:
+        Binary file handle to write the new content to
+
+    Raises:
+        FileExistsError: If overwrite is False and the path already exists
+        OSError: If the write or rename fails
+    """
+
+    path = Path(path)
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            yield handle
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.chmod(tmp_name, mode)
+        if overwrite:
+            os.replace(tmp_name, path)
+        else:
+            # link() refuses to clobber an existing file, unlike rename()
+            os.link(tmp_name, path)
+            os.unlink(tmp_name)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def atomic_write_text(
+    path: Path,
+    content: str,
+    encoding: str = "utf-8",
+    overwrite: bool = True,
+) -> None:
+    """Write a text file atomically (see atomic_writer).
+
+    Args:
+        path: Destination file path
+        content: Text content to write
+        encoding: Text encoding (default: utf-8)
+        overwrite: If False, fail with FileExistsError instead of replacing
+            an existing file
+
+    Raises:
+        FileExistsError: If overwrite is False and the path already exists
+        OSError: If the write or rename fails
+    """
+
+    with atomic_writer(path, overwrite=overwrite) as handle:
+        handle.write(content.encode(encoding))
+
+
+@contextmanager
+def file_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on lock_path for the block.
+
+    Used to serialize read-modify-write cycles (e.g. the cache index) across
+    concurrent yt processes. No-op on platforms without fcntl.
+
+    Args:
+        lock_path: Path of the lock file (created if missing)
+    """
+
+    lock_path = Path(lock_path)
+    with open(lock_path, "a") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
 def save_markdown(
     content: str,
     title: str,
@@ -132,14 +238,18 @@ def save_markdown(
     except ValueError as exc:
         raise FileSystemError(f"Invalid upload date '{upload_date}': {exc}") from exc
     candidate_path = target_dir / filename
-    final_path = resolve_collision(candidate_path)
 
-    try:
-        final_path.write_text(content, encoding="utf-8")
-    except OSError as exc:  # pragma: no cover - platform dependent
-        raise FileSystemError(f"Cannot write to {final_path}: {exc}") from exc
-
-    return final_path
+    # Another process may claim the same name between the collision check
+    # and the write, so create exclusively and re-resolve on conflict
+    while True:
+        final_path = resolve_collision(candidate_path)
+        try:
+            atomic_write_text(final_path, content, overwrite=False)
+        except FileExistsError:
+            continue
+        except OSError as exc:  # pragma: no cover - platform dependent
+            raise FileSystemError(f"Cannot write to {final_path}: {exc}") from exc
+        return final_path
 
 
 def _resolve_output_dir(provided_dir: Optional[Path]) -> Path:
@@ -3,13 +3,32 @@ Incremental note writer for appending sections to existing markdown notes
 
 This module allows adding new AI analysis sections to existing Obsidian notes
 without re-running the entire analysis.
+
+Only the YAML frontmatter block is read and parsed; the note body (which can
+hold megabytes of transcript) is never loaded for appends. Frontmatter edits
+are queued and applied in a single YAML round trip on save. A save streams
+the body from disk into an atomic rewrite, so memory use stays flat but the
+write is O(note size). Only when the rendered frontmatter keeps its byte
+length (no frontmatter edits, e.g. append_patterns_to_note with
+update_frontmatter=False) are the sections appended in place: they are
+written and fsynced first, the header last, so a crash in between leaves the
+new sections under the old (valid) frontmatter. Saves hold a per-note lock
+(.<note>.lock) so concurrent writers do not interleave.
+
+frontmatter, body and content are read-only views; body reads the note body
+from disk on each access.
 """
 
 from pathlib import Path
-from typing import Dict, List, Any
-import re
+from typing import Dict, List, Any, Optional, Tuple
+import os
+import shutil
 import yaml
 
+from .filesystem import atomic_writer, file_lock
+
+_FENCE = b"---"
+
 
 class IncrementalWriter:
     """Append sections to existing markdown notes"""
@@ -24,26 +43,62 @@ class IncrementalWriter:
         if not self.note_path.exists():
             raise FileNotFoundError(f"Note not found: {note_path}")
         
-        self.content = self._load_note()
-        self.frontmatter, self.body = self._parse_note()
-    
-    def _load_note(self) -> str:
-        """Load existing note"""
-        return self.note_path.read_text(encoding='utf-8')
+        # Queued frontmatter edits: ("set" | "extend", field, value)
+        self._edits: List[Tuple[str, str, Any]] = []
+        self._rendered_frontmatter: Optional[str] = None
+        self._sections: List[str] = []
+        self._read_header()
     
-    def _parse_note(self) -> tuple[str, str]:
-        """Split frontmatter and body
+    def _read_header(self) -> None:
+        """Read only the frontmatter block and remember where the body starts"""
+        stat = self.note_path.stat()
+        self._file_stamp = (stat.st_mtime_ns, stat.st_size)
+        self._has_frontmatter = False
+        self._body_offset = 0
+        self._original_frontmatter = ""
         
-        Returns:
-            Tuple of (frontmatter_text, body_text)
-        """
-        # Match YAML frontmatter block
-        match = re.match(r'^---\n(.*?)\n---\n(.*)$', self.content, re.DOTALL)
-        if match:
-            return match.group(1), match.group(2)
+        # Fences may end in LF or CRLF; readline keeps f.tell() in step with
+        # the raw bytes, so the body offset is right for both
+        with open(self.note_path, 'rb') as f:
+            if f.readline().rstrip(b"\r\n") != _FENCE:
+                return
+            
+            lines = []
+            while True:
+                line = f.readline()
+                if not line:
+                    return
+                if line.rstrip(b"\r\n") == _FENCE:
+                    self._has_frontmatter = True
+                    self._body_offset = f.tell()
+                    # Frontmatter text excludes the newline before the closing fence
+                    text = b"".join(lines).decode('utf-8').replace("\r\n", "\n")
+                    self._original_frontmatter = text[:-1]
+                    return
+                lines.append(line)
+    
+    @property
+    def frontmatter(self) -> str:
+        """Frontmatter YAML text with all queued edits applied"""
+        if not self._edits:
+            return self._original_frontmatter
         
-        # No frontmatter found
-        return "", self.content
+        if self._rendered_frontmatter is None:
+            self._rendered_frontmatter = self._render_frontmatter()
+        return self._rendered_frontmatter
+    
+    @property
+    def body(self) -> str:
+        """Note body including pending sections (reads the body from disk)"""
+        with open(self.note_path, 'rb') as f:
+            f.seek(self._body_offset)
+            existing = f.read().decode('utf-8')
+        return existing + "".join(self._sections)
+    
+    @property
+    def content(self) -> str:
+        """Complete note content including pending changes"""
+        return self.preview()
     
     def append_section(self, heading: str, content: str, level: int = 2) -> None:
         """Append new section to note
@@ -54,27 +109,19 @@ class IncrementalWriter:
             level: Heading level (2 for ##, 3 for ###, etc.)
         """
         heading_prefix = "#" * level
-        section = f"\n\n{heading_prefix} {heading}\n\n{content}\n"
-        self.body += section
+        self._sections.append(f"\n\n{heading_prefix} {heading}\n\n{content}\n")
     
     def update_frontmatter_field(self, field: str, value: Any) -> None:
         """Update a single field in frontmatter
         
+        The edit is applied together with all other edits on save.
+        
         Args:
             field: YAML field name
             value: New value for field
         """
-        # Parse current frontmatter
-        try:
-            fm_dict = yaml.safe_load(self.frontmatter) if self.frontmatter else {}
-        except yaml.YAMLError:
-            fm_dict = {}
-        
-        # Update field
-        fm_dict[field] = value
-        
-        # Convert back to YAML
-        self.frontmatter = yaml.dump(fm_dict, default_flow_style=False, allow_unicode=True).strip()
+        self._edits.append(("set", field, value))
+        self._rendered_frontmatter = None
     
     def append_to_frontmatter_list(self, field: str, new_items: List[Any]) -> None:
         """Append items to a list field in frontmatter
@@ -83,31 +130,79 @@ class IncrementalWriter:
             field: YAML field name (must be a list)
             new_items: Items to append
         """
-        # Parse current frontmatter
+        self._edits.append(("extend", field, list(new_items)))
+        self._rendered_frontmatter = None
+    
+    def _render_frontmatter(self) -> str:
+        """Apply all queued edits in one YAML parse/dump round trip"""
         try:
-            fm_dict = yaml.safe_load(self.frontmatter) if self.frontmatter else {}
+            fm_dict = yaml.safe_load(self._original_frontmatter) if self._original_frontmatter else {}
         except yaml.YAMLError:
             fm_dict = {}
+        if not isinstance(fm_dict, dict):
+            fm_dict = {}
         
-        # Get existing list or create new one
-        existing_list = fm_dict.get(field, [])
-        if not isinstance(existing_list, list):
-            existing_list = [existing_list]
-        
-        # Append new items (avoid duplicates)
-        for item in new_items:
-            if item not in existing_list:
-                existing_list.append(item)
-        
-        fm_dict[field] = existing_list
+        for op, field, value in self._edits:
+            if op == "set":
+                fm_dict[field] = value
+                continue
+            
+            # Get existing list or create new one
+            existing_list = fm_dict.get(field, [])
+            if not isinstance(existing_list, list):
+                existing_list = [existing_list]
+            
+            # Append new items (avoid duplicates)
+            for item in value:
+                if item not in existing_list:
+                    existing_list.append(item)
+            
+            fm_dict[field] = existing_list
         
-        # Convert back to YAML
-        self.frontmatter = yaml.dump(fm_dict, default_flow_style=False, allow_unicode=True).strip()
+        return yaml.dump(fm_dict, default_flow_style=False, allow_unicode=True).strip()
     
     def save(self) -> None:
-        """Save updated note"""
-        new_content = f"---\n{self.frontmatter}\n---\n{self.body}"
-        self.note_path.write_text(new_content, encoding='utf-8')
+        """Save updated note
+        
+        Appends in place when the frontmatter block keeps its byte length
+        (sections first, then the header, each fsynced), otherwise streams
+        header + existing body + new sections into an atomic rewrite.
+        """
+        with file_lock(self.note_path.with_name(f".{self.note_path.name}.lock")):
+            # Note changed since it was opened: re-read the header so the body
+            # offset is valid; queued edits re-apply to the fresh frontmatter
+            stat = self.note_path.stat()
+            if (stat.st_mtime_ns, stat.st_size) != self._file_stamp:
+                self._read_header()
+                self._rendered_frontmatter = None
+            
+            header = f"---\n{self.frontmatter}\n---\n".encode('utf-8')
+            appended = "".join(self._sections).encode('utf-8')
+            original = f"---\n{self._original_frontmatter}\n---\n".encode('utf-8')
+            
+            if self._has_frontmatter and len(header) == self._body_offset:
+                with open(self.note_path, 'r+b') as f:
+                    f.seek(0, 2)
+                    f.write(appended)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    if header != original:
+                        f.seek(0)
+                        f.write(header)
+                        f.flush()
+                        os.fsync(f.fileno())
+            else:
+                with open(self.note_path, 'rb') as src, atomic_writer(self.note_path) as out:
+                    out.write(header)
+                    src.seek(self._body_offset)
+                    shutil.copyfileobj(src, out)
+                    out.write(appended)
+        
+        # Everything is on disk now; start fresh from the saved note
+        self._edits.clear()
+        self._rendered_frontmatter = None
+        self._sections.clear()
+        self._read_header()
     
     def preview(self) -> str:
         """Preview updated note content without saving
@@ -7,6 +7,10 @@ particularly heading hierarchy issues from combining multiple outputs.
 import re
 from typing import Optional
 
+# Precompiled patterns for format_combined_output's fused line pass
+_HEADING_RE = re.compile(r'(#{1,6})\s+(.*)')
+_CHUNK_MARKER_RE = re.compile(r'#{1,6}\s+Part\s+\d+/\d+')
+
 
 def normalize_headings(
     text: str,
@@ -208,6 +212,10 @@ def format_combined_output(
     2. Normalize heading levels
     3. Clean up horizontal rules
     
+    Steps 1 and 2 run as one pass over the lines with precompiled patterns
+    (same output as remove_chunk_markers + normalize_headings); step 3 is
+    clean_horizontal_rules.
+    
     Note: Duplicate heading merging is disabled as it's too aggressive
     and loses content structure from individual chunks.
     
@@ -223,12 +231,8 @@ def format_combined_output(
     if not text:
         return text
     
-    # Step 1: Remove chunk markers if requested
-    if not keep_chunk_markers:
-        text = remove_chunk_markers(text)
-    
-    # Step 2: Normalize heading levels
-    text = normalize_headings(text, base_level=base_heading_level)
+    # Steps 1-2: Remove chunk markers (if requested) and normalize headings
+    text = _strip_markers_and_shift_headings(text, base_heading_level, keep_chunk_markers)
     
     # Step 3: Clean horizontal rules
     if clean_rules:
@@ -238,3 +242,33 @@ def format_combined_output(
     # as it's too aggressive and loses structure from chunks
     
     return text.strip()
+
+
+def _strip_markers_and_shift_headings(
+    text: str,
+    base_level: int,
+    keep_chunk_markers: bool,
+    max_level: int = 6
+) -> str:
+    """remove_chunk_markers + normalize_headings in a single line pass."""
+    offset = base_level - 1
+    result = []
+    skip_next = False
+    
+    for line in text.split('\n'):
+        # Only "#" lines can be markers or headings
+        if line[:1] == '#':
+            if not keep_chunk_markers and _CHUNK_MARKER_RE.match(line):
+                skip_next = True  # Skip the timestamp line too
+                continue
+            match = _HEADING_RE.fullmatch(line)
+            if match:
+                line = f"{'#' * min(len(match.group(1)) + offset, max_level)} {match.group(2)}"
+        elif skip_next and line.strip().startswith('*Timestamp:'):
+            skip_next = False
+            continue
+        
+        skip_next = False
+        result.append(line)
+    
+    return '\n'.join(result)
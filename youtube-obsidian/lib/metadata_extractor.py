@@ -10,12 +10,24 @@ Phase 1 extracts:
 - Key topics/entities
 """
 
+import json
 import subprocess
 from pathlib import Path
 from typing import Dict, Optional
 from dataclasses import dataclass
 
-from .rate_limiter import RateLimitHandler, RetryConfig, parse_thinking_tags, validate_request_size
+from .rate_limiter import (
+    MAX_REQUEST_TOKENS,
+    TOKENS_PER_WORD,
+    RateLimitHandler,
+    RetryConfig,
+    estimate_tokens,
+    get_model_context_window,
+    get_model_tpm,
+    parse_thinking_tags,
+    validate_request_size,
+)
+from .transcript_sampler import extract_representative_sample
 
 
 @dataclass
@@ -50,12 +62,23 @@ class MetadataExtractor:
         "topics": "extract_patterns"
     }
     
+    # Custom pattern returning summary/theme/topics as one JSON object
+    # (fabric-custom-patterns/youtube_phase1_metadata)
+    COMBINED_PATTERN = "youtube_phase1_metadata"
+    
+    # Transcripts longer than this are sampled for Phase 1
+    SAMPLE_THRESHOLD_WORDS = 10000
+    # Share of the Phase 1 model's per-request token limit used by the
+    # extractive sample (the rest is left for the pattern prompt and output)
+    SAMPLE_TOKEN_FRACTION = 0.45
+    
     def __init__(
         self,
         fabric_command: str = "fabric-ai",
         timeout: int = 60,
         patterns: Optional[Dict[str, str]] = None,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        combined: bool = False
     ):
         """Initialize metadata extractor.
         
@@ -64,11 +87,15 @@ class MetadataExtractor:
             timeout: Timeout in seconds per pattern (default: 60)
             patterns: Custom pattern mapping (default: use DEFAULT_PATTERNS)
             model: Optional LLM model override (e.g., "llama-4-scout")
+            combined: Extract summary/theme/topics with one JSON request
+                (COMBINED_PATTERN), falling back to the three patterns
         """
         self.fabric_command = fabric_command
         self.timeout = timeout
         self.patterns = patterns or self.DEFAULT_PATTERNS.copy()
         self.model = model
+        self.combined = combined
+        self._reuse_saved = False  # Set per extract() call
         
         # Initialize rate limit handler for retry logic with model fallbacks
         from .rate_limiter import resolve_model_name
@@ -93,7 +120,8 @@ class MetadataExtractor:
         self,
         transcript: str,
         video_title: str,
-        save_dir: Optional[Path] = None
+        save_dir: Optional[Path] = None,
+        reuse_saved: bool = False
     ) -> GlobalMetadata:
         """Extract global metadata from transcript.
         
@@ -102,13 +130,16 @@ class MetadataExtractor:
         - theme: Main theme or idea
         - topics: Key topics/entities mentioned
         
-        For long transcripts (>10K words), uses a representative sample
-        (first 2K + last 500 words) to stay within token limits.
+        For long transcripts (>10K words), uses an extractive representative
+        sample from across the transcript, sized to the Phase 1 models'
+        token limits (see _sample_word_budget).
         
         Args:
             transcript: Full transcript text
             video_title: Video title (used for fallback)
             save_dir: Optional directory to save intermediate outputs
+            reuse_saved: Reuse outputs already saved in save_dir instead of
+                re-running their patterns (used when resuming a run)
         
         Returns:
             GlobalMetadata: Extracted metadata with fallbacks on failure
@@ -117,17 +148,25 @@ class MetadataExtractor:
         
         # For very long transcripts, use representative sample for Phase 1
         # Pattern extraction doesn't need full transcript, just enough context
-        words = transcript.split()
-        word_count = len(words)
+        word_count = len(transcript.split())
         
-        if word_count > 10000:
-            # Use first 2000 words + last 500 words as sample
-            # This gives context from beginning and end without exceeding limits
-            sample_transcript = ' '.join(words[:2000] + ['...'] + words[-500:])
+        if word_count > self.SAMPLE_THRESHOLD_WORDS:
+            # Most informative sentences from across the whole transcript
+            # (TF-IDF scored, spread over all regions; no LLM call)
+            sample_transcript = extract_representative_sample(transcript, self._sample_word_budget())
             print(f"  ℹ️  Using sample ({word_count} words → {len(sample_transcript.split())} words)")
         else:
             sample_transcript = transcript
         
+        self._reuse_saved = reuse_saved
+        
+        if self.combined:
+            metadata = self._extract_combined(sample_transcript, save_dir)
+            if metadata:
+                print("  ✅ Metadata extraction complete (1 request)")
+                return metadata
+            print("  ↪ Falling back to separate Phase 1 patterns")
+        
         results = {}
         errors = {}
         
@@ -194,6 +233,27 @@ class MetadataExtractor:
             errors=errors
         )
     
+    def _sample_word_budget(self) -> int:
+        """Word budget of the Phase 1 sample, from the models' token limits.
+        
+        Phase 1 requests may fall back to any model in the rate limiter's
+        chain, so the sample has to fit the smallest per-request limit
+        (TPM, context window, MAX_REQUEST_TOKENS) among them.
+        
+        Returns:
+            Words the sample may use, gap markers included
+        """
+        models = [self.model] if self.model else []
+        models += self.rate_limiter.fallback_models
+        limit = min(
+            [MAX_REQUEST_TOKENS]
+            + [min(get_model_tpm(m), get_model_context_window(m)) for m in models]
+        )
+        
+        # estimate_tokens() adds a fixed system prompt overhead to every request
+        sample_tokens = int(limit * self.SAMPLE_TOKEN_FRACTION) - estimate_tokens("")
+        return max(1, int(sample_tokens / TOKENS_PER_WORD))
+    
     def _run_pattern(
         self,
         pattern: str,
@@ -213,6 +273,10 @@ class MetadataExtractor:
                 - output: str (if success)
                 - error: str (if failure)
         """
+        # Resuming: a saved output from the previous run costs no tokens
+        if self._reuse_saved and save_path and save_path.exists():
+            return {"success": True, "output": save_path.read_text()}
+        
         # Validate request size first
         is_valid, error = validate_request_size(input_text)
         if not is_valid:
@@ -250,6 +314,81 @@ class MetadataExtractor:
                 "error": error_msg
             }
     
+    def _extract_combined(
+        self,
+        sample_transcript: str,
+        save_dir: Optional[Path] = None
+    ) -> Optional[GlobalMetadata]:
+        """Extract summary, theme and topics with a single JSON request.
+        
+        Args:
+            sample_transcript: Transcript or representative sample
+            save_dir: Optional directory to save the raw output
+        
+        Returns:
+            GlobalMetadata, or None if the request failed or its output
+            is not valid JSON with the expected fields
+        """
+        print(f"  Running: {self.COMBINED_PATTERN}")
+        result = self._run_pattern(
+            self.COMBINED_PATTERN,
+            sample_transcript,
+            save_dir / "global_metadata.json" if save_dir else None
+        )
+        
+        if not result["success"]:
+            print(f"  ⚠️  Combined Phase 1 failed: {result['error']}")
+            return None
+        
+        fields = self._parse_combined(result["output"])
+        if fields is None:
+            print("  ⚠️  Combined Phase 1 output is not valid metadata JSON")
+            return None
+        
+        return GlobalMetadata(
+            summary=fields["summary"],
+            theme=fields["theme"],
+            topics=fields["topics"]
+        )
+    
+    def _parse_combined(self, output: str) -> Optional[Dict[str, str]]:
+        """Parse and validate the combined Phase 1 JSON output.
+        
+        Tolerates code fences or text around the object, and topics given
+        either as a list or as a comma-separated string.
+        
+        Args:
+            output: Raw pattern output
+        
+        Returns:
+            Dict with non-empty summary, theme and topics strings, or None
+        """
+        start, end = output.find('{'), output.rfind('}')
+        if start == -1 or end <= start:
+            return None
+        
+        try:
+            data = json.loads(output[start:end + 1])
+        except json.JSONDecodeError:
+            return None
+        
+        if not isinstance(data, dict):
+            return None
+        
+        topics = data.get("topics")
+        if isinstance(topics, list):
+            topics = ", ".join(str(t).strip() for t in topics if str(t).strip())
+        
+        fields = {
+            "summary": data.get("summary"),
+            "theme": data.get("theme"),
+            "topics": topics
+        }
+        if not all(isinstance(v, str) and v.strip() for v in fields.values()):
+            return None
+        
+        return {key: value.strip() for key, value in fields.items()}
+    
     def _parse_summary(self, output: str) -> str:
         """Parse summary from create_micro_summary output.
         
@@ -5,8 +5,9 @@ contextual metadata that helps AI models understand position and broader
 context when processing segments of longer content.
 """
 
-from dataclasses import dataclass, field
-from typing import Tuple, Optional, List
+import hashlib
+from dataclasses import dataclass, field, replace
+from typing import Tuple, Optional, List, Callable
 
 
 @dataclass
@@ -110,6 +111,137 @@ class VideoContext:
         return '\n'.join(lines)
 
 
+# Shrink steps for the shared preamble: (max tags, max description words).
+# Tried in order until the preamble fits its token budget.
+PREAMBLE_SHRINK_STEPS: Tuple[Tuple[int, int], ...] = (
+    (10, 150),
+    (10, 75),
+    (5, 75),
+    (5, 30),
+    (3, 30),
+    (3, 0),
+    (0, 0),
+)
+# Last resort once tags/description are gone: cap the Key Topics list
+PREAMBLE_MIN_TOPICS = 5
+
+
+@dataclass
+class SharedPreamble:
+    """VIDEO CONTEXT + CONTENT CONTEXT rendered once per video.
+    
+    These sections are identical for every chunk and pattern, so they are
+    rendered (and token-counted) once and shared by all packets, instead of
+    being rebuilt in every to_fabric_input() call.
+    
+    Attributes:
+        text: Rendered context sections (without the chunk information)
+        token_count: Tokens in text (0 if not measured)
+        max_tags: Tags kept after shrinking
+        description_words: Description words kept after shrinking
+        fits_budget: False if even the smallest form exceeds the budget
+    """
+    text: str
+    token_count: int = 0
+    max_tags: int = 10
+    description_words: int = 150
+    fits_budget: bool = True
+
+
+def _render_context_sections(
+    video_title: str,
+    video_summary: str,
+    key_topics: str,
+    video_context: Optional[VideoContext] = None
+) -> str:
+    """Render the VIDEO CONTEXT and CONTENT CONTEXT preamble sections."""
+    sections = []
+    
+    # Add VIDEO CONTEXT if available (V4.0)
+    if video_context:
+        sections.append(video_context.to_preamble_section())
+        sections.append("")  # Blank line between sections
+    
+    # Add CONTENT CONTEXT (AI-analyzed)
+    sections.append(f"""CONTENT CONTEXT:
+- Title: {video_title}
+- Overview: {video_summary}
+- Key Topics: {key_topics}""")
+    
+    return '\n'.join(sections)
+
+
+def _shrink_video_context(video_context: VideoContext, max_tags: int, description_words: int) -> VideoContext:
+    """Copy of video_context with fewer tags and a shorter description."""
+    words = video_context.description_excerpt.rstrip('.').split()
+    if len(words) > description_words:
+        description = ' '.join(words[:description_words]) + '...' if description_words else ''
+    else:
+        description = video_context.description_excerpt
+    
+    return replace(video_context, tags=video_context.tags[:max_tags], description_excerpt=description)
+
+
+def build_shared_preamble(
+    video_title: str,
+    video_summary: str,
+    key_topics: str,
+    video_context: Optional[VideoContext] = None,
+    max_tokens: Optional[int] = None,
+    count_tokens: Optional[Callable[[str], int]] = None
+) -> SharedPreamble:
+    """Render the shared preamble once, shrinking it to fit a token budget.
+    
+    Walks PREAMBLE_SHRINK_STEPS (fewer tags, shorter description) until
+    the rendered sections fit max_tokens; if they still don't, the Key
+    Topics list is capped at PREAMBLE_MIN_TOPICS entries.
+    
+    Args:
+        video_title: Title of video/content
+        video_summary: Brief 1-2 sentence overview
+        key_topics: Comma-separated topics
+        video_context: Optional VideoContext with YouTube metadata
+        max_tokens: Token budget for the preamble (None = no shrinking)
+        count_tokens: Token counter (default: ~1.3 tokens per word)
+    
+    Returns:
+        SharedPreamble: Rendered preamble with its measured token cost
+    """
+    if count_tokens is None:
+        count_tokens = lambda text: int(len(text.split()) * 1.3)
+    
+    def render(max_tags: int, description_words: int, topics: str) -> SharedPreamble:
+        context = video_context
+        if context is not None:
+            context = _shrink_video_context(context, max_tags, description_words)
+        text = _render_context_sections(video_title, video_summary, topics, context)
+        return SharedPreamble(
+            text=text,
+            token_count=count_tokens(text),
+            max_tags=max_tags,
+            description_words=description_words
+        )
+    
+    max_tags, description_words = PREAMBLE_SHRINK_STEPS[0]
+    preamble = render(max_tags, description_words, key_topics)
+    if max_tokens is None or preamble.token_count <= max_tokens:
+        return preamble
+    
+    # Tags/description only matter when there is a video context to shrink
+    steps = PREAMBLE_SHRINK_STEPS[1:] if video_context else ()
+    for max_tags, description_words in steps:
+        preamble = render(max_tags, description_words, key_topics)
+        if preamble.token_count <= max_tokens:
+            return preamble
+    
+    topics = [t.strip() for t in key_topics.split(',') if t.strip()]
+    if len(topics) > PREAMBLE_MIN_TOPICS:
+        preamble = render(max_tags, description_words, ', '.join(topics[:PREAMBLE_MIN_TOPICS]))
+    
+    preamble.fits_budget = preamble.token_count <= max_tokens
+    return preamble
+
+
 def _seconds_to_timestamp(seconds: int) -> str:
     """Convert seconds to HH:MM:SS format."""
     hours = seconds // 3600
@@ -143,6 +275,8 @@ class EnrichedPacket:
         transcript_segment: The actual chunk text content
         token_count: Number of tokens in transcript_segment
         video_context: Optional VideoContext with YouTube metadata (V4.0)
+        shared_preamble: Optional pre-rendered context sections shared by
+            all packets of the video (replaces per-packet rendering)
     """
     
     # Global context metadata (from Phase 1 AI analysis)
@@ -164,6 +298,9 @@ class EnrichedPacket:
     # YouTube metadata context (V4.0 - optional for backward compatibility)
     video_context: Optional[VideoContext] = None
     
+    # Context sections rendered once per video (see build_shared_preamble)
+    shared_preamble: Optional[SharedPreamble] = None
+    
     def to_fabric_input(self) -> str:
         """Format packet as Fabric-compatible input.
         
@@ -181,6 +318,25 @@ class EnrichedPacket:
         preamble = self._generate_preamble()
         return f"{preamble}\n\n{self.transcript_segment}"
     
+    def content_hash(self) -> str:
+        """Stable fingerprint of the chunk content for checkpointing.
+        
+        Covers the transcript segment and its position, but not the
+        preamble: Phase 1 metadata is LLM output and may differ between
+        runs, while a checkpointed output for the same segment stays valid.
+        
+        Returns:
+            str: SHA-256 hex digest
+        """
+        key = "\x1f".join([
+            str(self.chunk_index),
+            str(self.total_chunks),
+            self.timestamp_range[0],
+            self.timestamp_range[1],
+            self.transcript_segment,
+        ])
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+    
     def _generate_preamble(self) -> str:
         """Generate contextual preamble header.
         
@@ -200,16 +356,16 @@ class EnrichedPacket:
         # Build preamble sections
         sections = ["---"]
         
-        # Add VIDEO CONTEXT if available (V4.0)
-        if self.video_context:
-            sections.append(self.video_context.to_preamble_section())
-            sections.append("")  # Blank line between sections
-        
-        # Add CONTENT CONTEXT (AI-analyzed)
-        sections.append(f"""CONTENT CONTEXT:
-- Title: {self.video_title}
-- Overview: {self.video_summary}
-- Key Topics: {self.key_topics}""")
+        # Add VIDEO CONTEXT + CONTENT CONTEXT (shared across chunks if pre-rendered)
+        if self.shared_preamble:
+            sections.append(self.shared_preamble.text)
+        else:
+            sections.append(_render_context_sections(
+                self.video_title,
+                self.video_summary,
+                self.key_topics,
+                self.video_context
+            ))
         
         # Add CHUNK INFORMATION
         sections.append(f"""
@@ -301,7 +457,8 @@ def create_packet(
     timestamp_range: Tuple[str, str],
     transcript_segment: str,
     token_count: Optional[int] = None,
-    video_context: Optional[VideoContext] = None
+    video_context: Optional[VideoContext] = None,
+    shared_preamble: Optional[SharedPreamble] = None
 ) -> EnrichedPacket:
     """Factory function to create an enriched packet.
     
@@ -319,6 +476,7 @@ def create_packet(
         transcript_segment: Actual text content
         token_count: Optional pre-calculated token count
         video_context: Optional VideoContext with YouTube metadata (V4.0)
+        shared_preamble: Optional context sections rendered once per video
     
     Returns:
         EnrichedPacket: Configured packet ready for Fabric processing
@@ -340,5 +498,6 @@ def create_packet(
         timestamp_range=timestamp_range,
         transcript_segment=transcript_segment,
         token_count=final_token_count,
-        video_context=video_context
+        video_context=video_context,
+        shared_preamble=shared_preamble
     )
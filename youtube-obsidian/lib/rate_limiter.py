@@ -120,6 +120,29 @@ def get_model_tpm(model_name: str) -> int:
     return 6000
 
 
+def get_model_context_window(model_name: str) -> int:
+    """Get context window size for a model.
+    
+    Args:
+        model_name: Full model name or alias
+        
+    Returns:
+        Context window in tokens, or the GroqModel default if unknown
+    """
+    if model_name in GROQ_MODELS:
+        return GROQ_MODELS[model_name].context_window
+    
+    for alias, model in GROQ_MODELS.items():
+        if model.name == model_name or model_name in model.name:
+            return model.context_window
+    
+    return GroqModel(name=model_name, tpm=0).context_window
+
+
+# Tokens per word of English text (estimate_tokens heuristic)
+TOKENS_PER_WORD = 1.3
+
+
 def estimate_tokens(text: str) -> int:
     """Estimate token count from text.
     
@@ -135,10 +158,14 @@ def estimate_tokens(text: str) -> int:
     words = len(text.split())
     # Fabric patterns add ~500-1000 tokens of system prompt
     system_overhead = 800
-    return int(words * 1.3) + system_overhead
+    return int(words * TOKENS_PER_WORD) + system_overhead
+
+
+# Largest single request we send (413 errors above this on the free tier)
+MAX_REQUEST_TOKENS = 30000
 
 
-def validate_request_size(text: str, max_tokens: int = 30000) -> Tuple[bool, str]:
+def validate_request_size(text: str, max_tokens: int = MAX_REQUEST_TOKENS) -> Tuple[bool, str]:
     """Validate request won't exceed model limits.
     
     Prevents 413 "Request Entity Too Large" errors.
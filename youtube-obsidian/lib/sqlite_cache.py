@@ -0,0 +1,345 @@
+"""
+SQLite backend for the video processing cache
+
+Stores cache entries in a single WAL-mode database instead of one JSON file
+per video plus a fully rewritten index.json:
+- videos: one row per processed video (indexed by channel and dates)
+- processing_events: processing history rows (indexed by video_id)
+- patterns_run: ordered pattern names per video (indexed by video_id/pattern)
+
+Existing JSON caches in the same directory are imported on first open, so
+switching backends keeps all history. Statistics and listings are single
+queries and never touch per-video files.
+"""
+
+from pathlib import Path
+import json
+import sqlite3
+from typing import Optional, Dict, List, Any, Tuple
+
+from .cache_manager import CacheManager, CacheEntry
+
+DB_FILENAME = "cache.db"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    video_url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    channel TEXT NOT NULL DEFAULT '',
+    upload_date TEXT NOT NULL,
+    duration_seconds INTEGER NOT NULL DEFAULT 0,
+    transcript_word_count INTEGER NOT NULL DEFAULT 0,
+    markdown_path TEXT NOT NULL,
+    last_updated TEXT NOT NULL,
+    chunks TEXT,
+    phase1_metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_videos_channel ON videos(channel);
+CREATE INDEX IF NOT EXISTS idx_videos_upload_date ON videos(upload_date);
+CREATE INDEX IF NOT EXISTS idx_videos_last_updated ON videos(last_updated);
+
+CREATE TABLE IF NOT EXISTS processing_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    video_id TEXT NOT NULL REFERENCES videos(video_id) ON DELETE CASCADE,
+    timestamp TEXT NOT NULL DEFAULT '',
+    mode TEXT NOT NULL DEFAULT '',
+    tokens_used INTEGER NOT NULL DEFAULT 0,
+    success INTEGER NOT NULL DEFAULT 1,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_video ON processing_events(video_id);
+CREATE INDEX IF NOT EXISTS idx_events_timestamp ON processing_events(timestamp);
+
+CREATE TABLE IF NOT EXISTS patterns_run (
+    video_id TEXT NOT NULL REFERENCES videos(video_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    pattern TEXT NOT NULL,
+    PRIMARY KEY (video_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_patterns_pattern ON patterns_run(pattern);
+"""
+
+
+class SQLiteCacheManager(CacheManager):
+    """Video processing cache stored in a single SQLite database"""
+
+    def __init__(self, cache_dir: Path):
+        """Initialize SQLite cache manager
+
+        Args:
+            cache_dir: Directory for the database (e.g., $OBSVAULT/youtube/.cache)
+        """
+        # Base attributes (cache_dir, index_file, ...); the JSON index itself
+        # is not used, the database is the index
+        super().__init__(cache_dir, load_index=False)
+        self.db_path = self.cache_dir / DB_FILENAME
+
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30.0)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),)
+            )
+
+        self._migrate_json_cache()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self._conn.close()
+
+    def flush(self) -> None:
+        """No-op: every write is already committed in its own transaction"""
+
+    def exists(self, video_id: str) -> bool:
+        """Check if video already processed
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            True if cache entry exists
+        """
+        row = self._conn.execute(
+            "SELECT 1 FROM videos WHERE video_id = ?", (video_id,)
+        ).fetchone()
+        return row is not None
+
+    def get_cache(self, video_id: str) -> Optional[CacheEntry]:
+        """Load cache entry for video
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            CacheEntry if exists, None otherwise
+        """
+        row = self._conn.execute(
+            "SELECT * FROM videos WHERE video_id = ?", (video_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            history = [
+                json.loads(event['data'])
+                for event in self._conn.execute(
+                    "SELECT data FROM processing_events WHERE video_id = ? ORDER BY id",
+                    (video_id,)
+                )
+            ]
+            return CacheEntry(
+                video_id=row['video_id'],
+                video_url=row['video_url'],
+                title=row['title'],
+                upload_date=row['upload_date'],
+                duration_seconds=row['duration_seconds'],
+                transcript_word_count=row['transcript_word_count'],
+                markdown_path=row['markdown_path'],
+                last_updated=row['last_updated'],
+                patterns_run=self.get_patterns_run(video_id),
+                processing_history=history,
+                chunks=json.loads(row['chunks']) if row['chunks'] else None,
+                phase1_metadata=json.loads(row['phase1_metadata']) if row['phase1_metadata'] else None,
+                channel=row['channel']
+            )
+        except json.JSONDecodeError as e:
+            print(f"⚠️  Warning: Failed to load cache for {video_id}: {e}")
+            self.invalidate(video_id)
+            return None
+
+    def save_cache(self, video_id: str, entry: CacheEntry) -> None:
+        """Save cache entry (replaces any existing rows for the video)
+
+        Args:
+            video_id: YouTube video ID
+            entry: CacheEntry to save
+        """
+        with self._conn:
+            self._write_entry(video_id, entry)
+
+    def get_note_path(self, video_id: str) -> Optional[str]:
+        """Get markdown note path for video
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Path to markdown note, or None if not found
+        """
+        row = self._conn.execute(
+            "SELECT markdown_path FROM videos WHERE video_id = ?", (video_id,)
+        ).fetchone()
+        return row['markdown_path'] if row else None
+
+    def get_patterns_run(self, video_id: str) -> List[str]:
+        """Get patterns already run on video
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            List of pattern names
+        """
+        return [
+            row['pattern']
+            for row in self._conn.execute(
+                "SELECT pattern FROM patterns_run WHERE video_id = ? ORDER BY position",
+                (video_id,)
+            )
+        ]
+
+    def invalidate(self, video_id: str) -> None:
+        """Delete cache for video
+
+        Args:
+            video_id: YouTube video ID
+        """
+        with self._conn:
+            self._delete_rows(video_id)
+
+    def list_all(self, channel: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """List all cached videos
+
+        Args:
+            channel: Optional channel name to filter by
+
+        Returns:
+            List of (video_id, info dict) tuples, same shape as the JSON index
+        """
+        query = """
+            SELECT v.video_id, v.title, v.channel, v.markdown_path, v.last_updated,
+                   (SELECT COUNT(*) FROM patterns_run p WHERE p.video_id = v.video_id) AS patterns_count
+            FROM videos v
+        """
+        params: Tuple[Any, ...] = ()
+        if channel is not None:
+            query += " WHERE v.channel = ?"
+            params = (channel,)
+        query += " ORDER BY v.last_updated"
+
+        return [
+            (row['video_id'], {
+                'title': row['title'],
+                'channel': row['channel'],
+                'markdown_path': row['markdown_path'],
+                'last_processed': row['last_updated'],
+                'patterns_count': row['patterns_count']
+            })
+            for row in self._conn.execute(query, params)
+        ]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics
+
+        Returns:
+            Dict with total videos, patterns, tokens, etc.
+        """
+        row = self._conn.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM videos) AS total_videos,
+                (SELECT COUNT(*) FROM patterns_run) AS total_patterns,
+                (SELECT COALESCE(SUM(tokens_used), 0) FROM processing_events) AS total_tokens
+        """).fetchone()
+
+        return {
+            'total_videos': row['total_videos'],
+            'total_patterns': row['total_patterns'],
+            'total_tokens_used': row['total_tokens'],
+            'cache_directory': str(self.cache_dir)
+        }
+
+    def _write_entry(self, video_id: str, entry: CacheEntry) -> None:
+        """Replace all rows for a video (caller owns the transaction)"""
+        self._delete_rows(video_id)
+
+        self._conn.execute(
+            """
+            INSERT INTO videos (
+                video_id, video_url, title, channel, upload_date, duration_seconds,
+                transcript_word_count, markdown_path, last_updated, chunks, phase1_metadata
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                video_id, entry.video_url, entry.title, entry.channel or '',
+                entry.upload_date, entry.duration_seconds, entry.transcript_word_count,
+                entry.markdown_path, entry.last_updated,
+                json.dumps(entry.chunks) if entry.chunks is not None else None,
+                json.dumps(entry.phase1_metadata) if entry.phase1_metadata is not None else None
+            )
+        )
+        self._conn.executemany(
+            "INSERT INTO patterns_run (video_id, position, pattern) VALUES (?, ?, ?)",
+            [(video_id, i, pattern) for i, pattern in enumerate(entry.patterns_run)]
+        )
+        self._conn.executemany(
+            """
+            INSERT INTO processing_events (video_id, timestamp, mode, tokens_used, success, data)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    video_id,
+                    event.get('timestamp', ''),
+                    event.get('mode', ''),
+                    int(event.get('tokens_used', 0) or 0),
+                    1 if event.get('success', True) else 0,
+                    json.dumps(event)
+                )
+                for event in entry.processing_history
+            ]
+        )
+
+    def _delete_rows(self, video_id: str) -> None:
+        """Delete all rows for a video (caller owns the transaction)"""
+        self._conn.execute("DELETE FROM processing_events WHERE video_id = ?", (video_id,))
+        self._conn.execute("DELETE FROM patterns_run WHERE video_id = ?", (video_id,))
+        self._conn.execute("DELETE FROM videos WHERE video_id = ?", (video_id,))
+
+    def _migrate_json_cache(self) -> None:
+        """Import existing JSON cache files once (index.json + {video_id}.json)"""
+        migrated = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'json_migrated'"
+        ).fetchone()
+        if migrated or not self.index_file.exists():
+            return
+
+        try:
+            with open(self.index_file) as f:
+                video_ids = list(json.load(f).get('videos', {}).keys())
+        except json.JSONDecodeError:
+            print("⚠️  Warning: Corrupt index file, skipping JSON cache migration")
+            video_ids = []
+
+        imported = 0
+        with self._conn:
+            for video_id in video_ids:
+                cache_file = self.cache_dir / f"{video_id}.json"
+                try:
+                    with open(cache_file) as f:
+                        entry = CacheEntry.from_dict(json.load(f))
+                except (FileNotFoundError, json.JSONDecodeError, TypeError) as e:
+                    print(f"⚠️  Warning: Skipping cache for {video_id} during migration: {e}")
+                    continue
+                self._write_entry(video_id, entry)
+                imported += 1
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', ?)",
+                (str(imported),)
+            )
+
+        if imported:
+            print(f"💾 Migrated {imported} JSON cache entries to {self.db_path.name}")
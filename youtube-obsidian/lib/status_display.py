@@ -2,15 +2,16 @@
 Status display for video processing state.
 
 Provides `yt status VIDEO` functionality to show what has been analyzed
-for a video and what patterns have been run.
+for a video and what patterns have been run, and `yt status --all` to list
+every processed video straight from the cache index.
 """
 
 import re
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
-from .cache_manager import CacheManager, CacheEntry
+from .cache_manager import CacheEntry, create_cache_manager
 
 
 def extract_video_id(url_or_id: str) -> str:
@@ -87,19 +88,25 @@ def verify_note_exists(cache_entry: CacheEntry) -> bool:
     return note_path.exists()
 
 
-def display_video_status(url_or_id: str, cache_dir: Path, verbose: bool = False) -> Dict[str, Any]:
+def display_video_status(
+    url_or_id: str,
+    cache_dir: Path,
+    verbose: bool = False,
+    cache_backend: str = "json"
+) -> Dict[str, Any]:
     """Display status of a processed video.
     
     Args:
         url_or_id: YouTube URL or video ID
         cache_dir: Path to cache directory
         verbose: Show extra details
+        cache_backend: Cache storage backend ("json" or "sqlite")
         
     Returns:
         Dict with status info (for programmatic use)
     """
     video_id = extract_video_id(url_or_id)
-    cache_manager = CacheManager(cache_dir)
+    cache_manager = create_cache_manager(cache_dir, backend=cache_backend)
     
     result = {
         'video_id': video_id,
@@ -190,18 +197,19 @@ def display_video_status(url_or_id: str, cache_dir: Path, verbose: bool = False)
     return result
 
 
-def display_status_compact(url_or_id: str, cache_dir: Path) -> Optional[str]:
+def display_status_compact(url_or_id: str, cache_dir: Path, cache_backend: str = "json") -> Optional[str]:
     """Display compact one-line status for a video.
     
     Args:
         url_or_id: YouTube URL or video ID
         cache_dir: Path to cache directory
+        cache_backend: Cache storage backend ("json" or "sqlite")
         
     Returns:
         Status line or None if not found
     """
     video_id = extract_video_id(url_or_id)
-    cache_manager = CacheManager(cache_dir)
+    cache_manager = create_cache_manager(cache_dir, backend=cache_backend)
     
     if not cache_manager.exists(video_id):
         return None
@@ -219,3 +227,60 @@ def display_status_compact(url_or_id: str, cache_dir: Path) -> Optional[str]:
         title = title[:37] + "..."
     
     return f"{video_id}: {title} ({pattern_count} patterns){note_status}"
+
+
+def display_status_all(
+    cache_dir: Path,
+    check_notes: bool = False,
+    cache_backend: str = "json"
+) -> List[Dict[str, Any]]:
+    """Display one line per processed video, answered from the index alone.
+    
+    Never opens per-video cache files, so it stays fast for vaults with
+    thousands of videos.
+    
+    Args:
+        cache_dir: Path to cache directory
+        check_notes: Also verify each note file still exists
+        cache_backend: Cache storage backend ("json" or "sqlite")
+        
+    Returns:
+        List of dicts with video_id and index info (for programmatic use)
+    """
+    cache_manager = create_cache_manager(cache_dir, backend=cache_backend)
+    videos = cache_manager.list_all()
+    
+    if not videos:
+        print("\n  No processed videos in cache")
+        print()
+        return []
+    
+    # Most recently processed first
+    videos.sort(key=lambda item: item[1].get('last_processed', ''), reverse=True)
+    
+    print(f"\n  Processed Videos ({len(videos)})")
+    print(f"  {'=' * 70}")
+    
+    results = []
+    missing = 0
+    for video_id, info in videos:
+        title = info.get('title', 'Untitled')
+        if len(title) > 40:
+            title = title[:37] + "..."
+        
+        note_status = ""
+        if check_notes:
+            note_path = info.get('markdown_path', '')
+            if not note_path or not Path(note_path).expanduser().exists():
+                note_status = " [NOTE_MISSING]"
+                missing += 1
+        
+        last = format_timestamp(info.get('last_processed', ''))
+        print(f"  {video_id}  {last:16}  {info.get('patterns_count', 0):3} patterns  {title}{note_status}")
+        results.append({'video_id': video_id, **info})
+    
+    if check_notes and missing:
+        print(f"\n  {missing} note(s) missing. Run: ./yt --force \"URL\" to regenerate")
+    
+    print()
+    return results
@@ -9,15 +9,52 @@ Phase: 1B - Transcript Integration
 Status: Implementation skeleton (ready for development)
 """
 
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Pattern, Sequence
 import requests
 import re
 
 
+# Sound/music markers stripped from transcripts (matched case-insensitively,
+# inside square brackets or parentheses). Includes the common non-English
+# variants YouTube emits for auto-captions.
+DEFAULT_SOUND_MARKERS = (
+    'music', 'applause', 'laughter', 'cheering', 'silence', 'inaudible',
+    'música', 'musica', 'aplausos', 'risas', 'risos',
+    'musique', 'applaudissements', 'rires',
+    'musik', 'applaus', 'gelächter', 'lachen',
+    'applausi', 'risate',
+    '音楽', '拍手', '笑',
+)
+
+
+@lru_cache(maxsize=8)
+def _compile_marker_pattern(markers: Sequence[str]) -> Pattern[str]:
+    """Compile one case-insensitive alternation for all sound markers."""
+    # Longest first so overlapping alternatives never shadow each other
+    unique = sorted(set(markers), key=len, reverse=True)
+    alternation = '|'.join(re.escape(m) for m in unique)
+    return re.compile(rf'\[\s*(?:{alternation})\s*\]|\(\s*(?:{alternation})\s*\)', re.IGNORECASE)
+
+
+def get_marker_pattern(markers: Optional[Sequence[str]] = None) -> Pattern[str]:
+    """
+    Get the precompiled sound-marker regex for a marker list.
+    
+    Args:
+        markers: Marker words to strip (default: DEFAULT_SOUND_MARKERS)
+        
+    Returns:
+        Compiled pattern matching "[Marker]" and "(marker)" in any case
+    """
+    return _compile_marker_pattern(tuple(markers) if markers else DEFAULT_SOUND_MARKERS)
+
+
 def extract_transcript_from_info(
     info: Dict[str, Any],
     lang: str = 'en',
-    prefer_manual: bool = True
+    prefer_manual: bool = True,
+    sound_markers: Optional[Sequence[str]] = None
 ) -> Optional[str]:
     """
     Extract transcript text from yt-dlp info dictionary.
@@ -30,6 +67,7 @@ def extract_transcript_from_info(
         info: yt-dlp info dictionary containing subtitle metadata
         lang: Language code (e.g., 'en', 'pt') (default: 'en')
         prefer_manual: Prefer manual captions over auto-generated (default: True)
+        sound_markers: Marker words to strip (default: DEFAULT_SOUND_MARKERS)
         
     Returns:
         Plain text transcript or None if unavailable
@@ -49,9 +87,9 @@ def extract_transcript_from_info(
                 if url:
                     data = fetch_subtitle_content(url)
                     if data:
-                        text = parse_json3_to_text(data)
+                        text = parse_json3_to_text(data, sound_markers=sound_markers)
                         if text:
-                            return sanitize_transcript_text(text)
+                            return text
         
         # Try auto-generated captions
         auto_captions = info.get('automatic_captions', {})
@@ -60,9 +98,9 @@ def extract_transcript_from_info(
             if url:
                 data = fetch_subtitle_content(url)
                 if data:
-                    text = parse_json3_to_text(data)
+                    text = parse_json3_to_text(data, sound_markers=sound_markers)
                     if text:
-                        return sanitize_transcript_text(text)
+                        return text
         
         # Try manual subtitles as fallback (if we tried auto first)
         if not prefer_manual:
@@ -72,9 +110,9 @@ def extract_transcript_from_info(
                 if url:
                     data = fetch_subtitle_content(url)
                     if data:
-                        text = parse_json3_to_text(data)
+                        text = parse_json3_to_text(data, sound_markers=sound_markers)
                         if text:
-                            return sanitize_transcript_text(text)
+                            return text
         
         # Not available
         return None
@@ -119,7 +157,11 @@ def fetch_subtitle_content(subtitle_url: str, timeout: int = 10) -> Optional[Dic
         raise SubtitleParseError(f"Invalid JSON in subtitle response: {e}")
 
 
-def parse_json3_to_text(json_data: Dict[str, Any]) -> Optional[str]:
+def parse_json3_to_text(
+    json_data: Dict[str, Any],
+    sanitize: bool = True,
+    sound_markers: Optional[Sequence[str]] = None
+) -> Optional[str]:
     """
     Convert JSON3 subtitle format to plain text.
     
@@ -139,13 +181,18 @@ def parse_json3_to_text(json_data: Dict[str, Any]) -> Optional[str]:
         }
     
     This function extracts all text segments and joins them into a single
-    readable string, preserving natural line breaks.
+    readable string. When sanitize is enabled, sound markers are stripped from
+    the joined text (so a marker split across events, e.g. "[" + "Music]", is
+    caught too) and whitespace is collapsed in the same pass
+    (equivalent to sanitize_transcript_text).
     
     Args:
         json_data: Parsed JSON3 subtitle data
+        sanitize: Strip sound markers and collapse whitespace (default: True)
+        sound_markers: Marker words to strip (default: DEFAULT_SOUND_MARKERS)
         
     Returns:
-        Plain text transcript with newlines preserved, or None if parsing fails
+        Plain text transcript, or None if no text was found
         
     Example:
         >>> json_data = {"events": [{"segs": [{"utf8": "Hello"}, {"utf8": " world"}]}]}
@@ -154,7 +201,7 @@ def parse_json3_to_text(json_data: Dict[str, Any]) -> Optional[str]:
         'Hello world'
     """
     try:
-        text_parts = []
+        text_parts: List[str] = []
         
         for event in json_data.get('events', []):
             if 'segs' not in event:
@@ -164,11 +211,22 @@ def parse_json3_to_text(json_data: Dict[str, Any]) -> Optional[str]:
             line = ''.join(seg.get('utf8', '') for seg in event['segs']).strip()
             
             # Skip empty lines and standalone newlines
-            if line and line != '\n':
+            if line:
                 text_parts.append(line)
         
+        if not text_parts:
+            return None
+        
         # Join with spaces (preserves readability)
-        return ' '.join(text_parts) if text_parts else None
+        text = ' '.join(text_parts)
+        
+        if sanitize:
+            # Markers may span events, so strip them only after joining
+            if '[' in text or '(' in text:
+                text = get_marker_pattern(sound_markers).sub('', text)
+            text = ' '.join(text.split())
+        
+        return text or None
         
     except Exception as e:
         raise SubtitleParseError(f"Failed to parse JSON3 format: {e}")
@@ -276,17 +334,23 @@ def get_transcript_metadata(
     }
 
 
-def sanitize_transcript_text(text: str) -> Optional[str]:
+def sanitize_transcript_text(
+    text: str,
+    sound_markers: Optional[Sequence[str]] = None
+) -> Optional[str]:
     """
     Clean up transcript text for readability.
     
     Removes common artifacts from auto-generated transcripts:
     - Multiple consecutive spaces
-    - Unusual Unicode characters
     - Music/sound effect markers (e.g., "[Music]", "(applause)")
     
+    Uses a single precompiled case-insensitive pattern for all markers and
+    one whitespace normalization pass.
+    
     Args:
         text: Raw transcript text
+        sound_markers: Marker words to strip (default: DEFAULT_SOUND_MARKERS)
         
     Returns:
         Cleaned transcript text, or None if sanitization fails
@@ -301,24 +365,11 @@ def sanitize_transcript_text(text: str) -> Optional[str]:
         return None
     
     try:
-        # Remove common sound/music markers
-        markers = [
-            r'\[Music\]', r'\[music\]', r'\[MUSIC\]',
-            r'\[Applause\]', r'\[applause\]', r'\[APPLAUSE\]',
-            r'\[Laughter\]', r'\[laughter\]', r'\[LAUGHTER\]',
-            r'\(Music\)', r'\(music\)', r'\(MUSIC\)',
-            r'\(Applause\)', r'\(applause\)', r'\(APPLAUSE\)',
-            r'\(Laughter\)', r'\(laughter\)', r'\(LAUGHTER\)',
-        ]
-        
-        for marker in markers:
-            text = re.sub(marker, '', text)
-        
-        # Remove multiple consecutive spaces
-        text = re.sub(r'\s+', ' ', text)
+        # Remove sound/music markers in one pass
+        text = get_marker_pattern(sound_markers).sub('', text)
         
-        # Remove leading/trailing whitespace
-        text = text.strip()
+        # Collapse whitespace runs and trim
+        text = ' '.join(text.split())
         
         return text if text else None
         
@@ -0,0 +1,212 @@
+"""Extractive representative sampling of long transcripts.
+
+Phase 1 only needs a sample of a long transcript, but the first/last words
+miss everything in between. This module picks the most informative
+sentences from across the whole transcript, without any LLM call:
+
+1. Split into units: sentences, or fixed word windows for unpunctuated
+   auto-captions
+2. Weight terms TF-IDF style: frequent in the transcript overall, but
+   concentrated in few units (topic words rather than filler)
+3. Score each unit by the weights of its distinct terms, normalized by
+   sqrt(length) so long rambling units don't win by size alone
+4. Spread the budget: split the transcript into equal regions and take
+   the best unit from each region first, then fill the rest of the
+   budget greedily, discounting terms already in the sample so the
+   sample covers many topics
+5. Emit selected units in their original order, with a GAP_MARKER between
+   non-adjacent ones (markers count against the word budget)
+
+Weights are one pass over the words; selection is a lazily re-scored
+heap, so the cost is roughly linear in transcript length.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Set, Tuple
+
+# Words per unit when the transcript has no sentence punctuation
+WINDOW_WORDS = 30
+# Units longer than this are split further (run-on auto-caption sentences)
+MAX_UNIT_WORDS = 60
+# Separator between non-adjacent selected units
+GAP_MARKER = "..."
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9'+#.-]*[a-z0-9+#]|[a-z0-9]")
+
+_STOP_WORDS = frozenset("""
+a about above after again all also am an and any are as at be because been
+before being below between both but by can could did do does doing don done
+down during each even few for from further get gets getting go going gonna got
+had has have having he her here hers him his how i if in into is it its itself
+just know kind like lot me more most much my no nor not now of off on once one
+only or other our out over own really right said same say see she should so
+some something such than that the their them then there these they thing
+things think this those through to too um uh under until up us very want was
+way we well were what when where which while who whom why will with would
+yeah yes you your
+""".split())
+
+
+def split_units(text: str) -> List[str]:
+    """Split a transcript into sentence-like units.
+
+    Args:
+        text: Transcript text
+
+    Returns:
+        List of units (sentences, or word windows for unpunctuated text)
+    """
+    words = text.split()
+    if not words:
+        return []
+
+    # Same density heuristic as token_counter: <1 sentence end per 100 words
+    # means auto-captions without punctuation
+    punct_count = len(re.findall(r'[.!?]', text))
+    if punct_count / len(words) <= 0.01:
+        return [' '.join(words[i:i + WINDOW_WORDS]) for i in range(0, len(words), WINDOW_WORDS)]
+
+    units = []
+    for sentence in _SENTENCE_END.split(text):
+        sentence_words = sentence.split()
+        for i in range(0, len(sentence_words), MAX_UNIT_WORDS):
+            units.append(' '.join(sentence_words[i:i + MAX_UNIT_WORDS]))
+    return [u for u in units if u]
+
+
+def _terms(unit: str) -> List[str]:
+    """Content terms of a unit (lowercased, stop words removed)"""
+    return [t for t in _TOKEN.findall(unit.lower()) if t not in _STOP_WORDS and len(t) > 2]
+
+
+def term_weights(units: List[str]) -> Tuple[List[Set[str]], Dict[str, float]]:
+    """Compute TF-IDF style term weights over the units.
+
+    Args:
+        units: Transcript units in order
+
+    Returns:
+        Tuple of (distinct terms per unit, weight per term)
+    """
+    unit_terms = []
+    term_freq: Counter = Counter()
+    doc_freq: Counter = Counter()
+    for unit in units:
+        terms = _terms(unit)
+        term_freq.update(terms)
+        distinct = set(terms)
+        doc_freq.update(distinct)
+        unit_terms.append(distinct)
+
+    n = len(units)
+    weights = {
+        term: math.log1p(tf) * math.log((1 + n) / (1 + doc_freq[term]))
+        for term, tf in term_freq.items()
+        if tf > 1  # Terms seen once are noise, not topics
+    }
+    return unit_terms, weights
+
+
+def _unit_score(terms: Set[str], length: int, weights: Dict[str, float], covered: Counter) -> float:
+    """Weight of a unit's terms, discounted for terms already in the sample"""
+    total = sum(weights.get(t, 0.0) / (1 + covered[t]) for t in terms)
+    return total / math.sqrt(max(1, length))
+
+
+def select_units(units: List[str], max_words: int) -> List[int]:
+    """Pick unit indices within a word budget with positional spread.
+
+    Each selected unit discounts its terms for later picks, so the sample
+    covers many topics instead of repeating the highest-weighted one.
+    The GAP_MARKER words between non-adjacent units are part of the budget.
+
+    Args:
+        units: Transcript units in order
+        max_words: Word budget for the sample, gap markers included
+
+    Returns:
+        Selected indices in original order
+    """
+    lengths = [len(u.split()) for u in units]
+    if sum(lengths) <= max_words:
+        return list(range(len(units)))
+
+    unit_terms, weights = term_weights(units)
+    covered: Counter = Counter()
+    scores = [_unit_score(t, l, weights, covered) for t, l in zip(unit_terms, lengths)]
+
+    selected = set()
+    used = 0  # Unit words plus one GAP_MARKER word per gap
+    runs = 0  # Runs of adjacent selected units; gaps = runs - 1
+
+    def cost(i: int) -> int:
+        """Words that taking unit i adds, including a gap marker change"""
+        neighbours = (i - 1 in selected) + (i + 1 in selected)
+        new_runs = runs + 1 - neighbours
+        return lengths[i] + max(0, new_runs - 1) - max(0, runs - 1)
+
+    def take(i: int) -> None:
+        nonlocal used, runs
+        used += cost(i)
+        runs += 1 - ((i - 1 in selected) + (i + 1 in selected))
+        selected.add(i)
+        covered.update(unit_terms[i])
+
+    # One best unit per region keeps beginning, middle and end represented
+    avg_len = max(1, sum(lengths) // len(units))
+    regions = max(1, min(len(units), max_words // avg_len // 2))
+    region_size = len(units) / regions
+    for r in range(regions):
+        start, end = int(r * region_size), int((r + 1) * region_size)
+        if start >= end:
+            continue
+        best = max(range(start, end), key=scores.__getitem__)
+        if used + cost(best) <= max_words:
+            take(best)
+
+    # Fill the remaining budget greedily by discounted score. Scores only
+    # go down as coverage grows, so a lazily re-scored heap is exact.
+    heap = [(-s, i) for i, s in enumerate(scores) if i not in selected]
+    heapq.heapify(heap)
+    while heap and max_words - used >= WINDOW_WORDS // 2:
+        neg_score, i = heapq.heappop(heap)
+        current = _unit_score(unit_terms[i], lengths[i], weights, covered)
+        if heap and current < -heap[0][0] and current < -neg_score:
+            heapq.heappush(heap, (-current, i))
+            continue
+        if used + cost(i) <= max_words:
+            take(i)
+
+    return sorted(selected)
+
+
+def extract_representative_sample(text: str, max_words: int = 1500) -> str:
+    """Build an extractive sample of a transcript within a word budget.
+
+    Args:
+        text: Full transcript text
+        max_words: Word budget for the sample, gap markers included
+            (default: 1500)
+
+    Returns:
+        Sample text: selected units in order, with GAP_MARKER between
+        non-adjacent units. The full text if it already fits.
+    """
+    units = split_units(text)
+    if not units:
+        return text
+
+    indices = select_units(units, max_words)
+
+    parts = []
+    previous = None
+    for i in indices:
+        if previous is not None and i != previous + 1:
+            parts.append(GAP_MARKER)
+        parts.append(units[i])
+        previous = i
+    return ' '.join(parts)
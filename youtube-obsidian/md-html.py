@@ -2,14 +2,276 @@
 """
 Enhanced Obsidian to HTML converter that preserves frontmatter,
 callouts, internal links, tags, and applies beautiful styling.
+
+Converts a single note, or a whole vault folder when given a directory:
+notes are rendered by a pool of worker processes (each reusing one
+Markdown instance), pages link a shared stylesheet written once, and
+notes whose HTML is newer than the source are skipped. [[Wiki links]]
+resolve to the target note's page through an index of note paths,
+aliases and titles (built from frontmatter, cached in the output folder);
+a page is also rebuilt when a link it uses now resolves elsewhere, and
+broken links are reported.
+
+Usage:
+    python md-html.py note.md
+    python md-html.py note.md -o note.html
+    python md-html.py ~/vault -o ~/vault-html
+    python md-html.py ~/vault -o ~/vault-html --jobs 8 --force
 """
 
+import json
+import os
 import re
+import sys
+import time
 import yaml
 import markdown
+from markdown.extensions.toc import slugify
 from pathlib import Path
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from textwrap import indent
+from urllib.parse import quote
+
+# Shared stylesheet written once per output folder in directory mode
+STYLESHEET_NAME = 'obsidian.css'
+
+# Wiki-link index cache (note titles/aliases -> output pages), per output folder
+LINK_INDEX_NAME = '.link-index.json'
+LINK_INDEX_VERSION = 2
+
+MARKDOWN_EXTENSIONS = ['extra', 'codehilite', 'toc', 'tables']
+
+STYLESHEET = """:root {
+    --bg-primary: #1e1e1e;
+    --bg-secondary: #2d2d2d;
+    --text-primary: #dcddde;
+    --text-secondary: #b9bbbe;
+    --accent: #7c3aed;
+    --accent-hover: #9333ea;
+    --callout-note: #3b82f6;
+    --callout-warning: #f59e0b;
+    --callout-tip: #10b981;
+    --callout-important: #ef4444;
+    --callout-info: #06b6d4;
+}
+
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', sans-serif;
+    line-height: 1.6;
+    color: var(--text-primary);
+    background: var(--bg-primary);
+    padding: 20px;
+}
+
+.container {
+    max-width: 900px;
+    margin: 0 auto;
+    background: var(--bg-secondary);
+    padding: 40px;
+    border-radius: 12px;
+    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
+}
+
+h1 {
+    color: var(--accent);
+    font-size: 2.5em;
+    margin-bottom: 20px;
+    border-bottom: 3px solid var(--accent);
+    padding-bottom: 10px;
+}
+
+h2 {
+    color: var(--text-primary);
+    font-size: 1.8em;
+    margin-top: 30px;
+    margin-bottom: 15px;
+    border-left: 4px solid var(--accent);
+    padding-left: 15px;
+}
+
+h3 {
+    color: var(--text-secondary);
+    font-size: 1.4em;
+    margin-top: 25px;
+    margin-bottom: 12px;
+}
+
+.frontmatter {
+    background: rgba(124, 58, 237, 0.1);
+    border-left: 4px solid var(--accent);
+    padding: 20px;
+    margin-bottom: 30px;
+    border-radius: 6px;
+    font-size: 0.95em;
+}
+
+.fm-item {
+    margin: 8px 0;
+    color: var(--text-secondary);
+}
+
+.fm-item strong {
+    color: var(--accent);
+    margin-right: 8px;
+}
+
+.callout {
+    margin: 20px 0;
+    padding: 16px;
+    border-radius: 8px;
+    border-left: 4px solid;
+}
+
+.callout-note {
+    background: rgba(59, 130, 246, 0.1);
+    border-color: var(--callout-note);
+}
+
+.callout-warning {
+    background: rgba(245, 158, 11, 0.1);
+    border-color: var(--callout-warning);
+}
+
+.callout-tip {
+    background: rgba(16, 185, 129, 0.1);
+    border-color: var(--callout-tip);
+}
+
+.callout-important {
+    background: rgba(239, 68, 68, 0.1);
+    border-color: var(--callout-important);
+}
+
+.callout-info {
+    background: rgba(6, 182, 212, 0.1);
+    border-color: var(--callout-info);
+}
+
+.callout-title {
+    font-weight: 700;
+    margin-bottom: 8px;
+    text-transform: uppercase;
+    font-size: 0.9em;
+    letter-spacing: 0.5px;
+}
+
+.internal-link {
+    color: var(--accent);
+    text-decoration: none;
+    border-bottom: 1px dashed var(--accent);
+    transition: all 0.2s;
+}
+
+.internal-link:hover {
+    color: var(--accent-hover);
+    border-bottom-style: solid;
+}
+
+.broken-link {
+    color: var(--callout-important);
+    border-bottom: 1px dotted var(--callout-important);
+}
+
+.tag {
+    background: rgba(124, 58, 237, 0.2);
+    color: var(--accent);
+    padding: 2px 8px;
+    border-radius: 4px;
+    font-size: 0.9em;
+    font-weight: 500;
+}
+
+code {
+    background: rgba(0, 0, 0, 0.3);
+    padding: 2px 6px;
+    border-radius: 4px;
+    font-family: 'Consolas', 'Monaco', monospace;
+    font-size: 0.9em;
+    color: #f472b6;
+}
+
+pre {
+    background: rgba(0, 0, 0, 0.5);
+    padding: 16px;
+    border-radius: 8px;
+    overflow-x: auto;
+    margin: 20px 0;
+}
+
+pre code {
+    background: none;
+    padding: 0;
+    color: var(--text-primary);
+}
+
+a {
+    color: var(--accent);
+    transition: color 0.2s;
+}
+
+a:hover {
+    color: var(--accent-hover);
+}
+
+blockquote {
+    border-left: 4px solid var(--accent);
+    padding-left: 20px;
+    margin: 20px 0;
+    color: var(--text-secondary);
+    font-style: italic;
+}
+
+table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 20px 0;
+}
+
+th, td {
+    padding: 12px;
+    text-align: left;
+    border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+}
+
+th {
+    background: rgba(124, 58, 237, 0.2);
+    color: var(--accent);
+    font-weight: 600;
+}
+
+ul, ol {
+    margin: 15px 0;
+    padding-left: 30px;
+}
+
+li {
+    margin: 8px 0;
+}
+
+img {
+    max-width: 100%;
+    border-radius: 8px;
+    margin: 20px 0;
+}
+"""
+
+_WIKI_LINK = re.compile(r'\[\[([^\]|]+)(?:\|([^\]]+))?\]\]')
+_CALLOUT = re.compile(r'> \[!(\w+)\]([+-]?)\s*(.*?)\n((?:>.*?\n)*)', re.MULTILINE)
+_TAG = re.compile(r'(?<![\w"])#([\w/-]+)')
+
+# One Markdown instance per process, reset between documents
+_markdown = None
+
+# Wiki-link index of the vault being converted (directory mode)
+_link_index = None
 
 
 def parse_frontmatter(content):
@@ -21,7 +283,7 @@ def parse_frontmatter(content):
         parts = content.split('---', 2)
         if len(parts) >= 3:
             try:
-                frontmatter = yaml.safe_load(parts[1])
+                frontmatter = yaml.safe_load(parts[1]) or {}
                 body = parts[2].strip()
             except yaml.YAMLError:
                 pass
@@ -29,21 +291,32 @@ def parse_frontmatter(content):
     return frontmatter, body
 
 
-def convert_obsidian_links(text):
-    """Convert [[wiki links]] to HTML links."""
-    # Internal links: [[Page]] or [[Page|Display Text]]
-    text = re.sub(
-        r'\[\[([^\]|]+)(?:\|([^\]]+))?\]\]',
-        lambda m: f'<a href="#{m.group(1).lower().replace(" ", "-")}" class="internal-link">{m.group(2) or m.group(1)}</a>',
-        text
-    )
-    return text
+def convert_obsidian_links(text, resolve=None, broken=None):
+    """Convert [[wiki links]] to HTML links.
+    
+    Without a resolver, links become #slug anchors. With one (directory
+    mode), resolve(target) returns the page URL or None; unresolved links
+    are rendered as broken and their targets appended to broken.
+    """
+    def replace_link(match):
+        target = match.group(1)
+        display = match.group(2) or target
+        if resolve is None:
+            return f'<a href="#{target.lower().replace(" ", "-")}" class="internal-link">{display}</a>'
+        
+        href = resolve(target)
+        if href is None:
+            if broken is not None:
+                broken.append(target)
+            return f'<span class="internal-link broken-link" title="Missing note: {target}">{display}</span>'
+        return f'<a href="{href}" class="internal-link">{display}</a>'
+    
+    # Internal links: [[Page]], [[Page|Display Text]], [[Page#Heading]]
+    return _WIKI_LINK.sub(replace_link, text)
 
 
 def convert_obsidian_callouts(text):
     """Convert Obsidian callouts to HTML."""
-    callout_pattern = r'> \[!(\w+)\]([+-]?)\s*(.*?)\n((?:>.*?\n)*)'
-    
     def replace_callout(match):
         callout_type = match.group(1).lower()
         fold = match.group(2)
@@ -55,29 +328,37 @@ def convert_obsidian_callouts(text):
     <div class="callout-content">{content}</div>
 </div>'''
     
-    return re.sub(callout_pattern, replace_callout, text, flags=re.MULTILINE)
+    return _CALLOUT.sub(replace_callout, text)
 
 
 def convert_tags(text):
     """Convert #tags to styled spans."""
-    return re.sub(
-        r'(?<!\w)#([\w/-]+)',
-        r'<span class="tag">#\1</span>',
-        text
-    )
+    return _TAG.sub(r'<span class="tag">#\1</span>', text)
+
+
+def get_markdown():
+    """Return this process's Markdown instance, reset for a new document."""
+    global _markdown
+    if _markdown is None:
+        _markdown = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    return _markdown.reset()
 
 
-def generate_html(frontmatter, body, title):
-    """Generate complete HTML document with styling."""
+def generate_html(frontmatter, body, title, stylesheet_href=None, resolve_link=None, broken_links=None):
+    """Generate complete HTML document with styling.
+    
+    The stylesheet is inlined unless stylesheet_href is given, in which
+    case the page links to the shared stylesheet instead. resolve_link and
+    broken_links are passed to convert_obsidian_links.
+    """
     
     # Process Obsidian-specific syntax
     body = convert_obsidian_callouts(body)
-    body = convert_obsidian_links(body)
+    body = convert_obsidian_links(body, resolve_link, broken_links)
     body = convert_tags(body)
     
     # Convert markdown to HTML
-    md = markdown.Markdown(extensions=['extra', 'codehilite', 'toc', 'tables'])
-    html_body = md.convert(body)
+    html_body = get_markdown().convert(body)
     
     # Build frontmatter display
     fm_html = ""
@@ -91,227 +372,18 @@ def generate_html(frontmatter, body, title):
     
     page_title = frontmatter.get('title', title)
     
+    if stylesheet_href:
+        style_html = f'<link rel="stylesheet" href="{stylesheet_href}">'
+    else:
+        style_html = f'<style>\n{indent(STYLESHEET, " " * 8)}    </style>'
+    
     html_template = f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{page_title}</title>
-    <style>
-        :root {{
-            --bg-primary: #1e1e1e;
-            --bg-secondary: #2d2d2d;
-            --text-primary: #dcddde;
-            --text-secondary: #b9bbbe;
-            --accent: #7c3aed;
-            --accent-hover: #9333ea;
-            --callout-note: #3b82f6;
-            --callout-warning: #f59e0b;
-            --callout-tip: #10b981;
-            --callout-important: #ef4444;
-            --callout-info: #06b6d4;
-        }}
-        
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', sans-serif;
-            line-height: 1.6;
-            color: var(--text-primary);
-            background: var(--bg-primary);
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 900px;
-            margin: 0 auto;
-            background: var(--bg-secondary);
-            padding: 40px;
-            border-radius: 12px;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-        }}
-        
-        h1 {{
-            color: var(--accent);
-            font-size: 2.5em;
-            margin-bottom: 20px;
-            border-bottom: 3px solid var(--accent);
-            padding-bottom: 10px;
-        }}
-        
-        h2 {{
-            color: var(--text-primary);
-            font-size: 1.8em;
-            margin-top: 30px;
-            margin-bottom: 15px;
-            border-left: 4px solid var(--accent);
-            padding-left: 15px;
-        }}
-        
-        h3 {{
-            color: var(--text-secondary);
-            font-size: 1.4em;
-            margin-top: 25px;
-            margin-bottom: 12px;
-        }}
-        
-        .frontmatter {{
-            background: rgba(124, 58, 237, 0.1);
-            border-left: 4px solid var(--accent);
-            padding: 20px;
-            margin-bottom: 30px;
-            border-radius: 6px;
-            font-size: 0.95em;
-        }}
-        
-        .fm-item {{
-            margin: 8px 0;
-            color: var(--text-secondary);
-        }}
-        
-        .fm-item strong {{
-            color: var(--accent);
-            margin-right: 8px;
-        }}
-        
-        .callout {{
-            margin: 20px 0;
-            padding: 16px;
-            border-radius: 8px;
-            border-left: 4px solid;
-        }}
-        
-        .callout-note {{
-            background: rgba(59, 130, 246, 0.1);
-            border-color: var(--callout-note);
-        }}
-        
-        .callout-warning {{
-            background: rgba(245, 158, 11, 0.1);
-            border-color: var(--callout-warning);
-        }}
-        
-        .callout-tip {{
-            background: rgba(16, 185, 129, 0.1);
-            border-color: var(--callout-tip);
-        }}
-        
-        .callout-important {{
-            background: rgba(239, 68, 68, 0.1);
-            border-color: var(--callout-important);
-        }}
-        
-        .callout-info {{
-            background: rgba(6, 182, 212, 0.1);
-            border-color: var(--callout-info);
-        }}
-        
-        .callout-title {{
-            font-weight: 700;
-            margin-bottom: 8px;
-            text-transform: uppercase;
-            font-size: 0.9em;
-            letter-spacing: 0.5px;
-        }}
-        
-        .internal-link {{
-            color: var(--accent);
-            text-decoration: none;
-            border-bottom: 1px dashed var(--accent);
-            transition: all 0.2s;
-        }}
-        
-        .internal-link:hover {{
-            color: var(--accent-hover);
-            border-bottom-style: solid;
-        }}
-        
-        .tag {{
-            background: rgba(124, 58, 237, 0.2);
-            color: var(--accent);
-            padding: 2px 8px;
-            border-radius: 4px;
-            font-size: 0.9em;
-            font-weight: 500;
-        }}
-        
-        code {{
-            background: rgba(0, 0, 0, 0.3);
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-family: 'Consolas', 'Monaco', monospace;
-            font-size: 0.9em;
-            color: #f472b6;
-        }}
-        
-        pre {{
-            background: rgba(0, 0, 0, 0.5);
-            padding: 16px;
-            border-radius: 8px;
-            overflow-x: auto;
-            margin: 20px 0;
-        }}
-        
-        pre code {{
-            background: none;
-            padding: 0;
-            color: var(--text-primary);
-        }}
-        
-        a {{
-            color: var(--accent);
-            transition: color 0.2s;
-        }}
-        
-        a:hover {{
-            color: var(--accent-hover);
-        }}
-        
-        blockquote {{
-            border-left: 4px solid var(--accent);
-            padding-left: 20px;
-            margin: 20px 0;
-            color: var(--text-secondary);
-            font-style: italic;
-        }}
-        
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }}
-        
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }}
-        
-        th {{
-            background: rgba(124, 58, 237, 0.2);
-            color: var(--accent);
-            font-weight: 600;
-        }}
-        
-        ul, ol {{
-            margin: 15px 0;
-            padding-left: 30px;
-        }}
-        
-        li {{
-            margin: 8px 0;
-        }}
-        
-        img {{
-            max-width: 100%;
-            border-radius: 8px;
-            margin: 20px 0;
-        }}
-    </style>
+    {style_html}
 </head>
 <body>
     <div class="container">
@@ -325,12 +397,279 @@ def generate_html(frontmatter, body, title):
     return html_template
 
 
+def convert_file(input_path, output_path, stylesheet_href=None, resolve_link=None):
+    """Convert one markdown file to HTML.
+    
+    Returns:
+        List of wiki-link targets that could not be resolved
+    """
+    with open(input_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    broken = []
+    frontmatter, body = parse_frontmatter(content)
+    html = generate_html(frontmatter, body, input_path.stem, stylesheet_href, resolve_link, broken)
+    
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    
+    return broken
+
+
+def read_frontmatter(path):
+    """Parse only the YAML frontmatter of a note, without reading the body."""
+    with open(path, 'r', encoding='utf-8') as f:
+        if f.readline().rstrip() != '---':
+            return {}
+        lines = []
+        for line in f:
+            if line.rstrip() == '---':
+                break
+            lines.append(line)
+        else:
+            return {}
+    
+    try:
+        frontmatter = yaml.safe_load(''.join(lines))
+    except yaml.YAMLError:
+        return {}
+    return frontmatter if isinstance(frontmatter, dict) else {}
+
+
+def _link_key(target):
+    """Normalize a link target or note name for lookup."""
+    target = target.strip().replace('\\', '/')
+    if target.lower().endswith('.md'):
+        target = target[:-3]
+    return target.lower()
+
+
+def build_link_index(input_dir, notes, cache_path):
+    """Map wiki-link targets to output pages for a vault.
+    
+    Only frontmatter is read, and only for notes that changed since the
+    cached index (same mtime and size are reused). A target resolves, in
+    order of precedence, by vault path ([[folder/Note]]), file name,
+    alias, then title; ties go to the first note in path order.
+    
+    Returns:
+        Tuple of (links dict of target key -> page path relative to the
+        output folder, index dict for save_link_index whose 'pages' maps
+        each note to the link keys its current HTML was rendered with)
+    """
+    cached = {}
+    cached_pages = {}
+    try:
+        data = json.loads(cache_path.read_text(encoding='utf-8'))
+        if data.get('version') == LINK_INDEX_VERSION:
+            cached = data.get('notes', {})
+            cached_pages = data.get('pages', {})
+    except (FileNotFoundError, ValueError):
+        pass
+    
+    entries = {}
+    rescanned = 0
+    for input_path in notes:
+        rel = input_path.relative_to(input_dir).as_posix()
+        stat = input_path.stat()
+        entry = cached.get(rel)
+        if not entry or entry.get('mtime') != stat.st_mtime or entry.get('size') != stat.st_size:
+            frontmatter = read_frontmatter(input_path)
+            aliases = frontmatter.get('aliases') or frontmatter.get('alias') or []
+            if isinstance(aliases, str):
+                aliases = [aliases]
+            title = frontmatter.get('title')
+            entry = {
+                'mtime': stat.st_mtime,
+                'size': stat.st_size,
+                'title': str(title) if title else None,
+                'aliases': [str(a) for a in aliases if a]
+            }
+            rescanned += 1
+        entries[rel] = entry
+    
+    links = {}
+    ordered = sorted(entries.items())
+    for rel, _ in ordered:
+        links.setdefault(_link_key(rel), rel[:-3] + '.html')
+    for rel, _ in ordered:
+        links.setdefault(_link_key(Path(rel).name), rel[:-3] + '.html')
+    for rel, entry in ordered:
+        for alias in entry['aliases']:
+            links.setdefault(_link_key(alias), rel[:-3] + '.html')
+    for rel, entry in ordered:
+        if entry['title']:
+            links.setdefault(_link_key(entry['title']), rel[:-3] + '.html')
+    
+    pages = {rel: keys for rel, keys in cached_pages.items() if rel in entries}
+    
+    print(f"🔗 Link index: {len(links)} targets for {len(entries)} notes ({rescanned} rescanned)")
+    return links, {'version': LINK_INDEX_VERSION, 'notes': entries, 'pages': pages}
+
+
+def save_link_index(cache_path, index):
+    """Write the link index cache atomically (after the pages it describes)."""
+    tmp_path = cache_path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(index), encoding='utf-8')
+    os.replace(tmp_path, cache_path)
+
+
+def links_unchanged(used, links):
+    """True if every link key a page was rendered with still resolves the same way."""
+    return used is not None and all(links.get(key) == target for key, target in used.items())
+
+
+def make_link_resolver(links, page_rel, used=None):
+    """Resolver for convert_obsidian_links from one page (path relative to the output folder).
+    
+    Lookups are recorded in used (link key -> page path or None), if given.
+    """
+    page_dir = os.path.dirname(page_rel)
+    
+    def resolve(target):
+        name, _, heading = target.partition('#')
+        anchor = f"#{slugify(heading, '-')}" if heading else ''
+        if not name.strip():
+            return anchor or None  # [[#Heading]] links within the page
+        
+        key = _link_key(name)
+        target_rel = links.get(key)
+        if used is not None:
+            used[key] = target_rel
+        if target_rel is None:
+            return None
+        return quote(os.path.relpath(target_rel, page_dir or '.').replace(os.sep, '/')) + anchor
+    
+    return resolve
+
+
+def _init_worker(links):
+    global _link_index
+    _link_index = links
+
+
+def find_notes(input_dir):
+    """All markdown files in a vault folder, skipping hidden folders (.obsidian, .trash)."""
+    notes = []
+    for root, dirs, files in os.walk(input_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        notes.extend(Path(root) / name for name in sorted(files) if name.endswith('.md'))
+    return notes
+
+
+def is_up_to_date(input_path, output_path):
+    """True if the HTML exists and is newer than its source note."""
+    try:
+        return output_path.stat().st_mtime >= input_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def _convert_job(job):
+    """Worker: convert one note, returning (input_path, error or None, broken links, link keys used)."""
+    input_path, output_path, page_rel, stylesheet_href = job
+    used = {}
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        resolve = make_link_resolver(_link_index, page_rel, used) if _link_index is not None else None
+        broken = convert_file(input_path, output_path, stylesheet_href, resolve)
+        return input_path, None, broken, used
+    except Exception as e:
+        return input_path, str(e), [], None
+
+
+def convert_directory(input_dir, output_dir, jobs=None, force=False):
+    """Convert every note in a vault folder, mirroring its layout.
+    
+    Returns:
+        Number of notes that failed to convert
+    """
+    start = time.perf_counter()
+    notes = find_notes(input_dir)
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stylesheet_path = output_dir / STYLESHEET_NAME
+    if force or not stylesheet_path.exists() or stylesheet_path.read_text(encoding='utf-8') != STYLESHEET:
+        stylesheet_path.write_text(STYLESHEET, encoding='utf-8')
+    
+    # Links may resolve differently when notes are added, renamed or
+    # retitled, so an up-to-date page is still rebuilt when one of the link
+    # keys it was rendered with now resolves elsewhere (or at all)
+    index_path = output_dir / LINK_INDEX_NAME
+    links, index = build_link_index(input_dir, notes, index_path)
+    pages = index['pages']
+    
+    work = []
+    relinked = 0
+    for input_path in notes:
+        note_rel = input_path.relative_to(input_dir).as_posix()
+        page_rel = input_path.relative_to(input_dir).with_suffix('.html').as_posix()
+        output_path = output_dir / page_rel
+        if not force and is_up_to_date(input_path, output_path):
+            if links_unchanged(pages.get(note_rel), links):
+                continue
+            relinked += 1
+        href = os.path.relpath(stylesheet_path, output_path.parent).replace(os.sep, '/')
+        work.append((input_path, output_path, page_rel, href))
+    
+    skipped = len(notes) - len(work)
+    print(f"📚 {len(notes)} notes in '{input_dir}' ({skipped} up to date, {len(work)} to convert"
+          + (f", {relinked} for changed links" if relinked else "") + ")")
+    
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(work) > 1:
+        # Batches of notes per task keep inter-process overhead low
+        chunksize = max(1, len(work) // (jobs * 8))
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(work)),
+            initializer=_init_worker,
+            initargs=(links,)
+        ) as executor:
+            results = list(executor.map(_convert_job, work, chunksize=chunksize))
+    else:
+        _init_worker(links)
+        results = [_convert_job(job) for job in work]
+    
+    # Pages are written, so record what they link to; a failed page has no
+    # record and is retried next run
+    for input_path, error, _, used in results:
+        note_rel = input_path.relative_to(input_dir).as_posix()
+        if error:
+            pages.pop(note_rel, None)
+        else:
+            pages[note_rel] = used
+    save_link_index(index_path, index)
+    
+    failed = [input_path for input_path, error, _, _ in results if error]
+    for input_path, error, _, _ in results:
+        if error:
+            print(f"✗ {input_path}: {error}")
+    
+    broken = [(input_path, targets) for input_path, _, targets, _ in results if targets]
+    if broken:
+        total = sum(len(targets) for _, targets in broken)
+        print(f"⚠️  {total} broken links in {len(broken)} notes:")
+        for input_path, targets in broken[:20]:
+            print(f"   {input_path.relative_to(input_dir)}: " + ", ".join(f"[[{t}]]" for t in targets))
+        if len(broken) > 20:
+            print(f"   ... and {len(broken) - 20} more notes")
+    
+    elapsed = time.perf_counter() - start
+    print(f"✓ Converted {len(work) - len(failed)} notes to '{output_dir}' in {elapsed:.1f}s"
+          + (f" ({len(failed)} failed)" if failed else ""))
+    return len(failed)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Convert Obsidian markdown to rich HTML with preserved formatting'
     )
-    parser.add_argument('input', help='Input markdown file path')
-    parser.add_argument('-o', '--output', help='Output HTML file path')
+    parser.add_argument('input', help='Input markdown file or vault folder')
+    parser.add_argument('-o', '--output', help='Output HTML file (or folder, for a folder input)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Worker processes for folder input (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='Reconvert notes even if their HTML is up to date')
     
     args = parser.parse_args()
     
@@ -340,22 +679,19 @@ def main():
         print(f"Error: File '{input_path}' not found")
         return
     
+    if input_path.is_dir():
+        output_dir = Path(args.output) if args.output else input_path
+        if convert_directory(input_path, output_dir, jobs=args.jobs, force=args.force):
+            sys.exit(1)
+        return
+    
     # Determine output path
     if args.output:
         output_path = Path(args.output)
     else:
         output_path = input_path.with_suffix('.html')
     
-    # Read and process the markdown file
-    with open(input_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    frontmatter, body = parse_frontmatter(content)
-    html = generate_html(frontmatter, body, input_path.stem)
-    
-    # Write HTML output
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    convert_file(input_path, output_path)
     
     print(f"✓ Converted '{input_path}' to '{output_path}'")
 
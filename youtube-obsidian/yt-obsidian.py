@@ -20,8 +20,10 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
+# Only light modules are imported at startup so --help and argument errors
+# return immediately. yt-dlp, tenacity, requests, yaml and the Fabric
+# orchestrator (tiktoken) load on the code path that needs them; see
+# benchmarks/bench_startup.py.
 from lib.exceptions import (
     AgeRestrictedError,
     CommandNotFoundError,
@@ -32,11 +34,7 @@ from lib.exceptions import (
     VideoUnavailableError,
     YTObsidianError,
 )
-from lib.extractor import extract_metadata
-from lib.filesystem import save_markdown
-from lib.formatter import generate_frontmatter, generate_markdown
 from lib.validator import validate_url
-from lib.fabric_orchestrator import orchestrate_fabric_analysis
 
 
 def main() -> int:
@@ -44,6 +42,10 @@ def main() -> int:
     parser = create_parser()
     args = parser.parse_args()
 
+    from lib.extractor import extract_metadata
+    from lib.filesystem import save_markdown
+    from lib.formatter import generate_frontmatter, generate_markdown
+
     try:
         # Load configuration
         config = load_config()
@@ -61,7 +63,8 @@ def main() -> int:
             normalized_url, 
             args.cookies,
             extract_transcript=not args.no_transcript,
-            transcript_lang=args.transcript_lang
+            transcript_lang=args.transcript_lang,
+            sound_markers=(config.get("transcript") or {}).get("sound_markers")
         )
         
         metadata = result['metadata']
@@ -95,7 +98,8 @@ def main() -> int:
                 config=config,
                 debug=getattr(args, 'debug', False),
                 stream=getattr(args, 'stream', False),
-                model=getattr(args, 'model', None)
+                model=getattr(args, 'model', None),
+                resume=getattr(args, 'resume', False)
             )
 
         # Generate markdown
@@ -183,7 +187,11 @@ def load_config() -> dict:
         "chunking": {
             "max_chunk_tokens": 8000,
             "overlap_tokens": 200,
-            "save_chunks": True
+            "save_chunks": True,
+            "preamble_fraction": 0.15,
+            "adaptive_chunking": False,
+            "parallelism": 1,
+            "timings_log": ".fabric/timings.jsonl"
         },
         "output": {
             "use_slug_filenames": True,
@@ -194,6 +202,8 @@ def load_config() -> dict:
     
     # Load user configuration if exists
     if config_path.exists():
+        import yaml
+
         try:
             with open(config_path) as f:
                 user_config = yaml.safe_load(f)
@@ -242,7 +252,8 @@ def run_fabric_analysis(
     config: dict,
     debug: bool = False,
     stream: bool = False,
-    model: Optional[str] = None
+    model: Optional[str] = None,
+    resume: bool = False
 ) -> Optional[dict[str, str]]:
     """Run Fabric analysis and return combined outputs.
     
@@ -256,6 +267,7 @@ def run_fabric_analysis(
         debug: Enable debug mode
         stream: Enable streaming mode
         model: Optional LLM model override (e.g., "llama-4-scout")
+        resume: Reuse chunk checkpoints in .fabric/{video_id}/ from a failed run
     
     Returns:
         Dict of pattern_name -> combined_output, or None if failed
@@ -271,8 +283,11 @@ def run_fabric_analysis(
     if not join_pattern:
         join_pattern = None  # Normalize empty string to None
     
+    from lib.fabric_orchestrator import orchestrate_fabric_analysis
+
     # Setup .fabric/ directory
     fabric_dir = Path.cwd() / ".fabric" / video_id
+    timings_log = config["chunking"].get("timings_log", ".fabric/timings.jsonl")
     
     # Show model info if specified
     if model and debug:
@@ -288,10 +303,16 @@ def run_fabric_analysis(
             join_pattern=join_pattern,
             fabric_command=config["fabric"]["command"],
             max_chunk_tokens=config["chunking"]["max_chunk_tokens"],
+            preamble_fraction=config["chunking"].get("preamble_fraction"),
+            adaptive_chunking=config["chunking"].get("adaptive_chunking", False),
+            parallelism=config["chunking"].get("parallelism", 1),
+            timings_log=Path(timings_log) if timings_log else None,
+            phase1_combined=config.get("metadata", {}).get("combined", False),
             save_dir=fabric_dir if config["chunking"]["save_chunks"] else None,
             debug=debug,
             stream=stream,
-            model=model
+            model=model,
+            resume=resume
         )
         
         # Extract combined outputs
@@ -380,6 +401,12 @@ def create_parser() -> argparse.ArgumentParser:
         help="Enable streaming mode: see Fabric output in real-time as it generates",
     )
     
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume a failed run: reuse chunk outputs checkpointed in .fabric/<video_id>/",
+    )
+    
     parser.add_argument(
         "--model",
         "-m",